@@ -0,0 +1,141 @@
+import io
+import os
+import random
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+# Pomiar odczytu pól oferty w cdon_for_dawid: dawne osobne gettery (get_attr, get_main_image...,
+# każdy szuka swoich elementów od nowa) wobec jednego przejścia decode_offer.
+# Uruchomienie: python benchmarks/cdon_dekoder_ofert.py [liczba_ofert]
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import cdon_for_dawid as cdon
+
+
+def przygotuj_feed(liczba_ofert):
+    """Feed w formacie <offers><o>...</o></offers> z typowymi i nietypowymi ofertami."""
+    rng = random.Random(0)
+    czesci = ['<offers>']
+    for i in range(liczba_ofert):
+        atrybuty = ['<a name="Kolor">czarny</a>', f'<a name="EAN"> 590{i:09d} </a>']
+        if rng.random() < 0.7:
+            atrybuty.append('<a name="Producent">Firma</a>')
+        rng.shuffle(atrybuty)
+        obrazy = [f'<i url="https://img/{i}/{n}.jpg"/>' for n in range(rng.randint(0, 12))]
+        if rng.random() < 0.1:
+            obrazy.insert(0, '<i url=""/>')
+        czesci.append(
+            f'<o id="MARKA_{i}" price="{i % 1000}.99" stock="{i % 7}" weight="0.5">'
+            f'<cat><![CDATA[Dom / Kuchnia]]></cat><name><![CDATA[ Produkt {i} ]]></name>'
+            f'<desc><![CDATA[<p>Opis produktu {i}</p>]]></desc>'
+            f'<imgs><main url="https://img/{i}/main.jpg"/>{"".join(obrazy)}</imgs>'
+            f'<attrs>{"".join(atrybuty)}</attrs></o>')
+    czesci.append('</offers>')
+    return ''.join(czesci).encode('utf-8')
+
+
+# --- Gettery sprzed decode_offer (punkt odniesienia, dawny kod cdon_for_dawid) ---
+
+def get_attr(offer, attr_name, default=""):
+    """Gets a specific attribute value from an offer's 'attrs' section."""
+    attrs = offer.find('attrs')
+    if attrs is not None:
+        for a in attrs.findall('a'):
+            if a.get('name') == attr_name:
+                return (a.text or "").strip()
+    return default
+
+
+def get_category(offer):
+    """Gets the category text from an offer."""
+    cat = offer.find('cat')
+    return (cat.text or "").strip() if cat is not None else ""
+
+
+def get_name(offer):
+    """Gets the product name from an offer."""
+    name = offer.find('name')
+    return (name.text or "").strip() if name is not None else ""
+
+
+def get_desc(offer):
+    """Gets the product description from an offer."""
+    desc = offer.find('desc')
+    return (desc.text or "").strip() if desc is not None else ""
+
+
+def get_main_image(offer):
+    """Gets the main image URL from an offer."""
+    imgs = offer.find('imgs')
+    if imgs is not None:
+        main = imgs.find('main')
+        if main is not None:
+            return main.get('url', '')
+    return ""
+
+
+def get_extra_images(offer):
+    """Gets up to 9 extra image URLs from an offer."""
+    imgs = offer.find('imgs')
+    urls = []
+    if imgs is not None:
+        all_i = imgs.findall('i')
+        for i in all_i[:9]:  # max 9, as per original logic
+            url = i.get('url', '')
+            if url:
+                urls.append(url)
+    return ";".join(urls)
+
+
+def get_stock(offer):
+    """Gets the stock quantity from an offer."""
+    return offer.get('stock', "")
+
+
+def get_weight(offer):
+    """Gets the weight attribute from the offer tag."""
+    return offer.get('weight', "")
+
+
+def get_brand(offer):
+    """Determines the brand from attributes or product ID."""
+    return cdon.brand_from(get_attr(offer, "Producent"), offer.get('id', ''))
+
+
+def pola_getterami(oferta):
+    return (oferta.get('id', ''), get_weight(oferta), get_brand(oferta), get_attr(oferta, "EAN"),
+            get_stock(oferta), get_main_image(oferta), get_extra_images(oferta),
+            get_name(oferta), get_desc(oferta), get_category(oferta), cdon.get_price(oferta))
+
+
+def pola_dekoderem(oferta):
+    o = cdon.decode_offer(oferta)
+    return (o.sku, o.weight, o.brand, o.gtin, o.stock, o.main_image, o.extra_images,
+            o.name, o.desc, o.category, o.price)
+
+
+def zmierz(opis, funkcja, oferty, powtorzenia=3):
+    """Najlepszy czas z kilku przebiegów (pierwszy bywa zawyżony przez alokacje)."""
+    czas = None
+    for _ in range(powtorzenia):
+        start = time.perf_counter()
+        wyniki = [funkcja(oferta) for oferta in oferty]
+        biezacy = time.perf_counter() - start
+        czas = biezacy if czas is None else min(czas, biezacy)
+    print(f"{opis:<30} {czas:8.3f} s  ({len(oferty) / czas:,.0f} ofert/s)")
+    return wyniki, czas
+
+
+def main():
+    liczba_ofert = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    oferty = ET.parse(io.BytesIO(przygotuj_feed(liczba_ofert))).getroot().findall('o')
+    print(f"{len(oferty)} ofert")
+
+    gettery, czas_getterow = zmierz("gettery (get_*)", pola_getterami, oferty)
+    dekoder, czas_dekodera = zmierz("decode_offer", pola_dekoderem, oferty)
+    print(f"wyniki zgodne: {gettery == dekoder}, przyspieszenie: {czas_getterow / czas_dekodera:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+# Pomiar filtrowania feedu w giga_bol: dawne parsowanie całej odpowiedzi (ET.fromstring + findall('.//o'))
+# wobec strumieniowego OfferFilter karmionego fragmentami, tak jak podczas pobierania.
+# Uruchomienie: python benchmarks/giga_bol_filtr.py [liczba_ofert] [procent_pasujacych]
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from giga_bol import ROZMIAR_FRAGMENTU, OfferFilter
+
+
+def przygotuj_feed(liczba_ofert):
+    """Feed podobny do *_bol.xml: <offers><o id price stock> z opisem, obrazami i atrybutami."""
+    rng = random.Random(0)
+    czesci = ['<?xml version="1.0" encoding="utf-8"?><offers>']
+    for i in range(liczba_ofert):
+        obrazy = ''.join(f'<i url="https://img/{i}/{n}.jpg"/>' for n in range(rng.randint(1, 8)))
+        czesci.append(
+            f'<o id="{i}" price="{i % 1000}.99" stock="{i % 7}"><cat><![CDATA[Dom / Kuchnia]]></cat>'
+            f'<name><![CDATA[Produkt {i}]]></name><desc><![CDATA[<p>Opis produktu {i} {"lorem ipsum " * 30}</p>]]></desc>'
+            f'<imgs><main url="https://img/{i}/main.jpg"/>{obrazy}</imgs>'
+            f'<attrs><a name="Kolor">czarny</a><a name="Producent">Firma</a><a name="EAN">590-{i:09d}</a></attrs></o>')
+    czesci.append('</offers>')
+    return ''.join(czesci).encode('utf-8')
+
+
+def filtruj_dawne(dane, id_filter_set):
+    """Implementacja sprzed zmiany - punkt odniesienia."""
+    root = ET.fromstring(dane)
+    rows = []
+    for offer in root.findall('.//o'):
+        id_value = offer.attrib.get('id', '').strip()
+        if id_value in id_filter_set:
+            ean_element = None
+            for sub_element in offer.iter():
+                if 'name' in sub_element.attrib and sub_element.attrib['name'].lower() == 'ean':
+                    ean_element = sub_element
+                    break
+            ean_value = ean_element.text if ean_element is not None and ean_element.text is not None else ''
+            rows.append([id_value, offer.attrib.get('stock', '0'), re.sub(r'\D', '', ean_value),
+                         offer.attrib.get('price', '')])
+    return rows
+
+
+def filtruj_strumieniowo(dane, id_filter_set):
+    offer_filter = OfferFilter(id_filter_set)
+    rows = []
+    for poczatek in range(0, len(dane), ROZMIAR_FRAGMENTU):
+        rows.extend(offer_filter.feed(dane[poczatek:poczatek + ROZMIAR_FRAGMENTU]))
+    rows.extend(offer_filter.close())
+    return rows
+
+
+def zmierz(opis, funkcja, dane, id_filter_set):
+    """Czas mierzony osobno - tracemalloc spowalnia parsowanie."""
+    start = time.perf_counter()
+    wynik = funkcja(dane, id_filter_set)
+    czas = time.perf_counter() - start
+    tracemalloc.start()
+    funkcja(dane, id_filter_set)
+    szczyt = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{opis:<30} {czas:8.2f} s  szczyt pamięci {szczyt / 2**20:8.1f} MB")
+    return wynik, czas
+
+
+def main():
+    liczba_ofert = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    procent = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    dane = przygotuj_feed(liczba_ofert)
+    id_filter_set = {str(i) for i in random.Random(1).sample(range(liczba_ofert), int(liczba_ofert * procent / 100))}
+    print(f"{liczba_ofert} ofert ({len(dane) / 2**20:.0f} MB), {len(id_filter_set)} id w filtrze")
+
+    dawne, czas_dawny = zmierz("ET.fromstring + findall", filtruj_dawne, dane, id_filter_set)
+    nowe, czas_nowy = zmierz("OfferFilter (strumieniowo)", filtruj_strumieniowo, dane, id_filter_set)
+    print(f"wyniki zgodne: {dawne == nowe}, przyspieszenie: {czas_dawny / czas_nowy:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Pomiar uruchamiania skryptu z PythonRunnera: nowy interpreter dla każdego kliknięcia (QProcess
+# z `python skrypt.py`) wobec rezydentnego serwer_skryptow.py, który wykonuje skrypt w procesie
+# potomnym (fork) z już zaimportowanymi modułami wspólnymi. Mierzony jest czas do zakończenia skryptu.
+# Uruchomienie: python benchmarks/serwer_skryptow.py [liczba_uruchomien] [skrypt] [argumenty...]
+
+KATALOG_SKRYPTOW = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+SERWER = os.path.join(KATALOG_SKRYPTOW, 'serwer_skryptow.py')
+
+
+def uruchom_nowy_interpreter(skrypt, argumenty):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, skrypt, *argumenty], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def uruchom_przez_serwer(serwer, id_zadania, skrypt, argumenty):
+    start = time.perf_counter()
+    polecenie = {"polecenie": "uruchom", "id": id_zadania, "skrypt": skrypt, "argumenty": argumenty}
+    serwer.stdin.write(json.dumps(polecenie) + '\n')
+    serwer.stdin.flush()
+    while True:
+        zdarzenie = json.loads(serwer.stdout.readline())
+        if zdarzenie['zdarzenie'] in ('koniec', 'blad'):
+            return time.perf_counter() - start
+
+
+def main():
+    liczba = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    skrypt = os.path.abspath(sys.argv[2]) if len(sys.argv) > 2 else os.path.join(KATALOG_SKRYPTOW, 'poprawa_znak.py')
+    # Bez argumentów skrypt otworzyłby okno - domyślnie mierzony jest sam start (pomoc polecenia)
+    argumenty = sys.argv[3:] if len(sys.argv) > 3 else ['popraw', '--help']
+    if not sys.platform.startswith('linux'):
+        print("Serwer skryptów działa tylko na Linux (fork bez exec).")
+        return
+
+    czasy = [uruchom_nowy_interpreter(skrypt, argumenty) for _ in range(liczba)]
+    print(f"Nowy interpreter:  średnio {sum(czasy) / liczba * 1000:8.1f} ms na uruchomienie ({liczba} uruchomień)")
+
+    start = time.perf_counter()
+    serwer = subprocess.Popen([sys.executable, SERWER], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    serwer.stdout.readline()  # {"zdarzenie": "gotowy"}
+    print(f"Start serwera:     {(time.perf_counter() - start) * 1000:8.1f} ms (jednorazowo, przy starcie launchera)")
+    try:
+        czasy = [uruchom_przez_serwer(serwer, i, skrypt, argumenty) for i in range(liczba)]
+    finally:
+        serwer.stdin.close()
+        serwer.wait()
+    print(f"Serwer (fork):     średnio {sum(czasy) / liczba * 1000:8.1f} ms na uruchomienie")
+
+
+if __name__ == "__main__":
+    main()
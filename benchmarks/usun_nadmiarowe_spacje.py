@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Pomiar czyszczenia białych znaków przy łączeniu plików (laczenie_dowolne.polacz_pliki):
+# dawna wersja (astype(str) + strip + replace('nan') dla każdego pliku osobno, potem concat)
+# wobec obecnej (concat, potem jedno wektorowe czyszczenie).
+# Uruchomienie: python benchmarks/usun_nadmiarowe_spacje.py [liczba_wierszy] [liczba_plikow]
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from laczenie_dowolne import usun_nadmiarowe_spacje
+
+
+def usun_nadmiarowe_spacje_dawne(df):
+    """Implementacja sprzed wektoryzacji - punkt odniesienia."""
+    for col in df.columns:
+        if df[col].dtype == 'object':
+            df[col] = df[col].astype(str).str.strip().replace('nan', '')
+    return df
+
+
+def przygotuj_pliki(liczba_wierszy, liczba_plikow):
+    """Ramki danych podobne do wczytanych z Excela: teksty ze spacjami, liczby, puste komórki."""
+    rng = np.random.default_rng(0)
+    na_plik = liczba_wierszy // liczba_plikow
+    # Puste komórki read_excel zwraca jako NaN
+    kategorie = np.array([f"  Kategoria {i} " for i in range(200)] + [np.nan], dtype=object)
+    pliki = []
+    for _ in range(liczba_plikow):
+        nazwy = np.array([f" Produkt {i}" for i in rng.integers(0, 100000, na_plik)], dtype=object)
+        nazwy[rng.random(na_plik) < 0.05] = np.nan
+        # Kolumny tekstowe jako object - tak jak zwraca je read_excel w pandas < 3
+        pliki.append(pd.DataFrame({
+            0: pd.Series(kategorie[rng.integers(0, len(kategorie), na_plik)], dtype=object),
+            1: rng.integers(0, 10**9, na_plik),
+            2: pd.Series(nazwy, dtype=object),
+            3: np.round(rng.random(na_plik) * 1000, 2),
+            4: pd.Series(np.where(rng.random(na_plik) < 0.5, np.array(" tak ", dtype=object), np.nan), dtype=object),
+        }))
+    return pliki
+
+
+def zmierz(opis, funkcja):
+    start = time.perf_counter()
+    wynik = funkcja()
+    czas = time.perf_counter() - start
+    print(f"{opis:<45} {czas:8.3f} s")
+    return wynik, czas
+
+
+def main():
+    liczba_wierszy = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    liczba_plikow = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print(f"pandas {pd.__version__}, {liczba_wierszy} wierszy w {liczba_plikow} plikach")
+    pliki = przygotuj_pliki(liczba_wierszy, liczba_plikow)
+
+    dawne, czas_dawny = zmierz("dawne: czyszczenie każdego pliku + concat",
+                               lambda: pd.concat([usun_nadmiarowe_spacje_dawne(df.copy()) for df in pliki], ignore_index=True))
+    nowe, czas_nowy = zmierz("obecne: concat + jedno czyszczenie",
+                             lambda: usun_nadmiarowe_spacje(pd.concat([df.copy() for df in pliki], ignore_index=True)))
+
+    # Dla danych bez tekstu "nan" i bez liczb w kolumnach tekstowych wyniki muszą być takie same
+    # (pandas 3 zostawia w dawnej wersji braki jako NA, dlatego porównujemy po wypełnieniu)
+    zgodne = all(dawne[k].fillna('').astype(str).equals(nowe[k].fillna('').astype(str)) for k in dawne.columns)
+    print(f"wyniki zgodne: {zgodne}, przyspieszenie: {czas_dawny / czas_nowy:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
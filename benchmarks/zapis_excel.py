@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import openpyxl
+
+# Pomiar zapisu eksportu do Excela: zwykły openpyxl.Workbook() (wszystkie komórki w pamięci
+# do chwili save) wobec ZapisExcel (write-only, opcjonalnie xlsxwriter constant_memory).
+# Uruchomienie: python benchmarks/zapis_excel.py [liczba_wierszy]
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import zapis_excel
+from zapis_excel import ZapisExcel
+
+POLA = ["sku", "brand", "gtin", "stock", "mainImage", "title", "description", "category", "price", "vat"]
+
+
+def wiersze(liczba_wierszy):
+    """Wiersze podobne do eksportu cdon_for_dawid (teksty, adresy obrazów, liczby)."""
+    for i in range(liczba_wierszy):
+        yield (f"MARKA_{i}", "Firma", f"590{i:09d}", str(i % 7), f"https://img/{i}/main.jpg",
+               f"Produkt {i}", f"<p>Opis produktu {i} " + "lorem ipsum " * 20 + "</p>",
+               "Dom / Kuchnia", f"{i % 1000}.99", 25)
+
+
+def zapis_workbook(sciezka, liczba_wierszy):
+    """Dawny sposób zapisu - punkt odniesienia."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Dane"
+    ws.append(POLA)
+    for wiersz in wiersze(liczba_wierszy):
+        ws.append(wiersz)
+    wb.save(sciezka)
+
+
+def zapis_strumieniowy(stala_pamiec):
+    def zapis(sciezka, liczba_wierszy):
+        with ZapisExcel(sciezka, POLA, "Dane", stala_pamiec=stala_pamiec) as arkusz:
+            arkusz.writerows(wiersze(liczba_wierszy))
+    return zapis
+
+
+def zmierz(opis, funkcja, sciezka, liczba_wierszy):
+    """Czas mierzony osobno - tracemalloc wielokrotnie spowalnia openpyxl."""
+    start = time.perf_counter()
+    funkcja(sciezka, liczba_wierszy)
+    czas = time.perf_counter() - start
+    tracemalloc.start()
+    funkcja(sciezka, liczba_wierszy)
+    szczyt = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{opis:<40} {czas:8.2f} s  szczyt pamięci {szczyt / 2**20:8.1f} MB")
+
+
+def main():
+    liczba_wierszy = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{liczba_wierszy} wierszy")
+    with tempfile.TemporaryDirectory() as katalog:
+        zmierz("openpyxl.Workbook()", zapis_workbook, os.path.join(katalog, 'a.xlsx'), liczba_wierszy)
+        zmierz("ZapisExcel (openpyxl write-only)", zapis_strumieniowy(False), os.path.join(katalog, 'b.xlsx'), liczba_wierszy)
+        if zapis_excel.xlsxwriter is not None:
+            zmierz("ZapisExcel (xlsxwriter constant_memory)", zapis_strumieniowy(True),
+                   os.path.join(katalog, 'c.xlsx'), liczba_wierszy)
+        else:
+            print("xlsxwriter nie jest zainstalowany - pomijam tryb stałej pamięci")
+
+
+if __name__ == '__main__':
+    main()
@@ -39,6 +39,12 @@
 #include <QMenu>
 #include <QInputDialog>
 
+// Rezydentny proces Pythona (scripts/serwer_skryptow.py): moduły wspólne są importowane raz,
+// a skrypty są uruchamiane w procesach potomnych (fork) - kolejne uruchomienia trwają milisekundy.
+// Tylko Linux: na Windows nie ma fork, a na macOS fork bez exec nie jest bezpieczny (Tk/Cocoa,
+// SystemConfiguration przy wyszukiwaniu proxy w requests) - tam każdy skrypt dostaje nowy interpreter jak dotąd.
+static const char *WORKER_SCRIPT_NAME = "serwer_skryptow.py";
+
 // Definicja struktury przechowującej informacje o skrypcie
 struct ScriptEntry {
     QString name;
@@ -86,6 +92,7 @@ public:
 protected:
     void closeEvent(QCloseEvent *event) override {
         saveConfiguration();
+        stopWorker();
         QMainWindow::closeEvent(event);
     }
 
@@ -138,6 +145,18 @@ private slots:
             m_outputView->append(QString("--- Uruchamianie: %1 ---\n").arg(scriptPath));
             m_outputView->append(QString("--- Interpreter: %1 ---\n").arg(m_pythonInterpreterPath));
 
+            if (isWorkerUsable()) {
+                QJsonObject request;
+                request["polecenie"] = "uruchom";
+                request["id"] = ++m_workerJobId;
+                request["skrypt"] = scriptPath;
+                sendWorkerRequest(request);
+                m_workerJobRunning = true;
+                m_runButton->setEnabled(false);
+                m_stopButton->setEnabled(true);
+                return;
+            }
+
             m_process->start(m_pythonInterpreterPath, {scriptPath});
 
             if (!m_process->waitForStarted()) {
@@ -150,7 +169,13 @@ private slots:
     }
 
     void stopScript() {
-        if (m_process->state() == QProcess::Running) {
+        if (m_workerJobRunning) {
+            QJsonObject request;
+            request["polecenie"] = "zatrzymaj";
+            request["id"] = m_workerJobId;
+            sendWorkerRequest(request);
+            m_outputView->append("\n--- Proces został zatrzymany przez użytkownika. ---");
+        } else if (m_process->state() == QProcess::Running) {
             m_process->kill();
             m_outputView->append("\n--- Proces został zatrzymany przez użytkownika. ---");
         }
@@ -166,9 +191,29 @@ private slots:
         m_stopButton->setEnabled(false);
     }
 
+    void readWorkerOutput() {
+        m_workerBuffer += m_worker->readAllStandardOutput();
+        int newline;
+        while ((newline = m_workerBuffer.indexOf('\n')) != -1) {
+            QJsonObject event = QJsonDocument::fromJson(m_workerBuffer.left(newline)).object();
+            m_workerBuffer.remove(0, newline + 1);
+            handleWorkerEvent(event);
+        }
+    }
+
+    void readWorkerError() { m_outputView->append(m_worker->readAllStandardError()); }
+
+    void onWorkerFinished() {
+        m_workerReady = false;
+        if (m_workerJobRunning) {
+            m_outputView->append("\n--- BŁĄD: Proces roboczy Pythona zakończył się nieoczekiwanie. ---");
+            onWorkerJobFinished(-1);
+        }
+    }
+
     void updateButtonStates() {
         bool hasSelection = m_currentSelectedIndex != -1;
-        m_runButton->setEnabled(hasSelection && m_process->state() == QProcess::NotRunning);
+        m_runButton->setEnabled(hasSelection && !isScriptRunning());
         m_removeButton->setEnabled(hasSelection);
     }
 
@@ -182,6 +227,7 @@ private slots:
         if (!newPath.isEmpty()) {
             m_pythonInterpreterPath = newPath;
             updatePythonPathLabel();
+            if (!m_workerJobRunning) startWorker();
         }
     }
 
@@ -339,7 +385,7 @@ private:
                     m_scriptButtons[i]->setProperty("selected", true);
                     style()->unpolish(m_scriptButtons[i]); style()->polish(m_scriptButtons[i]);
                 }
-                if (m_process->state() == QProcess::NotRunning) runScript();
+                if (!isScriptRunning()) runScript();
             });
             m_scriptGridLayout->addWidget(button, i / m_columnCount, i % m_columnCount);
             m_scriptButtons.append(button);
@@ -406,17 +452,18 @@ private:
         }
     }
 
-    void scanForInitialScripts() {
-        QString scriptsPath;
+    QString scriptsDirectoryPath() {
 #ifdef Q_OS_MAC
         // Na macOS, zasoby są w innym miejscu względem pliku .exe
-        scriptsPath = QApplication::applicationDirPath() + "/../Resources/scripts";
+        return QApplication::applicationDirPath() + "/../Resources/scripts";
 #else
         // Ścieżka dla Windows
-        scriptsPath = QApplication::applicationDirPath() + "/scripts";
+        return QApplication::applicationDirPath() + "/scripts";
 #endif
+    }
 
-        QDir scriptsDir(scriptsPath);
+    void scanForInitialScripts() {
+        QDir scriptsDir(scriptsDirectoryPath());
         if (!scriptsDir.exists()) return;
 
         QStringList nameFilters;
@@ -424,6 +471,7 @@ private:
         QFileInfoList scriptFiles = scriptsDir.entryInfoList(nameFilters, QDir::Files);
 
         for (const QFileInfo& fileInfo : scriptFiles) {
+            if (fileInfo.fileName() == WORKER_SCRIPT_NAME) continue; // proces roboczy nie jest skryptem do uruchamiania
             m_scripts.append({fileInfo.fileName(), fileInfo.absoluteFilePath()});
         }
     }
@@ -468,6 +516,70 @@ private:
 
         updatePythonPathLabel();
         repopulateScriptGrid();
+        startWorker();
+    }
+
+    bool isScriptRunning() const {
+        return m_workerJobRunning || m_process->state() != QProcess::NotRunning;
+    }
+
+    bool isWorkerUsable() const {
+        // Zanim serwer zaimportuje moduły (albo po zmianie interpretera) skrypt startuje jak dotąd
+        return m_worker && m_workerReady && m_workerInterpreterPath == m_pythonInterpreterPath;
+    }
+
+    void startWorker() {
+        stopWorker();
+#ifdef Q_OS_LINUX
+        QString workerPath = scriptsDirectoryPath() + "/" + WORKER_SCRIPT_NAME;
+        if (m_pythonInterpreterPath.isEmpty() || !QFile::exists(m_pythonInterpreterPath) || !QFile::exists(workerPath)) return;
+
+        m_worker = new QProcess(this);
+        connect(m_worker, &QProcess::readyReadStandardOutput, this, &MainWindow::readWorkerOutput);
+        connect(m_worker, &QProcess::readyReadStandardError, this, &MainWindow::readWorkerError);
+        connect(m_worker, &QProcess::finished, this, &MainWindow::onWorkerFinished);
+        m_workerInterpreterPath = m_pythonInterpreterPath;
+        m_worker->start(m_pythonInterpreterPath, {workerPath});
+#endif
+    }
+
+    void stopWorker() {
+        if (!m_worker) return;
+        disconnect(m_worker, nullptr, this, nullptr);
+        // Zamknięcie stdin kończy serwer razem z uruchomionymi przez niego skryptami
+        m_worker->closeWriteChannel();
+        if (!m_worker->waitForFinished(1000)) m_worker->kill();
+        m_worker->deleteLater();
+        m_worker = nullptr;
+        m_workerReady = false;
+        m_workerBuffer.clear();
+    }
+
+    void sendWorkerRequest(const QJsonObject &request) {
+        m_worker->write(QJsonDocument(request).toJson(QJsonDocument::Compact) + "\n");
+    }
+
+    void handleWorkerEvent(const QJsonObject &event) {
+        const QString type = event.value("zdarzenie").toString();
+        if (type == "gotowy") {
+            m_workerReady = true;
+            return;
+        }
+        if (!m_workerJobRunning || event.value("id").toInt() != m_workerJobId) return;
+        if (type == "stdout" || type == "stderr") {
+            m_outputView->append(event.value("tekst").toString());
+        } else if (type == "koniec") {
+            onWorkerJobFinished(event.value("kod").toInt());
+        } else if (type == "blad") {
+            m_outputView->append(QString("\n--- BŁĄD: %1 ---").arg(event.value("tekst").toString()));
+            onWorkerJobFinished(-1);
+        }
+    }
+
+    void onWorkerJobFinished(int exitCode) {
+        m_workerJobRunning = false;
+        // Ujemny kod: proces zabity sygnałem (np. po "Zatrzymaj") - jak QProcess::CrashExit
+        onProcessFinished(exitCode, exitCode < 0 ? QProcess::CrashExit : QProcess::NormalExit);
     }
 
     // Elementy interfejsu i logiki
@@ -482,6 +594,12 @@ private:
     int m_currentSelectedIndex = -1;
     int m_contextMenuScriptIndex = -1;
     QProcess *m_process;
+    QProcess *m_worker = nullptr;
+    QString m_workerInterpreterPath;
+    QByteArray m_workerBuffer;
+    bool m_workerReady = false;
+    bool m_workerJobRunning = false;
+    int m_workerJobId = 0;
     int m_columnCount = 4;
     QTimer *m_resizeTimer;
 };
@@ -1,13 +1,13 @@
 import xml.etree.ElementTree as ET
-import csv
 import os
-import urllib.request
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from datetime import datetime
-from urllib.parse import urlparse
 import tempfile
 import time
+from pobieranie_feedow import pobierz_wiele, nazwa_pliku_z_url, opis_postepu
+from zapis_tabel import ROZSZERZENIE_CSV, ROZSZERZENIE_PARQUET, otworz_zapis_tabeli
+from parser_ofert import iteruj_oferty, zbuduj_projekcje
 
 # Ustawienia CustomTkinter
 ctk.set_appearance_mode("System")
@@ -17,82 +17,17 @@ ctk.set_default_color_theme("blue")
 DOMYSLNA_SCIEZKA_ZAPISU = os.path.join(os.path.expanduser("~"), "Downloads")
 # ----------------------------------------------------
 
-def clean_text(text):
-    """Zastępuje znaki nowej linii i inne białe znaki pojedynczą spacją."""
-    if not text:
-        return ""
-    # Rozdziela tekst po białych znakach (spacje, tabulatory, entery),
-    # łączy je z powrotem pojedynczą spacją i usuwa wiodące/końcowe białe znaki.
-    return " ".join(text.split())
-
-def pobierz_xml(url, sciezka_docelowa):
-    """Pobiera plik XML z podanego URL."""
-    try:
-        # Użycie nagłówka User-Agent, aby uniknąć blokowania przez niektóre serwery
-        opener = urllib.request.build_opener()
-        opener.addheaders = [('User-agent', 'Mozilla/5.0')]
-        urllib.request.install_opener(opener)
-        urllib.request.urlretrieve(url, sciezka_docelowa)
-        return True
-    except Exception as e:
-        messagebox.showerror(f"Błąd pobierania ({url})", f"Wystąpił błąd: {e}")
-        return False
+# Stałe kolumny pliku wynikowego
+POLA_CSV = ['id', 'weight', 'cat', 'name', 'desc', 'id_bl', 'sku_bl', 'EAN', 'Kod_producenta', 'image0', 'image1']
+ATRYBUTY_CSV = {'id', 'weight', 'cat', 'name', 'desc', 'id_bl', 'sku_bl', 'EAN', 'Kod_producenta'}
+PROJEKCJA_CSV = zbuduj_projekcje(POLA_CSV)
 
 def parsuj_xml(sciezka_pliku):
     """Parsuje plik XML i ekstrahuje dane, usuwając znaki nowej linii z pól tekstowych."""
     try:
-        drzewo = ET.parse(sciezka_pliku)
-        root = drzewo.getroot()
-        dane = []
-
-        for element in root.findall("o"):
-            cat_elem = element.find("cat")
-            name_elem = element.find("name")
-            desc_elem = element.find("desc")
-
-            # Utworzenie wiersza danych z zastosowaniem funkcji clean_text
-            wiersz = {
-                "id": element.get("id"),
-                "url": element.get("url"),
-                "price": element.get("price"),
-                "avail": element.get("avail"),
-                "weight": element.get("weight"),
-                "stock": element.get("stock"),
-                "cat": clean_text(cat_elem.text) if cat_elem is not None else "",
-                "name": clean_text(name_elem.text) if name_elem is not None else "",
-                "desc": clean_text(desc_elem.text) if desc_elem is not None else ""
-            }
-            
-            # Przetwarzanie atrybutów z czyszczeniem ich wartości
-            atrybuty_elem = element.find("attrs")
-            if atrybuty_elem is not None:
-                for atrybut in atrybuty_elem.findall("a"):
-                    nazwa_atrybutu = atrybut.get("name")
-                    if nazwa_atrybutu:
-                        wiersz[nazwa_atrybutu] = clean_text(atrybut.text)
-
-            # Przetwarzanie obrazów
-            obrazy_elem = element.find("imgs")
-            if obrazy_elem is not None:
-                main_image = obrazy_elem.find("main")
-                if main_image is not None and main_image.get("url"):
-                    wiersz["image0"] = main_image.get("url")
-                
-                start_index = 1 if "image0" in wiersz else 0
-                
-                # Ograniczenie do pobierania tylko image1 (jeśli image0 istnieje)
-                # lub image0 i image1 (jeśli main image nie istnieje)
-                other_images = obrazy_elem.findall("i")
-                for i, img in enumerate(other_images, start=start_index):
-                    if i >= 2: # Zbieramy tylko image0 i image1
-                        break
-                    if img.get("url"):
-                        wiersz[f"image{i}"] = img.get("url")
-            
-            dane.append(wiersz)
-            
-        # Zwracamy tylko dane, reszta nie jest potrzebna w nowej logice zapisu
-        return dane
+        # Zachowujemy tylko atrybuty z kolumn wynikowych (także te nadpisujące pola podstawowe)
+        # i od razu rzutujemy ofertę na krotkę w kolejności POLA_CSV
+        return [PROJEKCJA_CSV(oferta) for oferta in iteruj_oferty(sciezka_pliku, ATRYBUTY_CSV)]
         
     except FileNotFoundError:
         messagebox.showerror("Błąd pliku", f"Nie znaleziono pliku: {sciezka_pliku}")
@@ -105,24 +40,19 @@ def parsuj_xml(sciezka_pliku):
         return []
 
 def zapisz_do_csv(dane, sciezka_pliku):
-    """Zapisuje dane do pliku CSV z predefiniowanymi kolumnami."""
-    # Definiujemy na stałe, które kolumny mają się znaleźć w pliku wynikowym
-    pola = ['id', 'weight', 'cat', 'name', 'desc', 'id_bl', 'sku_bl', 'EAN', 'Kod_producenta', 'image0', 'image1']
-
+    """Zapisuje dane do pliku CSV z predefiniowanymi kolumnami (POLA_CSV)."""
     try:
-        with open(sciezka_pliku, 'w', encoding='utf-8-sig', newline='') as plik_csv:
-            # Użycie separatora, extrasaction='ignore' pomija nadmiarowe dane w słowniku
-            writer = csv.DictWriter(plik_csv, fieldnames=pola, delimiter='|', extrasaction='ignore')
-            writer.writeheader()
+        with otworz_zapis_tabeli(sciezka_pliku, POLA_CSV, '|', ['cat']) as writer:
             writer.writerows(dane)
         return True
     except Exception as e:
         messagebox.showerror(f"Błąd zapisu CSV ({os.path.basename(sciezka_pliku)})", f"Wystąpił błąd: {e}")
         return False
 
-def przetworz_wiele_url_osobne_pliki(urls, sciezka_zapisu_csv, app_instance):
+def przetworz_wiele_url_osobne_pliki(urls, sciezka_zapisu_csv, app_instance, rozszerzenie=ROZSZERZENIE_CSV):
     """Przetwarza wiele URL-i i zapisuje każdy do osobnego pliku CSV."""
     katalog_tymczasowy = tempfile.gettempdir()
+    urls = [url.strip() for url in urls if url.strip()]
     liczba_url = len(urls)
     sukcesy = 0
     bledy_pobierania = 0
@@ -142,44 +72,44 @@ def przetworz_wiele_url_osobne_pliki(urls, sciezka_zapisu_csv, app_instance):
             app_instance.pole_sciezki_zapisu.delete(0, ctk.END)
             app_instance.pole_sciezki_zapisu.insert(0, sciezka_zapisu_csv)
 
-    for i, url in enumerate(urls):
-        url = url.strip()
-        if not url:
+    def pokaz_postep_pobierania(pobrane_bajty, ukonczone, wszystkie):
+        app_instance.update_status(opis_postepu(pobrane_bajty, ukonczone, wszystkie), ukonczone / wszystkie)
+
+    # Pobieranie odbywa się równolegle; każdy feed jest przetwarzany zaraz po pobraniu
+    for ukonczone, (i, url, sciezka_lokalna_xml, blad) in enumerate(
+            pobierz_wiele(urls, katalog_tymczasowy, pokaz_postep_pobierania), start=1):
+        postep = ukonczone / liczba_url
+        nazwa_pliku_url = nazwa_pliku_z_url(url, i + 1)
+        nazwa_bazowa_xml = os.path.splitext(nazwa_pliku_url)[0]
+
+        if blad is not None:
+            messagebox.showerror(f"Błąd pobierania ({url})", f"Wystąpił błąd: {blad}")
+            bledy_pobierania += 1
+            app_instance.update_status(f"Błąd pobierania {nazwa_pliku_url}. Pomijanie.", postep)
+            time.sleep(0.5)
             continue
 
-        postep = (i + 1) / liczba_url
-        nazwa_pliku_url = os.path.basename(urlparse(url).path) or f"feed_{i+1}.xml"
-        app_instance.update_status(f"Przetwarzanie {i+1}/{liczba_url}: {nazwa_pliku_url}...", postep)
+        app_instance.update_status(f"Przetwarzanie {ukonczone}/{liczba_url}: {nazwa_pliku_url}...", postep)
+        dane = parsuj_xml(sciezka_lokalna_xml)
+        if dane:
+            teraz_format_czasu_csv = datetime.now().strftime("%d%m%y-%H%M%S")
+            nazwa_pliku_csv = os.path.join(sciezka_zapisu_csv, f"{nazwa_bazowa_xml}_{teraz_format_czasu_csv}{rozszerzenie}")
 
-        nazwa_bazowa_xml = os.path.splitext(nazwa_pliku_url)[0]
-        teraz_timestamp_temp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        sciezka_lokalna_xml = os.path.join(katalog_tymczasowy, f"temp_{nazwa_bazowa_xml}_{teraz_timestamp_temp}.xml")
-
-        if pobierz_xml(url, sciezka_lokalna_xml):
-            dane = parsuj_xml(sciezka_lokalna_xml)
-            if dane:
-                teraz_format_czasu_csv = datetime.now().strftime("%d%m%y-%H%M%S")
-                nazwa_pliku_csv = os.path.join(sciezka_zapisu_csv, f"{nazwa_bazowa_xml}_{teraz_format_czasu_csv}.csv")
-                
-                app_instance.update_status(f"Zapisywanie: {os.path.basename(nazwa_pliku_csv)}...", postep)
-                if zapisz_do_csv(dane, nazwa_pliku_csv):
-                    sukcesy += 1
-                else:
-                    bledy_zapisu += 1
+            app_instance.update_status(f"Zapisywanie: {os.path.basename(nazwa_pliku_csv)}...", postep)
+            if zapisz_do_csv(dane, nazwa_pliku_csv):
+                sukcesy += 1
             else:
-                bledy_parsowania += 1
-                app_instance.update_status(f"Błąd parsowania {nazwa_pliku_url}. Pomijanie.", postep)
-                time.sleep(0.5)
-            
-            try:
-                os.remove(sciezka_lokalna_xml)
-            except Exception as e:
-                print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {sciezka_lokalna_xml}: {e}")
+                bledy_zapisu += 1
         else:
-            bledy_pobierania += 1
-            app_instance.update_status(f"Błąd pobierania {nazwa_pliku_url}. Pomijanie.", postep)
+            bledy_parsowania += 1
+            app_instance.update_status(f"Błąd parsowania {nazwa_pliku_url}. Pomijanie.", postep)
             time.sleep(0.5)
 
+        try:
+            os.remove(sciezka_lokalna_xml)
+        except Exception as e:
+            print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {sciezka_lokalna_xml}: {e}")
+
     if sukcesy > 0:
         messagebox.showinfo("Zakończono przetwarzanie", f"Pomyślnie przetworzono i zapisano {sukcesy} z {liczba_url} plików w:\n{os.path.abspath(sciezka_zapisu_csv)}\n\n"
                                                       f"Błędy pobierania: {bledy_pobierania}\n"
@@ -241,6 +171,11 @@ class App(ctk.CTk):
         przycisk_wybierz_sciezke = ctk.CTkButton(input_frame_path, text="Wybierz folder", width=120, command=self.wybierz_katalog_zapisu)
         przycisk_wybierz_sciezke.grid(row=0, column=2, padx=(0,10), pady=5, sticky="e")
 
+        # Parquet: mniejszy plik i szybszy odczyt w csvtoexcel / mapowanie / csv_to_excel_sheets
+        self.zapis_parquet = ctk.BooleanVar(value=False)
+        pole_parquet = ctk.CTkCheckBox(input_frame_path, text="Zapisz jako Parquet zamiast CSV", variable=self.zapis_parquet)
+        pole_parquet.grid(row=1, column=0, columnspan=3, padx=10, pady=(0,5), sticky="w")
+
         self.przycisk_przetworz = ctk.CTkButton(self, text="Przetwórz na pliki CSV", command=self.rozpocznij_przetwarzanie_action, height=40)
         self.przycisk_przetworz.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
 
@@ -287,7 +222,8 @@ class App(ctk.CTk):
         self.przycisk_przetworz.configure(state="disabled", text="Przetwarzanie...")
         self.update_idletasks()
         
-        przetworz_wiele_url_osobne_pliki(urls, sciezka_zapisu_csv_gui, self)
+        przetworz_wiele_url_osobne_pliki(urls, sciezka_zapisu_csv_gui, self,
+                                         ROZSZERZENIE_PARQUET if self.zapis_parquet.get() else ROZSZERZENIE_CSV)
 
 if __name__ == "__main__":
     app = App()
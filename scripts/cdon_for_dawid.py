@@ -1,83 +1,56 @@
 import xml.etree.ElementTree as ET
-import openpyxl
 import sys
 import re
-import requests
-import customtkinter as ctk
-from tkinter import filedialog, messagebox
 import os
+import shutil
+import tempfile
+from pobieranie_feedow import pobierz_do_pliku, nazwa_pliku_z_url
+from parser_ofert import iteruj_elementy_o
+from zapis_excel import ZapisExcel
+from postep import RaportPostepu
+# messagebox-compatible messages; the window (customtkinter) lives in cdon_for_dawid_okno and is only imported for the GUI
+from konsola import StatusKonsoli, messagebox, utworz_parser, uruchom
+
+FEED_BASE_URL = "https://sm-prods.com/feeds/"
 
 # --- Core XML Processing and Excel Generation Functions ---
 
-def download_xml(url):
-    """Downloads and parses an XML file from a URL."""
+def download_feed(url, folder):
+    """
+    Downloads an XML feed through the on-disk feed cache and returns this run's own copy in folder
+    (a hard link where possible), which stays readable even if the cache entry is evicted meanwhile.
+    """
+    path = os.path.join(folder, nazwa_pliku_z_url(url, 1))
     try:
-        response = requests.get(url, timeout=20) # Increased timeout for larger files
-        response.raise_for_status()
-        root = ET.fromstring(response.content)
-        return root
-    except requests.exceptions.RequestException as e:
+        # Conditional request: an unchanged feed (HTTP 304) is read from the cache
+        pobierz_do_pliku(url, path, timeout=20) # Increased timeout for larger files
+        return path
+    except OSError as e:
         raise ConnectionError(f"Błąd podczas pobierania pliku z URL {url}: {e}")
-    except ET.ParseError as e:
-        raise ValueError(f"Błąd podczas parsowania XML z URL {url}: {e}")
     except Exception as e:
         raise Exception(f"Nieoczekiwany błąd podczas przetwarzania URL {url}: {e}")
 
-def build_products_dict(root):
-    """Builds a dictionary of products from the XML root for quick lookup."""
-    products = {}
-    if root is None:
-        return products
-    for offer in root.findall('o'):
+def iter_feed_offers(feed_path, url):
+    """
+    Streams the <o> offers of a downloaded feed (gzip/zstd feeds are decompressed on the fly).
+    Each offer element is complete when yielded and is freed once the caller moves on.
+    """
+    try:
+        yield from iteruj_elementy_o(feed_path)
+    except ET.ParseError as e:
+        raise ValueError(f"Błąd podczas parsowania XML z URL {url}: {e}")
+
+def build_price_index(feed_path, url):
+    """
+    Builds a compact id -> price index (strings only) from a feed, without keeping the tree.
+    As with a dict of offers, a later duplicate id overrides an earlier one.
+    """
+    prices = {}
+    for offer in iter_feed_offers(feed_path, url):
         product_id = offer.get('id')
         if product_id:
-            products[product_id] = offer
-    return products
-
-def get_attr(offer, attr_name, default=""):
-    """Gets a specific attribute value from an offer's 'attrs' section."""
-    attrs = offer.find('attrs')
-    if attrs is not None:
-        for a in attrs.findall('a'):
-            if a.get('name') == attr_name:
-                return (a.text or "").strip()
-    return default
-
-def get_category(offer):
-    """Gets the category text from an offer."""
-    cat = offer.find('cat')
-    return (cat.text or "").strip() if cat is not None else ""
-
-def get_name(offer):
-    """Gets the product name from an offer."""
-    name = offer.find('name')
-    return (name.text or "").strip() if name is not None else ""
-
-def get_desc(offer):
-    """Gets the product description from an offer."""
-    desc = offer.find('desc')
-    return (desc.text or "").strip() if desc is not None else ""
-
-def get_main_image(offer):
-    """Gets the main image URL from an offer."""
-    imgs = offer.find('imgs')
-    if imgs is not None:
-        main = imgs.find('main')
-        if main is not None:
-            return main.get('url', '')
-    return ""
-
-def get_extra_images(offer):
-    """Gets up to 9 extra image URLs from an offer."""
-    imgs = offer.find('imgs')
-    urls = []
-    if imgs is not None:
-        all_i = imgs.findall('i')
-        for i in all_i[:9]:  # max 9, as per original logic
-            url = i.get('url', '')
-            if url:
-                urls.append(url)
-    return ";".join(urls)
+            prices[product_id] = get_price(offer)
+    return prices
 
 def short(text, length):
     """Truncates text to a specified length."""
@@ -87,15 +60,6 @@ def get_price(offer):
     """Gets the price from an offer."""
     return offer.get('price', "")
 
-def get_stock(offer):
-    """Gets the stock quantity from an offer."""
-    return offer.get('stock', "")
-
-# NEW FUNCTION: Get weight directly from the offer tag
-def get_weight(offer):
-    """Gets the weight attribute from the offer tag."""
-    return offer.get('weight', "")
-
 def strip_html_tags(text):
     """Removes HTML tags from a string."""
     if not isinstance(text, str):
@@ -103,37 +67,96 @@ def strip_html_tags(text):
     clean = re.compile('<.*?>')
     return re.sub(clean, '', text)
 
-def get_brand(offer):
-    """Determines the brand from attributes or product ID."""
-    producent = get_attr(offer, "Producent")
+def brand_from(producent, prod_id):
+    """Brand is the 'Producent' attribute or, without it, the product ID prefix before '_'."""
     if producent:
         return producent.strip()
-    prod_id = offer.get('id', '')
     if '_' in prod_id:
         return prod_id.split('_')[0]
     return prod_id
 
+class DecodedOffer:
+    """Every field a CDON row needs from one offer, read in a single pass over its children."""
+    __slots__ = ('sku', 'weight', 'stock', 'price', 'gtin', 'brand', 'main_image', 'extra_images',
+                 'name', 'desc', 'category')
+
+def decode_offer(offer):
+    """
+    Reads every field in one pass: each child container (attrs, imgs) is looked up once per
+    offer and scanned once for all the fields it holds, instead of once per field.
+    """
+    decoded = DecodedOffer()
+    attrib = offer.attrib
+    decoded.sku = attrib.get('id', '')
+    decoded.weight = attrib.get('weight', "")
+    decoded.stock = attrib.get('stock', "")
+    decoded.price = attrib.get('price', "")
+    decoded.name = offer.findtext('name', "").strip()
+    decoded.desc = offer.findtext('desc', "").strip()
+    decoded.category = offer.findtext('cat', "").strip()
+
+    # One pass over attrs/a for both EAN and Producent (the first match of each wins)
+    gtin = producent = None
+    attrs = offer.find('attrs')
+    if attrs is not None:
+        for a in attrs:
+            if a.tag != 'a':
+                continue
+            attr_name = a.get('name')
+            if attr_name == "EAN":
+                if gtin is None:
+                    gtin = (a.text or "").strip()
+                    if producent is not None:
+                        break
+            elif attr_name == "Producent":
+                if producent is None:
+                    producent = (a.text or "").strip()
+                    if gtin is not None:
+                        break
+    decoded.gtin = gtin or ""
+    decoded.brand = brand_from(producent, decoded.sku)
+
+    # One pass over imgs for the main image and the extra images
+    main_image = None
+    urls = []
+    imgs = offer.find('imgs')
+    if imgs is not None:
+        extra_count = 0
+        for img in imgs:
+            tag = img.tag
+            if tag == 'i':
+                if extra_count < 9:  # max 9, as per original logic
+                    extra_count += 1
+                    url = img.get('url', '')
+                    if url:
+                        urls.append(url)
+            elif tag == 'main' and main_image is None:
+                main_image = img.get('url', '')
+    decoded.main_image = main_image or ""
+    decoded.extra_images = ";".join(urls)
+    return decoded
+
+def feed_urls(prefix):
+    """Returns the SE, DK and FI feed URLs for a supplier prefix."""
+    return tuple(f"{FEED_BASE_URL}{prefix}_cdon_{country}.xml" for country in ("se", "dk", "fi"))
+
+def output_file_name(prefix):
+    return f"{prefix}_output_feeds.xlsx"
+
 def process_feeds(se_url, dk_url, fi_url, output_file_path, status_callback):
     """
     Main function to process the three XML feeds and generate the Excel file.
-    Uses a callback to update the GUI status.
+    Uses a callback to update the GUI status. Returns True when the file was saved.
     """
+    feed_folder = tempfile.mkdtemp(prefix="cdon_feeds_")
     try:
-        status_callback("Pobieranie i parsowanie feeda SE...")
-        root_se = download_xml(se_url)
-        status_callback("Pobieranie i parsowanie feeda DK...")
-        root_dk = download_xml(dk_url)
-        status_callback("Pobieranie i parsowanie feeda FI...")
-        root_fi = download_xml(fi_url)
-
-        status_callback("Budowanie słowników produktów...")
-        se_offers = build_products_dict(root_se)
-        dk_offers = build_products_dict(root_dk)
-        fi_offers = build_products_dict(root_fi)
-
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Dane"
+        status_callback("Pobieranie feeda SE...")
+        se_path = download_feed(se_url, feed_folder)
+        # DK and FI only contribute prices, so they are reduced to small id -> price indexes
+        status_callback("Pobieranie i indeksowanie cen z feeda DK...")
+        dk_prices = build_price_index(download_feed(dk_url, feed_folder), dk_url)
+        status_callback("Pobieranie i indeksowanie cen z feeda FI...")
+        fi_prices = build_price_index(download_feed(fi_url, feed_folder), fi_url)
 
         # MODIFIED: Added "weight" to headers
         headers = [
@@ -147,178 +170,107 @@ def process_feeds(se_url, dk_url, fi_url, output_file_path, status_callback):
             "vatSe", "vatDk", "vatFi",
             "deliverySe", "deliveryDk", "deliveryFi"
         ]
-        ws.append(headers)
-
-        total = len(se_offers)
-        count = 0
-        status_callback(f"Przetwarzanie {total} produktów...")
-
-        for pid, se_offer in se_offers.items():
-            count += 1
-            if count % 50 == 0: # Update status every 50 products
-                status_callback(f"Przetwarzanie produktu {count}/{total}...")
-
-            dk_offer = dk_offers.get(pid)
-            fi_offer = fi_offers.get(pid)
-
-            # Extract data from the primary (SE) offer
-            sku = se_offer.get('id', '')
-            # NEW: Get weight
-            weight = get_weight(se_offer)
-            brand = get_brand(se_offer)
-            gtin = get_attr(se_offer, "EAN")
-            stock = get_stock(se_offer)
-            main_image = get_main_image(se_offer)
-            extra_images = get_extra_images(se_offer)
-            name = get_name(se_offer)
-            desc = get_desc(se_offer)
-            category = get_category(se_offer)
-            originalPriceSe = get_price(se_offer)
-
-            short_name = short(name, 135)
+        # Rows are streamed to a write-only workbook instead of being kept as cells until save
+        with ZapisExcel(output_file_path, headers, "Dane", stala_pamiec=True) as output:
+            count = 0
+            seen_ids = set()
+            status_callback("Przetwarzanie produktów...")
+            # The offer count is unknown up front, so the status shows the count and products/s (at most 10 Hz)
+            progress = RaportPostepu(lambda percent, text: status_callback(text),
+                                     opis="Przetwarzanie produktów:", jednostka="produktów")
+
+            # SE offers are streamed straight into rows; only one offer is in memory at a time
+            for se_offer in iter_feed_offers(se_path, se_url):
+                pid = se_offer.get('id')
+                # Offers without an id are skipped; a repeated id keeps its first offer
+                if not pid or pid in seen_ids:
+                    continue
+                seen_ids.add(pid)
+                count += 1
+                progress.aktualizuj(count)
+
+                # Extract data from the primary (SE) offer in one pass over its children
+                offer = decode_offer(se_offer)
+                sku = offer.sku
+                weight = offer.weight
+                brand = offer.brand
+                gtin = offer.gtin
+                stock = offer.stock
+                main_image = offer.main_image
+                extra_images = offer.extra_images
+                name = offer.name
+                desc = offer.desc
+                category = offer.category
+                originalPriceSe = offer.price
+
+                short_name = short(name, 135)
             
-            # MODIFIED LOGIC: Strip HTML only if description is too long
-            if len(desc) > 9500:
-                processed_desc = strip_html_tags(desc)
-            else:
-                processed_desc = desc
-            short_desc = short(processed_desc, 9500)
-
-            # Get prices from other feeds, if available
-            originalPriceDk = get_price(dk_offer) if dk_offer is not None else ""
-            originalPriceFi = get_price(fi_offer) if fi_offer is not None else ""
-
-            # MODIFIED: Added weight to the row
-            row = [
-                sku, weight, brand, gtin, stock, main_image, extra_images,
-                short_name, short_desc, short_name, short_desc, short_name, short_desc,
-                category,
-                originalPriceSe, originalPriceDk, originalPriceFi,
-                "0", "0", "0",
-                4, 4, 4,
-                6, 6, 6,
-                25, 25, 25.5, # Corrected VAT for FI
-                "HomeDelivery", "HomeDelivery", "HomeDelivery"
-            ]
-            ws.append(row)
-
-        status_callback("Zapisywanie pliku Excel...")
-        wb.save(output_file_path)
+                # MODIFIED LOGIC: Strip HTML only if description is too long
+                if len(desc) > 9500:
+                    processed_desc = strip_html_tags(desc)
+                else:
+                    processed_desc = desc
+                short_desc = short(processed_desc, 9500)
+
+                # Get prices from other feeds, if available
+                originalPriceDk = dk_prices.get(pid, "")
+                originalPriceFi = fi_prices.get(pid, "")
+
+                # MODIFIED: Added weight to the row
+                row = [
+                    sku, weight, brand, gtin, stock, main_image, extra_images,
+                    short_name, short_desc, short_name, short_desc, short_name, short_desc,
+                    category,
+                    originalPriceSe, originalPriceDk, originalPriceFi,
+                    "0", "0", "0",
+                    4, 4, 4,
+                    6, 6, 6,
+                    25, 25, 25.5, # Corrected VAT for FI
+                    "HomeDelivery", "HomeDelivery", "HomeDelivery"
+                ]
+                output.writerow(row)
+            progress.zakoncz()
+
+            status_callback("Zapisywanie pliku Excel...")
         messagebox.showinfo("Sukces", f"Plik '{os.path.basename(output_file_path)}' został pomyślnie zapisany.")
+        return True
 
     except (ConnectionError, ValueError, Exception) as e:
         messagebox.showerror("Błąd", str(e))
     except Exception as e:
         messagebox.showerror("Nieoczekiwany błąd", f"Wystąpił nieoczekiwany błąd: {e}")
     finally:
+        shutil.rmtree(feed_folder, ignore_errors=True)
         status_callback("") # Clear status message
-
-# --- GUI Setup with CustomTkinter ---
-
-class FeedProcessorApp(ctk.CTk):
-    def __init__(self):
-        super().__init__()
-
-        # --- Window Configuration ---
-        self.title("Narzędzie do Przetwarzania Feedów XML")
-        self.geometry("600x360") # Adjusted window size for new widget
-        self.resizable(False, False)
-
-        # --- Theme and Appearance ---
-        ctk.set_appearance_mode("System")  # Can be "Dark", "Light"
-        ctk.set_default_color_theme("blue") # "blue", "green", "dark-blue"
-
-        # --- Main Frame ---
-        self.main_frame = ctk.CTkFrame(self, corner_radius=10)
-        self.main_frame.pack(pady=20, padx=20, fill="both", expand=True)
-
-        self.create_widgets()
-
-    def create_widgets(self):
-        """Creates and lays out all the widgets in the application."""
-        # --- Prefix Input Field ---
-        ctk.CTkLabel(self.main_frame, text="Przedrostek pliku XML:", font=("Helvetica", 12)).pack(anchor="w", padx=10, pady=(10,0))
-        self.prefix_entry = ctk.CTkEntry(self.main_frame, width=500, placeholder_text="np. nazwa_dostawcy")
-        self.prefix_entry.pack(padx=10, pady=(0,10), fill="x")
-
-        # --- Output Path Field ---
-        ctk.CTkLabel(self.main_frame, text="Folder docelowy:", font=("Helvetica", 12)).pack(anchor="w", padx=10, pady=(10,0))
-        
-        output_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
-        output_frame.pack(fill="x", padx=10, pady=(0,20))
-
-        self.output_path_entry = ctk.CTkEntry(output_frame)
-        self.output_path_entry.pack(side="left", fill="x", expand=True)
-
-        # Set default path to the user's Desktop
-        desktop_path = os.path.join(os.path.expanduser('~'), 'Desktop')
-        self.output_path_entry.insert(0, desktop_path)
-
-        browse_button = ctk.CTkButton(output_frame, text="Przeglądaj...", command=self.browse_output_directory, width=120)
-        browse_button.pack(side="left", padx=(10, 0))
-
-        # --- Action Button ---
-        self.process_button = ctk.CTkButton(self.main_frame, text="Generuj plik Excel", command=self.run_processing, height=40, font=("Helvetica", 14, "bold"))
-        self.process_button.pack(pady=10, padx=10, fill="x")
-
-        # --- Status Label ---
-        self.status_label = ctk.CTkLabel(self, text="", text_color="gray")
-        self.status_label.pack(pady=(0, 10), padx=20)
-
-    def browse_output_directory(self):
-        """Opens a dialog to select an output directory."""
-        directory = filedialog.askdirectory(title="Wybierz folder docelowy")
-        if directory:
-            self.output_path_entry.delete(0, "end")
-            self.output_path_entry.insert(0, directory)
-
-    def update_status(self, message):
-        """Callback function to update the status label from the processing function."""
-        self.status_label.configure(text=message)
-        self.update_idletasks() # Refresh the GUI to show the new message
-
-    def run_processing(self):
-        """Handles the button click event for processing and saving the file."""
-        prefix = self.prefix_entry.get().strip()
-        output_dir = self.output_path_entry.get().strip()
-
-        if not prefix:
-            messagebox.showwarning("Brakujące dane", "Proszę wprowadzić przedrostek pliku.")
-            return
-
-        if not output_dir:
-            messagebox.showwarning("Brakujące dane", "Proszę podać folder docelowy.")
-            return
-        
-        if not os.path.isdir(output_dir):
-            messagebox.showerror("Błąd", f"Podany folder docelowy nie istnieje:\n{output_dir}")
-            return
-
-        # Construct the full output path and check for overwrite
-        filename = f"{prefix}_output_feeds.xlsx"
-        output_file_path = os.path.join(output_dir, filename)
-
-        if os.path.exists(output_file_path):
-            if not messagebox.askyesno("Potwierdzenie", f"Plik '{filename}' już istnieje w wybranej lokalizacji.\n\nCzy chcesz go nadpisać?"):
-                return  # User chose not to overwrite
-
-        # Construct the full URLs from the prefix
-        base_url = "https://sm-prods.com/feeds/"
-        se_url = f"{base_url}{prefix}_cdon_se.xml"
-        dk_url = f"{base_url}{prefix}_cdon_dk.xml"
-        fi_url = f"{base_url}{prefix}_cdon_fi.xml"
-        
-        # Disable button during processing
-        self.process_button.configure(state="disabled", text="Przetwarzanie...")
-        self.update_idletasks() # Ensure GUI updates before long task
-        
-        # Run the main processing function
-        process_feeds(se_url, dk_url, fi_url, output_file_path, self.update_status)
-
-        # Re-enable button after processing is complete or an error occurs
-        self.process_button.configure(state="normal", text="Generuj plik Excel")
-
-
-if __name__ == "__main__":
+    return False
+
+# --- Command line (cron) ---
+
+def run_command(args):
+    """Same checks as the window, with the overwrite question answered by --tak."""
+    if not os.path.isdir(args.folder):
+        messagebox.showerror("Błąd", f"Podany folder docelowy nie istnieje:\n{args.folder}")
+        return False
+    filename = output_file_name(args.prefix)
+    output_file_path = os.path.join(args.folder, filename)
+    if os.path.exists(output_file_path):
+        if not messagebox.askyesno("Potwierdzenie", f"Plik '{filename}' już istnieje w wybranej lokalizacji.\n\nCzy chcesz go nadpisać?"):
+            return False
+    se_url, dk_url, fi_url = feed_urls(args.prefix)
+    return process_feeds(se_url, dk_url, fi_url, output_file_path, StatusKonsoli())
+
+def build_parser():
+    parser, commands = utworz_parser("Generuje plik Excel dla CDON z feedów SE, DK i FI.")
+    generate = commands.add_parser('generuj', help="pobiera feedy i zapisuje <prefix>_output_feeds.xlsx")
+    generate.add_argument('prefix', help="przedrostek pliku XML, np. nazwa_dostawcy")
+    generate.add_argument('--folder', default=os.path.join(os.path.expanduser('~'), 'Desktop'), help="folder docelowy")
+    generate.set_defaults(polecenie=run_command)
+    return parser
+
+def run_window():
+    from cdon_for_dawid_okno import FeedProcessorApp
     app = FeedProcessorApp()
     app.mainloop()
+
+if __name__ == "__main__":
+    sys.exit(uruchom(build_parser(), run_window))
@@ -0,0 +1,112 @@
+import os
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from cdon_for_dawid import feed_urls, output_file_name, process_feeds
+
+# --- GUI Setup with CustomTkinter ---
+# Imported only when the window is requested (python cdon_for_dawid.py without arguments)
+
+class FeedProcessorApp(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+
+        # --- Window Configuration ---
+        self.title("Narzędzie do Przetwarzania Feedów XML")
+        self.geometry("600x360") # Adjusted window size for new widget
+        self.resizable(False, False)
+
+        # --- Theme and Appearance ---
+        ctk.set_appearance_mode("System")  # Can be "Dark", "Light"
+        ctk.set_default_color_theme("blue") # "blue", "green", "dark-blue"
+
+        # --- Main Frame ---
+        self.main_frame = ctk.CTkFrame(self, corner_radius=10)
+        self.main_frame.pack(pady=20, padx=20, fill="both", expand=True)
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Creates and lays out all the widgets in the application."""
+        # --- Prefix Input Field ---
+        ctk.CTkLabel(self.main_frame, text="Przedrostek pliku XML:", font=("Helvetica", 12)).pack(anchor="w", padx=10, pady=(10,0))
+        self.prefix_entry = ctk.CTkEntry(self.main_frame, width=500, placeholder_text="np. nazwa_dostawcy")
+        self.prefix_entry.pack(padx=10, pady=(0,10), fill="x")
+
+        # --- Output Path Field ---
+        ctk.CTkLabel(self.main_frame, text="Folder docelowy:", font=("Helvetica", 12)).pack(anchor="w", padx=10, pady=(10,0))
+        
+        output_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        output_frame.pack(fill="x", padx=10, pady=(0,20))
+
+        self.output_path_entry = ctk.CTkEntry(output_frame)
+        self.output_path_entry.pack(side="left", fill="x", expand=True)
+
+        # Set default path to the user's Desktop
+        desktop_path = os.path.join(os.path.expanduser('~'), 'Desktop')
+        self.output_path_entry.insert(0, desktop_path)
+
+        browse_button = ctk.CTkButton(output_frame, text="Przeglądaj...", command=self.browse_output_directory, width=120)
+        browse_button.pack(side="left", padx=(10, 0))
+
+        # --- Action Button ---
+        self.process_button = ctk.CTkButton(self.main_frame, text="Generuj plik Excel", command=self.run_processing, height=40, font=("Helvetica", 14, "bold"))
+        self.process_button.pack(pady=10, padx=10, fill="x")
+
+        # --- Status Label ---
+        self.status_label = ctk.CTkLabel(self, text="", text_color="gray")
+        self.status_label.pack(pady=(0, 10), padx=20)
+
+    def browse_output_directory(self):
+        """Opens a dialog to select an output directory."""
+        directory = filedialog.askdirectory(title="Wybierz folder docelowy")
+        if directory:
+            self.output_path_entry.delete(0, "end")
+            self.output_path_entry.insert(0, directory)
+
+    def update_status(self, message):
+        """Callback function to update the status label from the processing function."""
+        self.status_label.configure(text=message)
+        self.update_idletasks() # Refresh the GUI to show the new message
+
+    def run_processing(self):
+        """Handles the button click event for processing and saving the file."""
+        prefix = self.prefix_entry.get().strip()
+        output_dir = self.output_path_entry.get().strip()
+
+        if not prefix:
+            messagebox.showwarning("Brakujące dane", "Proszę wprowadzić przedrostek pliku.")
+            return
+
+        if not output_dir:
+            messagebox.showwarning("Brakujące dane", "Proszę podać folder docelowy.")
+            return
+        
+        if not os.path.isdir(output_dir):
+            messagebox.showerror("Błąd", f"Podany folder docelowy nie istnieje:\n{output_dir}")
+            return
+
+        # Construct the full output path and check for overwrite
+        filename = output_file_name(prefix)
+        output_file_path = os.path.join(output_dir, filename)
+
+        if os.path.exists(output_file_path):
+            if not messagebox.askyesno("Potwierdzenie", f"Plik '{filename}' już istnieje w wybranej lokalizacji.\n\nCzy chcesz go nadpisać?"):
+                return  # User chose not to overwrite
+
+        # Construct the full URLs from the prefix
+        se_url, dk_url, fi_url = feed_urls(prefix)
+        
+        # Disable button during processing
+        self.process_button.configure(state="disabled", text="Przetwarzanie...")
+        self.update_idletasks() # Ensure GUI updates before long task
+        
+        # Run the main processing function
+        process_feeds(se_url, dk_url, fi_url, output_file_path, self.update_status)
+
+        # Re-enable button after processing is complete or an error occurs
+        self.process_button.configure(state="normal", text="Generuj plik Excel")
+
+
+if __name__ == "__main__":
+    app = FeedProcessorApp()
+    app.mainloop()
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import pandas as pd
+from zapis_tabel import wczytaj_tabele
 import os
 
 # Ustawienie wyglądu CustomTkinter
@@ -77,7 +78,7 @@ class CSVToExcelApp(ctk.CTk):
         """Otwiera okno dialogowe do wyboru jednego lub wielu plików CSV."""
         file_paths = filedialog.askopenfilenames(
             title="Wybierz pliki CSV",
-            filetypes=(("Pliki CSV", "*.csv"), ("Wszystkie pliki", "*.*"))
+            filetypes=(("Pliki CSV / Parquet", "*.csv *.parquet"), ("Wszystkie pliki", "*.*"))
         )
         if file_paths:
             self.selected_csv_files = list(file_paths) # Konwertuj tuple na listę
@@ -162,8 +163,8 @@ class CSVToExcelApp(ctk.CTk):
                         # Nazwa arkusza w Excelu nie może przekraczać 31 znaków
                         sheet_name = sheet_name[:31]
 
-                        # Odczyt pliku CSV
-                        df = pd.read_csv(csv_file, sep=separator, header=0 if has_header else None, encoding='utf-8', on_bad_lines='skip')
+                        # Odczyt pliku CSV lub Parquet
+                        df = wczytaj_tabele(csv_file, separator, has_header)
 
                         # Zapis DataFrame do arkusza w pliku Excel
                         df.to_excel(writer, sheet_name=sheet_name, index=False)
@@ -0,0 +1,90 @@
+import gzip
+import hashlib
+import json
+import os
+
+from pobieranie_feedow import KATALOG_CACHE
+
+# Tryb delta dla eksportów feedów (xmlcsv2, xmlcsv3, giga_bol): dla każdego feeda trzymamy
+# odciski ofert z poprzedniego uruchomienia (id -> skrót zapisywanych pól) i wypuszczamy
+# tylko oferty dodane, zmienione lub usunięte. Magazyn jest osobny dla każdej pary
+# (narzędzie, URL), więc nieudane pobranie jednego feeda nie oznacza "usunięcia" jego ofert.
+
+KATALOG_DELTA = os.path.join(KATALOG_CACHE, 'delta')
+KOLUMNA_ZMIANY = 'zmiana'
+ZMIANA_DODANA = 'dodana'
+ZMIANA_ZMIENIONA = 'zmieniona'
+ZMIANA_USUNIETA = 'usunieta'
+
+
+def odcisk_wiersza(pola, wiersz):
+    """Skrót (8 bajtów) niepustych par kolumna=wartość - nowa pusta kolumna nie zmienia odcisku."""
+    skrot = hashlib.blake2b(digest_size=8)
+    for pole, wartosc in zip(pola, wiersz):
+        if wartosc is None or wartosc == "":
+            continue
+        skrot.update(f"{pole}\x1f{wartosc}\x1e".encode('utf-8'))
+    return skrot.hexdigest()
+
+
+class MagazynOdciskow:
+    """Odciski ofert jednego feeda: poprzedni stan z dysku i nowy stan budowany w trakcie zapisu."""
+
+    def __init__(self, narzedzie, url, katalog=KATALOG_DELTA):
+        klucz = hashlib.sha1(f"{narzedzie}|{url}".encode('utf-8')).hexdigest()
+        self.sciezka = os.path.join(katalog, klucz + '.json.gz')
+        self.poprzednie = {}
+        self.biezace = {}
+        self.kompletny = False  # czy feed został przetworzony do końca
+        try:
+            with gzip.open(self.sciezka, 'rt', encoding='utf-8') as plik:
+                self.poprzednie = json.load(plik)
+        except (OSError, ValueError):
+            # Brak lub uszkodzony magazyn - pierwsze uruchomienie, wszystkie oferty są "dodane"
+            self.poprzednie = {}
+
+    def sprawdz(self, id_oferty, pola, wiersz):
+        """Zapamiętuje odcisk oferty i zwraca rodzaj zmiany albo None, jeśli oferta się nie zmieniła."""
+        if id_oferty is None:
+            id_oferty = ""
+        odcisk = odcisk_wiersza(pola, wiersz)
+        self.biezace[id_oferty] = odcisk
+        poprzedni = self.poprzednie.get(id_oferty)
+        if poprzedni is None:
+            return ZMIANA_DODANA
+        if poprzedni != odcisk:
+            return ZMIANA_ZMIENIONA
+        return None
+
+    def usuniete(self):
+        """Id ofert z poprzedniego uruchomienia, których nie ma w bieżącym."""
+        return [id_oferty for id_oferty in self.poprzednie if id_oferty not in self.biezace]
+
+    def zatwierdz(self):
+        """
+        Zapisuje bieżący stan na dysk - wywoływać dopiero po udanym zapisie wyniku.
+        Niekompletny stan (np. feed, którego nie udało się pobrać) nie nadpisuje poprzedniego.
+        """
+        if not self.kompletny:
+            return
+        os.makedirs(os.path.dirname(self.sciezka), exist_ok=True)
+        tymczasowa = self.sciezka + '.part'
+        with gzip.open(tymczasowa, 'wt', encoding='utf-8', compresslevel=1) as plik:
+            json.dump(self.biezace, plik, separators=(',', ':'))
+        os.replace(tymczasowa, self.sciezka)
+
+
+def tylko_zmiany(wiersze, pola, magazyn, indeks_id=0):
+    """
+    Przepuszcza tylko wiersze dodane lub zmienione (z dopisaną kolumną zmiany),
+    a po wyczerpaniu wejścia dokłada wiersze usuniętych ofert (samo id).
+    """
+    for wiersz in wiersze:
+        zmiana = magazyn.sprawdz(wiersz[indeks_id], pola, wiersz)
+        if zmiana:
+            yield tuple(wiersz) + (zmiana,)
+    for id_oferty in magazyn.usuniete():
+        pusty = [""] * len(pola)
+        pusty[indeks_id] = id_oferty
+        yield tuple(pusty) + (ZMIANA_USUNIETA,)
+    magazyn.kompletny = True
@@ -1,8 +1,10 @@
 import pandas as pd
-import customtkinter
-from tkinter import filedialog, messagebox
 import os
+import posixpath
 import shutil
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
 import re # Do rozpoznawania plików
 from collections import Counter
 
@@ -15,26 +17,108 @@ except ImportError:
     PYWIN32_AVAILABLE = False
 
 import openpyxl
+from openpyxl.utils.cell import range_boundaries
+from wczytywanie_excel import wczytaj_excele
+from postep import RaportPostepu
+# Komunikaty jak tkinter.messagebox; okno (customtkinter) jest w dziel_lacz_okno i ładuje się tylko dla GUI
+from konsola import StatusKonsoli, messagebox, utworz_parser, uruchom
 
-# --- Konfiguracja GUI ---
-customtkinter.set_appearance_mode("System")
-customtkinter.set_default_color_theme("blue")
-customtkinter.set_widget_scaling(0.8)
+SILNIK_STRUMIENIOWY = "Strumieniowy (bez Excela)"
+SILNIK_EXCEL = "Excel (zachowuje formatowanie)"
 
 #================================================================================
 # FUNKCJE POMOCNICZE
 #================================================================================
 
-def get_sheet_names(filepath):
-    """Zwraca listę nazw arkuszy z danego pliku Excel."""
+# Przestrzenie nazw części pakietu xlsx
+NS_ARKUSZA = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+NS_RELACJI = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+NS_PAKIETU = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+WZORZEC_WYMIARU = re.compile(rb'<(?:\w+:)?dimension\s+ref="([^"]+)"')
+BAJTY_DO_WYMIARU = 65536  # <dimension> jest na początku pliku arkusza
+
+# Arkusze odczytanych plików: ścieżka -> (czas modyfikacji, rozmiar, lista (nazwa, wymiar));
+# zmieniony plik zastępuje swój wpis, a ponad limit usuwany jest najdawniej odczytany
+_arkusze_plikow = {}
+MAKS_ZAPAMIETANYCH_PLIKOW = 32
+
+def odczytaj_arkusze_xlsx(filepath):
+    """
+    Zwraca listę (nazwa, wymiar np. 'A1:F2000' albo None) arkuszy pliku xlsx/xlsm, czytając
+    tylko xl/workbook.xml i początki plików arkuszy - bez wczytywania całego skoroszytu.
+    """
+    with zipfile.ZipFile(filepath) as archiwum:
+        cele = {}
+        try:
+            relacje = ET.fromstring(archiwum.read("xl/_rels/workbook.xml.rels"))
+            for relacja in relacje.iter(f"{NS_PAKIETU}Relationship"):
+                cel = relacja.get("Target", "")
+                # Cel jest względny do katalogu xl/ albo bezwzględny w pakiecie
+                cele[relacja.get("Id")] = cel.lstrip("/") if cel.startswith("/") else posixpath.normpath(posixpath.join("xl", cel))
+        except KeyError:
+            pass
+
+        arkusze = []
+        skoroszyt = ET.fromstring(archiwum.read("xl/workbook.xml"))
+        for arkusz in skoroszyt.iter(f"{NS_ARKUSZA}sheet"):
+            wymiar = None
+            czesc = cele.get(arkusz.get(f"{NS_RELACJI}id"))
+            if czesc:
+                try:
+                    with archiwum.open(czesc) as plik_arkusza:
+                        dopasowanie = WZORZEC_WYMIARU.search(plik_arkusza.read(BAJTY_DO_WYMIARU))
+                    if dopasowanie:
+                        wymiar = dopasowanie.group(1).decode("ascii")
+                except KeyError:
+                    pass
+            arkusze.append((arkusz.get("name"), wymiar))
+        return arkusze
+
+def get_sheet_info(filepath):
+    """
+    Zwraca listę (nazwa, wymiar albo None) arkuszy pliku Excel, zapamiętaną, dopóki plik
+    się nie zmieni, albo None, gdy pliku nie da się odczytać.
+    """
     if not filepath or not os.path.exists(filepath):
         return None
-    try:
-        workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
-        return workbook.sheetnames
-    except Exception as e:
-        messagebox.showerror("Błąd odczytu pliku", f"Nie można odczytać arkuszy z pliku: {filepath}\nBłąd: {e}")
+    stat = os.stat(filepath)
+    sciezka = os.path.abspath(filepath)
+    wpis = _arkusze_plikow.pop(sciezka, None)
+    if wpis is None or wpis[:2] != (stat.st_mtime_ns, stat.st_size):
+        try:
+            arkusze = odczytaj_arkusze_xlsx(filepath)
+        except Exception:
+            # Nie jest to typowy pakiet xlsx - odczyt przez openpyxl (bez wymiarów)
+            try:
+                workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+                arkusze = [(nazwa, None) for nazwa in workbook.sheetnames]
+                workbook.close()
+            except Exception as e:
+                messagebox.showerror("Błąd odczytu pliku", f"Nie można odczytać arkuszy z pliku: {filepath}\nBłąd: {e}")
+                return None
+        wpis = (stat.st_mtime_ns, stat.st_size, arkusze)
+    # Ostatnio odczytany plik trafia na koniec słownika (kolejność wstawiania)
+    _arkusze_plikow[sciezka] = wpis
+    while len(_arkusze_plikow) > MAKS_ZAPAMIETANYCH_PLIKOW:
+        del _arkusze_plikow[next(iter(_arkusze_plikow))]
+    return wpis[2]
+
+def get_sheet_names(filepath):
+    """Zwraca listę nazw arkuszy z danego pliku Excel albo None."""
+    arkusze = get_sheet_info(filepath)
+    if arkusze is None:
         return None
+    return [nazwa for nazwa, _ in arkusze]
+
+def opis_wymiaru(wymiar):
+    """'A1:F2000' -> 'A1:F2000 (wiersze: 2000, kolumny: 6)'; bez wymiaru w pliku - 'zakres nieznany'."""
+    if not wymiar:
+        return "zakres nieznany"
+    try:
+        min_kolumna, min_wiersz, max_kolumna, max_wiersz = range_boundaries(wymiar)
+    except (TypeError, ValueError):
+        return wymiar
+    return f"{wymiar} (wiersze: {max_wiersz - min_wiersz + 1}, kolumny: {max_kolumna - min_kolumna + 1})"
 
 def find_last_row(ws):
     """Znajduje ostatni używany wiersz w arkuszu."""
@@ -110,6 +194,7 @@ def podziel_excel(plik_wejsciowy, wierszy_na_plik, folder_wyjsciowy, liczba_wier
                     workbook.Close(SaveChanges=False)
 
         messagebox.showinfo("Sukces", f"Plik podzielono na {pliki_utworzone} części.\nZapisano w: {folder_wyjsciowy}")
+        return pliki_utworzone
 
     except Exception as e_main:
         messagebox.showerror("Błąd krytyczny", f"Wystąpił błąd: {e_main}")
@@ -121,6 +206,99 @@ def podziel_excel(plik_wejsciowy, wierszy_na_plik, folder_wyjsciowy, liczba_wier
         if app_instance:
             app_instance.update_status_split("Gotowy.")
 
+def podziel_excel_strumieniowo(plik_wejsciowy, wierszy_na_plik, folder_wyjsciowy, liczba_wierszy_naglowka=0, sheet_identifier=0, app_instance=None):
+    """
+    Dzieli plik Excel bez użycia MS Excel: arkusz jest czytany raz (openpyxl read-only),
+    a każda część z powtórzonym nagłówkiem jest zapisywana strumieniowo (write-only).
+    Zapisywane są same wartości - formatowanie oryginału nie jest przenoszone.
+    """
+    workbook = None
+    czesc = None
+    try:
+        workbook = openpyxl.load_workbook(plik_wejsciowy, read_only=True, data_only=True)
+        if isinstance(sheet_identifier, int):
+            ws = workbook.worksheets[sheet_identifier]
+        else:
+            ws = workbook[sheet_identifier]
+        # Zapisany w pliku wymiar (<dimension>) bywa nieaktualny, a iter_rows w trybie read-only
+        # kończy się na nim - po resecie czytane są wszystkie wiersze, a liczba wierszy jest nieznana
+        ws.reset_dimensions()
+
+        # Wymiar arkusza służy tylko do komunikatów o postępie (może go brakować)
+        liczba_plikow_do_utworzenia = None
+        liczba_wierszy_danych = None
+        if ws.max_row and ws.max_row > liczba_wierszy_naglowka:
+            liczba_wierszy_danych = ws.max_row - liczba_wierszy_naglowka
+            liczba_plikow_do_utworzenia = (liczba_wierszy_danych + wierszy_na_plik - 1) // wierszy_na_plik
+        # Postęp jest zgłaszany dla każdego wiersza, ale etykieta odświeżana najwyżej 10 razy na sekundę
+        raport = RaportPostepu(lambda procent, tekst: app_instance.update_status_split(tekst),
+                               liczba_wierszy_danych) if app_instance else None
+
+        nazwa_pliku_base, rozszerzenie_pliku = os.path.splitext(os.path.basename(plik_wejsciowy))
+        arkusz_sufix = f"_arkusz_{sheet_identifier}".replace(" ", "_")
+        # Zapis write-only tworzy zwykły skoroszyt bez makr, więc części zawsze są w formacie .xlsx
+        rozszerzenie_wyjsciowe = ".xlsx"
+
+        naglowek = []
+        pliki_utworzone = 0
+        wierszy_w_czesci = 0
+        wierszy_zapisanych = 0
+        sciezka_czesci = None
+
+        for wiersz in ws.iter_rows(values_only=True):
+            if len(naglowek) < liczba_wierszy_naglowka:
+                naglowek.append(wiersz)
+                continue
+
+            if czesc is None:
+                numer_czesci = pliki_utworzone + 1
+                if raport:
+                    z_ilu = f"/{liczba_plikow_do_utworzenia}" if liczba_plikow_do_utworzenia else ""
+                    raport.opis = f"Dzielenie: część {numer_czesci}{z_ilu}..."
+                nazwa_wyjsciowa = f"{nazwa_pliku_base}{arkusz_sufix}_czesc_{numer_czesci}{rozszerzenie_wyjsciowe}"
+                sciezka_czesci = os.path.abspath(os.path.join(folder_wyjsciowy, nazwa_wyjsciowa))
+                czesc = openpyxl.Workbook(write_only=True)
+                ws_czesci = czesc.create_sheet(title=ws.title)
+                for wiersz_naglowka in naglowek:
+                    ws_czesci.append(wiersz_naglowka)
+
+            ws_czesci.append(wiersz)
+            wierszy_w_czesci += 1
+            wierszy_zapisanych += 1
+            if raport:
+                raport.aktualizuj(wierszy_zapisanych)
+
+            if wierszy_w_czesci >= wierszy_na_plik:
+                czesc.save(sciezka_czesci)
+                czesc = None
+                wierszy_w_czesci = 0
+                pliki_utworzone += 1
+
+        if raport:
+            raport.zakoncz()
+        if czesc is not None:
+            czesc.save(sciezka_czesci)
+            czesc = None
+            pliki_utworzone += 1
+
+        if pliki_utworzone == 0:
+            if not naglowek:
+                messagebox.showerror("Błąd", f"Wybrany arkusz '{sheet_identifier}' jest pusty.")
+            else:
+                messagebox.showerror("Błąd", "Liczba wierszy nagłówka jest większa lub równa liczbie wszystkich wierszy.")
+            return
+
+        messagebox.showinfo("Sukces", f"Plik podzielono na {pliki_utworzone} części.\nZapisano w: {folder_wyjsciowy}")
+        return pliki_utworzone
+
+    except Exception as e_main:
+        messagebox.showerror("Błąd krytyczny", f"Wystąpił błąd: {e_main}")
+    finally:
+        if workbook:
+            workbook.close()
+        if app_instance:
+            app_instance.update_status_split("Gotowy.")
+
 #================================================================================
 # LOGIKA SKŁADANIA STANDARDOWEGO
 #================================================================================
@@ -152,7 +330,9 @@ def find_parts_for_base_file(base_file_path):
 
 def scal_pliki(base_file_path, sheet_identifier, header_rows_count, app_instance=None):
     """Scala grupę plików w jeden, bazując na pliku wzorcowym i wybranym arkuszu."""
-    if not PYWIN32_AVAILABLE: return
+    if not PYWIN32_AVAILABLE:
+        messagebox.showerror("Błąd krytyczny", "Biblioteka pywin32 nie jest zainstalowana.")
+        return
 
     excel = None
     pythoncom.CoInitialize()
@@ -217,6 +397,7 @@ def scal_pliki(base_file_path, sheet_identifier, header_rows_count, app_instance
         
         main_workbook.Save()
         messagebox.showinfo("Sukces", f"Pliki zostały pomyślnie scalone.\n\nZapisano w:\n{output_path}")
+        return output_path
 
     except Exception as e_main:
         messagebox.showerror("Błąd krytyczny", f"Wystąpił błąd podczas zapisywania scalonego pliku: {e_main}")
@@ -230,18 +411,89 @@ def scal_pliki(base_file_path, sheet_identifier, header_rows_count, app_instance
         if app_instance:
             app_instance.update_status_merge("Gotowy.")
 
+def scal_pliki_strumieniowo(base_file_path, sheet_identifier, header_rows_count, app_instance=None):
+    """
+    Scala grupę plików bez MS Excel i bez wczytywania wszystkiego do pamięci: wiersze kolejnych
+    części są przepisywane strumieniowo (openpyxl read-only -> write-only). Nagłówek pochodzi
+    z pierwszej części, w pozostałych jest pomijany. Zapisywane są same wartości wybranego arkusza.
+    """
+    app_instance.update_status_merge("Wyszukiwanie części plików...")
+    file_group, base_name, extension = find_parts_for_base_file(base_file_path)
+
+    if not file_group:
+        messagebox.showerror("Błąd", "Nie można znaleźć pasujących części. Sprawdź, czy nazwa pliku jest prawidłowa (np. ..._czesc_1.xlsx).")
+        app_instance.update_status_merge("Błąd wyszukiwania.")
+        return
+
+    folder_path = os.path.dirname(base_file_path)
+    # Zapis write-only tworzy zwykły skoroszyt bez makr, więc wynik zawsze jest w formacie .xlsx
+    output_filename = f"{base_name}_SCALONY.xlsx"
+    output_path = os.path.join(folder_path, output_filename)
+
+    if os.path.exists(output_path):
+        if not messagebox.askyesno("Potwierdzenie", f"Plik '{output_filename}' już istnieje.\n\nCzy chcesz go nadpisać?"):
+            app_instance.update_status_merge("Anulowano.")
+            return
+
+    try:
+        output_workbook = openpyxl.Workbook(write_only=True)
+        output_ws = output_workbook.create_sheet(title=sheet_identifier)
+        # Liczba wierszy wszystkich części nie jest znana z góry - raport pokazuje samo tempo
+        raport = RaportPostepu(lambda procent, tekst: app_instance.update_status_merge(tekst))
+        rows_written = 0
+
+        for i, (part_num, file_path) in enumerate(file_group):
+            raport.aktualizuj(rows_written, f"Scalanie części {part_num}/{len(file_group)}...")
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                if sheet_identifier not in workbook.sheetnames:
+                    messagebox.showerror("Błąd wczytywania danych", f"Część {os.path.basename(file_path)} nie zawiera arkusza '{sheet_identifier}'.")
+                    app_instance.update_status_merge("Błąd wczytywania.")
+                    return
+                # Wiersze nagłówka zostają tylko z pierwszej części
+                skip_rows = header_rows_count if i > 0 else 0
+                part_ws = workbook[sheet_identifier]
+                # Część zapisana innym programem może mieć nieaktualny <dimension> - bez resetu
+                # iter_rows pominęłoby wiersze spoza niego
+                part_ws.reset_dimensions()
+                for row in part_ws.iter_rows(min_row=skip_rows + 1, values_only=True):
+                    output_ws.append(row)
+                    rows_written += 1
+                    raport.aktualizuj(rows_written)
+            finally:
+                workbook.close()
+        raport.zakoncz()
+
+        app_instance.update_status_merge("Zapisywanie scalonego pliku...")
+        output_workbook.save(output_path)
+        messagebox.showinfo("Sukces", f"Pliki zostały pomyślnie scalone.\n\nZapisano w:\n{output_path}")
+        return output_path
+
+    except Exception as e_main:
+        messagebox.showerror("Błąd krytyczny", f"Wystąpił błąd podczas scalania plików: {e_main}")
+    finally:
+        if app_instance:
+            app_instance.update_status_merge("Gotowy.")
+
 #================================================================================
 # LOGIKA SKŁADANIA NIESTANDARDOWEGO
 #================================================================================
 
-def scal_pliki_niestandardowo(file_paths, sheet_index, app_instance=None):
-    """Scala dane z wielu dowolnych plików, tworząc nowy plik z nowym nagłówkiem."""
+def scal_pliki_niestandardowo(file_paths, sheet_index, app_instance=None, output_path=None):
+    """
+    Scala dane z wielu dowolnych plików, tworząc nowy plik z nowym nagłówkiem.
+    Bez output_path ścieżka zapisu jest wybierana w oknie (app_instance.wybierz_plik_zapisu) po wczytaniu danych.
+    """
     all_data_frames = []
     app_instance.update_status_custom_merge("Wczytywanie danych...")
     try:
-        for i, file_path in enumerate(file_paths):
-            app_instance.update_status_custom_merge(f"Wczytywanie pliku {i+1}/{len(file_paths)}...")
-            df = pd.read_excel(file_path, sheet_name=sheet_index, header=None, skiprows=1)
+        # Pliki są wczytywane równolegle; kolejność wyników odpowiada kolejności plików
+        def postep(gotowe, wszystkie, sciezka):
+            app_instance.update_status_custom_merge(f"Wczytano plik {gotowe}/{wszystkie} ({os.path.basename(sciezka)})...")
+
+        for df, blad in wczytaj_excele(file_paths, postep, sheet_name=sheet_index, header=None, skiprows=1):
+            if blad is not None:
+                raise blad
             all_data_frames.append(df)
 
         if not all_data_frames:
@@ -261,11 +513,8 @@ def scal_pliki_niestandardowo(file_paths, sheet_index, app_instance=None):
         messagebox.showerror("Błąd wczytywania", f"Nie można przetworzyć plików. Upewnij się, że każdy plik zawiera arkusz o podanym numerze.\n\nBłąd: {e}")
         return
 
-    output_path = filedialog.asksaveasfilename(
-        title="Zapisz scalony plik jako...",
-        defaultextension=".xlsx",
-        filetypes=[("Plik Excel", "*.xlsx")])
-        
+    if not output_path:
+        output_path = app_instance.wybierz_plik_zapisu()
     if not output_path:
         app_instance.update_status_custom_merge("Anulowano zapis.")
         return
@@ -274,6 +523,7 @@ def scal_pliki_niestandardowo(file_paths, sheet_index, app_instance=None):
         app_instance.update_status_custom_merge("Zapisywanie pliku...")
         final_df.to_excel(output_path, index=False)
         messagebox.showinfo("Sukces", f"Pliki zostały pomyślnie scalone i zapisane w:\n{output_path}")
+        return output_path
     except Exception as e:
         messagebox.showerror("Błąd zapisu", f"Nie udało się zapisać pliku.\n\nBłąd: {e}")
     finally:
@@ -281,206 +531,88 @@ def scal_pliki_niestandardowo(file_paths, sheet_index, app_instance=None):
 
 
 #================================================================================
-# GŁÓWNA APLIKACJA GUI
+# WIERSZ POLECEŃ (CRON)
 #================================================================================
 
-class App(customtkinter.CTk):
-    def __init__(self):
-        super().__init__()
-
-        self.title("Dzielenie i Składanie Plików Excel v4.0")
-        self.geometry("540x580")
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(0, weight=1)
-        
-        self.custom_merge_files = []
-        
-        self.tab_view = customtkinter.CTkTabview(self)
-        self.tab_view.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
-        self.tab_view.add("Dzielenie")
-        self.tab_view.add("Składanie")
-        self.tab_view.add("Składanie Niestandardowe")
-        
-        self.create_split_tab(self.tab_view.tab("Dzielenie"))
-        self.create_merge_tab(self.tab_view.tab("Składanie"))
-        self.create_custom_merge_tab(self.tab_view.tab("Składanie Niestandardowe"))
-
-    # --- ZAKŁADKI ---
-    def create_split_tab(self, tab):
-        tab.grid_columnconfigure(0, weight=1)
-        
-        etykieta_plik = customtkinter.CTkLabel(tab, text="1. Wybierz plik Excel do podziału:")
-        etykieta_plik.grid(row=0, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.entry_plik_split = customtkinter.CTkEntry(tab)
-        self.entry_plik_split.grid(row=1, column=0, padx=(10, 5), pady=5, sticky="ew")
-        przycisk_plik = customtkinter.CTkButton(tab, text="Przeglądaj...", command=self.wybierz_plik_split)
-        przycisk_plik.grid(row=1, column=1, padx=(5, 10), pady=5, sticky="ew")
-
-        etykieta_arkusz = customtkinter.CTkLabel(tab, text="2. Wybierz arkusz:")
-        etykieta_arkusz.grid(row=2, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.optionmenu_arkusz_split = customtkinter.CTkOptionMenu(tab, values=["Wybierz plik..."], state="disabled")
-        self.optionmenu_arkusz_split.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
-
-        etykieta_parametry = customtkinter.CTkLabel(tab, text="3. Ustaw parametry:")
-        etykieta_parametry.grid(row=4, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.entry_wiersze_split = customtkinter.CTkEntry(tab, placeholder_text="Liczba wierszy danych na plik")
-        self.entry_wiersze_split.grid(row=5, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
-        self.entry_naglowek_split = customtkinter.CTkEntry(tab, placeholder_text="Liczba wierszy nagłówka (np. 0)")
-        self.entry_naglowek_split.grid(row=6, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
-
-        etykieta_folder = customtkinter.CTkLabel(tab, text="4. Wybierz folder zapisu:")
-        etykieta_folder.grid(row=7, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.entry_folder_split = customtkinter.CTkEntry(tab)
-        self.entry_folder_split.grid(row=8, column=0, padx=(10, 5), pady=5, sticky="ew")
-        przycisk_folder = customtkinter.CTkButton(tab, text="Przeglądaj...", command=self.wybierz_folder_split)
-        przycisk_folder.grid(row=8, column=1, padx=(5, 10), pady=5, sticky="ew")
-        
-        self.przycisk_podziel = customtkinter.CTkButton(tab, text="Podziel Plik", command=self.uruchom_podzial, height=40)
-        self.przycisk_podziel.grid(row=9, column=0, columnspan=2, padx=10, pady=(20, 5), sticky="ew")
-        self.status_label_split = customtkinter.CTkLabel(tab, text="Gotowy.")
-        self.status_label_split.grid(row=10, column=0, columnspan=2, padx=10, pady=(5, 10), sticky="ew")
-
-    def create_merge_tab(self, tab):
-        tab.grid_columnconfigure(0, weight=1)
-
-        etykieta_plik_merge = customtkinter.CTkLabel(tab, text="1. Wybierz dowolną część pliku do scalenia:")
-        etykieta_plik_merge.grid(row=0, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.entry_plik_merge = customtkinter.CTkEntry(tab)
-        self.entry_plik_merge.grid(row=1, column=0, padx=(10, 5), pady=5, sticky="ew")
-        przycisk_plik_merge = customtkinter.CTkButton(tab, text="Przeglądaj...", command=self.wybierz_plik_merge)
-        przycisk_plik_merge.grid(row=1, column=1, padx=(5, 10), pady=5, sticky="ew")
-        
-        etykieta_arkusz_merge = customtkinter.CTkLabel(tab, text="2. Wybierz arkusz do scalenia:")
-        etykieta_arkusz_merge.grid(row=2, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.optionmenu_arkusz_merge = customtkinter.CTkOptionMenu(tab, values=["Wybierz plik..."], state="disabled")
-        self.optionmenu_arkusz_merge.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
-
-        etykieta_naglowek_merge = customtkinter.CTkLabel(tab, text="3. Podaj liczbę wierszy nagłówka w plikach:")
-        etykieta_naglowek_merge.grid(row=4, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.entry_naglowek_merge = customtkinter.CTkEntry(tab, placeholder_text="np. 1")
-        self.entry_naglowek_merge.grid(row=5, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
-
-        self.przycisk_scal = customtkinter.CTkButton(tab, text="Scal Pliki", command=self.uruchom_scalanie, height=40)
-        self.przycisk_scal.grid(row=6, column=0, columnspan=2, padx=10, pady=(20, 5), sticky="ew")
-        self.status_label_merge = customtkinter.CTkLabel(tab, text="Wybierz plik-część, aby rozpocząć.")
-        self.status_label_merge.grid(row=7, column=0, columnspan=2, padx=10, pady=(5, 10), sticky="ew")
-
-    def create_custom_merge_tab(self, tab):
-        tab.grid_columnconfigure(0, weight=1)
-
-        etykieta_pliki_custom = customtkinter.CTkLabel(tab, text="1. Wybierz pliki do scalenia:")
-        etykieta_pliki_custom.grid(row=0, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.label_pliki_custom_count = customtkinter.CTkLabel(tab, text="Nie wybrano plików.")
-        self.label_pliki_custom_count.grid(row=1, column=0, padx=10, pady=5, sticky="w")
-        przycisk_pliki_custom = customtkinter.CTkButton(tab, text="Wybierz wiele plików...", command=self.wybierz_wiele_plikow)
-        przycisk_pliki_custom.grid(row=1, column=1, padx=(5, 10), pady=5, sticky="e")
-
-        etykieta_arkusz_custom = customtkinter.CTkLabel(tab, text="2. Podaj numer porządkowy arkusza do scalenia:")
-        etykieta_arkusz_custom.grid(row=2, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
-        self.entry_arkusz_custom = customtkinter.CTkEntry(tab, placeholder_text="np. 1 dla pierwszego arkusza")
-        self.entry_arkusz_custom.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
-        
-        info_label = customtkinter.CTkLabel(tab, text="Info: Skrypt pominie pierwszy wiersz (nagłówek) z każdego pliku i utworzy nowy nagłówek 'cat', 'id' itd.", wraplength=400)
-        info_label.grid(row=4, column=0, columnspan=2, padx=10, pady=(10, 0), sticky="w")
-
-        self.przycisk_scal_custom = customtkinter.CTkButton(tab, text="Scal i utwórz nowy plik", command=self.uruchom_scalanie_niestandardowe, height=40)
-        self.przycisk_scal_custom.grid(row=5, column=0, columnspan=2, padx=10, pady=(20, 5), sticky="ew")
-        self.status_label_custom_merge = customtkinter.CTkLabel(tab, text="Wybierz pliki i podaj numer arkusza.")
-        self.status_label_custom_merge.grid(row=6, column=0, columnspan=2, padx=10, pady=(5, 10), sticky="ew")
-
-
-    # --- METODY OBSŁUGI ZDARZEŃ ---
-    def update_status_split(self, message): self.status_label_split.configure(text=message); self.update_idletasks()
-    def update_status_merge(self, message): self.status_label_merge.configure(text=message); self.update_idletasks()
-    def update_status_custom_merge(self, message): self.status_label_custom_merge.configure(text=message); self.update_idletasks()
-
-    def wybierz_plik_split(self):
-        filename = filedialog.askopenfilename(title="Wybierz plik Excel", filetypes=(("Pliki Excel", "*.xlsx *.xls *.xlsm"), ("Wszystkie pliki", "*.*")))
-        if filename: self.entry_plik_split.delete(0, "end"); self.entry_plik_split.insert(0, filename); self.wczytaj_arkusze_split()
-
-    def wybierz_folder_split(self):
-        foldername = filedialog.askdirectory(title="Wybierz folder do zapisu")
-        if foldername: self.entry_folder_split.delete(0, "end"); self.entry_folder_split.insert(0, foldername)
-            
-    def wybierz_plik_merge(self):
-        filename = filedialog.askopenfilename(title="Wybierz dowolną część pliku", filetypes=(("Pliki Excel", "*.xlsx *.xls *.xlsm"), ("Wszystkie pliki", "*.*")))
-        if filename: self.entry_plik_merge.delete(0, "end"); self.entry_plik_merge.insert(0, filename); self.wczytaj_arkusze_merge()
-
-    def wybierz_wiele_plikow(self):
-        filenames = filedialog.askopenfilenames(title="Wybierz pliki do scalenia", filetypes=(("Pliki Excel", "*.xlsx *.xls *.xlsm"), ("Wszystkie pliki", "*.*")))
-        if filenames:
-            self.custom_merge_files = filenames
-            self.label_pliki_custom_count.configure(text=f"Wybrano plików: {len(self.custom_merge_files)}")
-            self.update_status_custom_merge("Gotowy do scalenia.")
-
-    def wczytaj_arkusze_split(self):
-        filepath = self.entry_plik_split.get()
-        if not filepath: return
-        self.update_status_split("Wczytywanie arkuszy...")
-        sheet_names = get_sheet_names(filepath)
-        if sheet_names:
-            self.optionmenu_arkusz_split.configure(values=sheet_names, state="normal"); self.optionmenu_arkusz_split.set(sheet_names[0])
-            self.update_status_split("Wybierz arkusz i ustaw parametry.")
-        else:
-            self.optionmenu_arkusz_split.configure(values=["Błąd odczytu"], state="disabled"); self.update_status_split("Błąd: Nie można wczytać arkuszy.")
-
-    def wczytaj_arkusze_merge(self):
-        filepath = self.entry_plik_merge.get()
-        if not filepath: return
-        self.update_status_merge("Wczytywanie arkuszy...")
-        sheet_names = get_sheet_names(filepath)
-        if sheet_names:
-            self.optionmenu_arkusz_merge.configure(values=sheet_names, state="normal"); self.optionmenu_arkusz_merge.set(sheet_names[0])
-            self.update_status_merge("Wybierz arkusz, podaj liczbę nagłówków i scal.")
-        else:
-            self.optionmenu_arkusz_merge.configure(values=["Błąd odczytu"], state="disabled"); self.update_status_merge("Błąd: Nie można wczytać arkuszy.")
-
-    # --- URUCHAMIANIE OPERACJI ---
-    def uruchom_podzial(self):
-        if not all([self.entry_plik_split.get(), self.entry_folder_split.get(), self.entry_wiersze_split.get(), self.entry_naglowek_split.get()]):
-            messagebox.showerror("Błąd", "Wypełnij wszystkie pola w zakładce Dzielenie.")
-            return
-        try:
-            wierszy = int(self.entry_wiersze_split.get()); naglowek = int(self.entry_naglowek_split.get())
-            if wierszy <= 0 or naglowek < 0: raise ValueError
-        except ValueError: messagebox.showerror("Błąd", "Liczba wierszy i nagłówka musi być prawidłową liczbą dodatnią."); return
-            
-        self.przycisk_podziel.configure(state="disabled")
-        podziel_excel(self.entry_plik_split.get(), wierszy, self.entry_folder_split.get(), naglowek, self.optionmenu_arkusz_split.get(), self)
-        self.przycisk_podziel.configure(state="normal")
-        
-    def uruchom_scalanie(self):
-        base_file_path = self.entry_plik_merge.get(); sheet_identifier = self.optionmenu_arkusz_merge.get(); header_rows_str = self.entry_naglowek_merge.get()
-        if not base_file_path or not header_rows_str or "Wybierz plik" in sheet_identifier or "Błąd" in sheet_identifier:
-            messagebox.showerror("Błąd", "Wypełnij wszystkie pola w zakładce Składanie.")
-            return
-        try:
-            header_rows_count = int(header_rows_str)
-            if header_rows_count < 0: raise ValueError
-        except ValueError: messagebox.showerror("Błąd", "Liczba wierszy nagłówka musi być prawidłową liczbą (0 lub więcej)."); return
-            
-        self.przycisk_scal.configure(state="disabled")
-        scal_pliki(base_file_path, sheet_identifier, header_rows_count, self)
-        self.przycisk_scal.configure(state="normal")
-
-    def uruchom_scalanie_niestandardowe(self):
-        if not self.custom_merge_files: messagebox.showerror("Błąd", "Najpierw wybierz pliki do scalenia."); return
-        sheet_num_str = self.entry_arkusz_custom.get()
-        if not sheet_num_str: messagebox.showerror("Błąd", "Podaj numer arkusza."); return
-        
-        try:
-            sheet_index = int(sheet_num_str) - 1
-            if sheet_index < 0: raise ValueError
-        except ValueError: messagebox.showerror("Błąd", "Numer arkusza musi być liczbą całkowitą większą od 0."); return
+class StatusWsadowy(StatusKonsoli):
+    """Zastępuje okno (app_instance) w funkcjach dzielenia i składania przy pracy bez GUI."""
+    def update_status_split(self, message): self(message)
+    def update_status_merge(self, message): self(message)
+    def update_status_custom_merge(self, message): self(message)
+
+def arkusz_lub_pierwszy(filepath, arkusz):
+    """Nazwa arkusza z wiersza poleceń albo - gdy jej nie podano - pierwszego arkusza pliku."""
+    if arkusz:
+        return arkusz
+    sheet_names = get_sheet_names(filepath)
+    if not sheet_names:
+        messagebox.showerror("Błąd", f"Nie można wczytać arkuszy z pliku: {filepath}")
+        return None
+    return sheet_names[0]
 
-        self.przycisk_scal_custom.configure(state="disabled")
-        scal_pliki_niestandardowo(self.custom_merge_files, sheet_index, self)
-        self.przycisk_scal_custom.configure(state="normal")
+def polecenie_podziel(args):
+    arkusz = arkusz_lub_pierwszy(args.plik, args.arkusz)
+    if arkusz is None:
+        return None
+    podziel = podziel_excel if args.silnik == 'excel' else podziel_excel_strumieniowo
+    return podziel(args.plik, args.wierszy, args.folder or os.path.dirname(os.path.abspath(args.plik)),
+                   args.naglowek, arkusz, StatusWsadowy())
 
+def polecenie_scal(args):
+    arkusz = arkusz_lub_pierwszy(args.plik, args.arkusz)
+    if arkusz is None:
+        return None
+    scal = scal_pliki if args.silnik == 'excel' else scal_pliki_strumieniowo
+    return scal(os.path.abspath(args.plik), arkusz, args.naglowek, StatusWsadowy())
+
+def polecenie_scal_dowolne(args):
+    return scal_pliki_niestandardowo(args.pliki, args.arkusz - 1, StatusWsadowy(), args.wynik)
+
+def liczba_dodatnia(tekst):
+    wartosc = int(tekst)
+    if wartosc <= 0:
+        raise ValueError(tekst)
+    return wartosc
+
+def liczba_nieujemna(tekst):
+    wartosc = int(tekst)
+    if wartosc < 0:
+        raise ValueError(tekst)
+    return wartosc
+
+def zbuduj_parser():
+    parser, polecenia = utworz_parser("Dzielenie i składanie plików Excel.")
+    silniki = ['strumieniowy', 'excel']
+
+    podziel = polecenia.add_parser('podziel', help="dzieli arkusz na części po WIERSZY wierszy danych")
+    podziel.add_argument('plik', help="plik Excel do podziału")
+    podziel.add_argument('wierszy', type=liczba_dodatnia, help="liczba wierszy danych na plik")
+    podziel.add_argument('--naglowek', type=liczba_nieujemna, default=0, help="liczba wierszy nagłówka")
+    podziel.add_argument('--arkusz', help="nazwa arkusza (domyślnie pierwszy)")
+    podziel.add_argument('--folder', help="folder zapisu (domyślnie folder pliku)")
+    podziel.add_argument('--silnik', choices=silniki, default='strumieniowy', help="excel zachowuje formatowanie (MS Excel, pywin32)")
+    podziel.set_defaults(polecenie=polecenie_podziel)
+
+    scal = polecenia.add_parser('scal', help="składa części ..._arkusz_X_czesc_N w plik ..._SCALONY")
+    scal.add_argument('plik', help="dowolna część pliku do scalenia")
+    scal.add_argument('--naglowek', type=liczba_nieujemna, default=0, help="liczba wierszy nagłówka w częściach")
+    scal.add_argument('--arkusz', help="nazwa arkusza (domyślnie pierwszy)")
+    scal.add_argument('--silnik', choices=silniki, default='strumieniowy', help="excel zachowuje formatowanie (MS Excel, pywin32)")
+    scal.set_defaults(polecenie=polecenie_scal)
+
+    scal_dowolne = polecenia.add_parser('scal-dowolne', help="scala dowolne pliki pod nowym nagłówkiem 'cat', 'id', ...")
+    scal_dowolne.add_argument('wynik', help="ścieżka zapisu scalonego pliku .xlsx")
+    scal_dowolne.add_argument('pliki', nargs='+', help="pliki do scalenia")
+    scal_dowolne.add_argument('--arkusz', type=liczba_dodatnia, default=1, help="numer porządkowy arkusza (od 1)")
+    scal_dowolne.set_defaults(polecenie=polecenie_scal_dowolne)
+    return parser
+
+def uruchom_okno():
+    from dziel_lacz_okno import App
+    app = App()
+    app.mainloop()
 
 if __name__ == '__main__':
-    if os.name != 'nt' or not PYWIN32_AVAILABLE:
-        messagebox.showerror("Błąd krytyczny", "Ta aplikacja wymaga systemu Windows, MS Excel oraz biblioteki pywin32.")
-    else:
-        app = App()
-        app.mainloop()
+    # Silniki strumieniowe i składanie niestandardowe działają bez MS Excel,
+    # pozostałe operacje same zgłaszają brak pywin32
+    sys.exit(uruchom(zbuduj_parser(), uruchom_okno))
@@ -0,0 +1,251 @@
+import customtkinter
+from tkinter import filedialog, messagebox
+from dziel_lacz import (SILNIK_EXCEL, SILNIK_STRUMIENIOWY, PYWIN32_AVAILABLE, get_sheet_info, opis_wymiaru, podziel_excel,
+                        podziel_excel_strumieniowo, scal_pliki, scal_pliki_strumieniowo, scal_pliki_niestandardowo)
+
+# --- Konfiguracja GUI ---
+customtkinter.set_appearance_mode("System")
+customtkinter.set_default_color_theme("blue")
+customtkinter.set_widget_scaling(0.8)
+
+#================================================================================
+# GŁÓWNA APLIKACJA GUI (importowana tylko przy uruchomieniu okna: python dziel_lacz.py bez argumentów)
+#================================================================================
+
+class App(customtkinter.CTk):
+    def __init__(self):
+        super().__init__()
+
+        self.title("Dzielenie i Składanie Plików Excel v4.0")
+        self.geometry("540x620")
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        
+        self.custom_merge_files = []
+        self.wymiary_split = {}
+        self.wymiary_merge = {}
+        
+        self.tab_view = customtkinter.CTkTabview(self)
+        self.tab_view.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
+        self.tab_view.add("Dzielenie")
+        self.tab_view.add("Składanie")
+        self.tab_view.add("Składanie Niestandardowe")
+        
+        self.create_split_tab(self.tab_view.tab("Dzielenie"))
+        self.create_merge_tab(self.tab_view.tab("Składanie"))
+        self.create_custom_merge_tab(self.tab_view.tab("Składanie Niestandardowe"))
+
+    # --- ZAKŁADKI ---
+    def create_split_tab(self, tab):
+        tab.grid_columnconfigure(0, weight=1)
+        
+        etykieta_plik = customtkinter.CTkLabel(tab, text="1. Wybierz plik Excel do podziału:")
+        etykieta_plik.grid(row=0, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.entry_plik_split = customtkinter.CTkEntry(tab)
+        self.entry_plik_split.grid(row=1, column=0, padx=(10, 5), pady=5, sticky="ew")
+        przycisk_plik = customtkinter.CTkButton(tab, text="Przeglądaj...", command=self.wybierz_plik_split)
+        przycisk_plik.grid(row=1, column=1, padx=(5, 10), pady=5, sticky="ew")
+
+        etykieta_arkusz = customtkinter.CTkLabel(tab, text="2. Wybierz arkusz:")
+        etykieta_arkusz.grid(row=2, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.optionmenu_arkusz_split = customtkinter.CTkOptionMenu(tab, values=["Wybierz plik..."], state="disabled",
+                                                                   command=self.pokaz_wymiar_split)
+        self.optionmenu_arkusz_split.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
+
+        etykieta_parametry = customtkinter.CTkLabel(tab, text="3. Ustaw parametry:")
+        etykieta_parametry.grid(row=4, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.entry_wiersze_split = customtkinter.CTkEntry(tab, placeholder_text="Liczba wierszy danych na plik")
+        self.entry_wiersze_split.grid(row=5, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
+        self.entry_naglowek_split = customtkinter.CTkEntry(tab, placeholder_text="Liczba wierszy nagłówka (np. 0)")
+        self.entry_naglowek_split.grid(row=6, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
+
+        etykieta_folder = customtkinter.CTkLabel(tab, text="4. Wybierz folder zapisu:")
+        etykieta_folder.grid(row=7, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.entry_folder_split = customtkinter.CTkEntry(tab)
+        self.entry_folder_split.grid(row=8, column=0, padx=(10, 5), pady=5, sticky="ew")
+        przycisk_folder = customtkinter.CTkButton(tab, text="Przeglądaj...", command=self.wybierz_folder_split)
+        przycisk_folder.grid(row=8, column=1, padx=(5, 10), pady=5, sticky="ew")
+        
+        # Silnik strumieniowy działa bez MS Excel (także poza Windows), silnik Excel zachowuje formatowanie
+        silniki_split = [SILNIK_STRUMIENIOWY, SILNIK_EXCEL]
+        self.silnik_split = customtkinter.CTkSegmentedButton(tab, values=silniki_split)
+        self.silnik_split.grid(row=9, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="ew")
+        self.silnik_split.set(SILNIK_STRUMIENIOWY)
+        if not PYWIN32_AVAILABLE:
+            self.silnik_split.configure(state="disabled")
+
+        self.przycisk_podziel = customtkinter.CTkButton(tab, text="Podziel Plik", command=self.uruchom_podzial, height=40)
+        self.przycisk_podziel.grid(row=10, column=0, columnspan=2, padx=10, pady=(20, 5), sticky="ew")
+        self.status_label_split = customtkinter.CTkLabel(tab, text="Gotowy.")
+        self.status_label_split.grid(row=11, column=0, columnspan=2, padx=10, pady=(5, 10), sticky="ew")
+
+    def create_merge_tab(self, tab):
+        tab.grid_columnconfigure(0, weight=1)
+
+        etykieta_plik_merge = customtkinter.CTkLabel(tab, text="1. Wybierz dowolną część pliku do scalenia:")
+        etykieta_plik_merge.grid(row=0, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.entry_plik_merge = customtkinter.CTkEntry(tab)
+        self.entry_plik_merge.grid(row=1, column=0, padx=(10, 5), pady=5, sticky="ew")
+        przycisk_plik_merge = customtkinter.CTkButton(tab, text="Przeglądaj...", command=self.wybierz_plik_merge)
+        przycisk_plik_merge.grid(row=1, column=1, padx=(5, 10), pady=5, sticky="ew")
+        
+        etykieta_arkusz_merge = customtkinter.CTkLabel(tab, text="2. Wybierz arkusz do scalenia:")
+        etykieta_arkusz_merge.grid(row=2, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.optionmenu_arkusz_merge = customtkinter.CTkOptionMenu(tab, values=["Wybierz plik..."], state="disabled",
+                                                                   command=self.pokaz_wymiar_merge)
+        self.optionmenu_arkusz_merge.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
+
+        etykieta_naglowek_merge = customtkinter.CTkLabel(tab, text="3. Podaj liczbę wierszy nagłówka w plikach:")
+        etykieta_naglowek_merge.grid(row=4, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.entry_naglowek_merge = customtkinter.CTkEntry(tab, placeholder_text="np. 1")
+        self.entry_naglowek_merge.grid(row=5, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
+
+        self.silnik_merge = customtkinter.CTkSegmentedButton(tab, values=[SILNIK_STRUMIENIOWY, SILNIK_EXCEL])
+        self.silnik_merge.grid(row=6, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="ew")
+        self.silnik_merge.set(SILNIK_STRUMIENIOWY)
+        if not PYWIN32_AVAILABLE:
+            self.silnik_merge.configure(state="disabled")
+
+        self.przycisk_scal = customtkinter.CTkButton(tab, text="Scal Pliki", command=self.uruchom_scalanie, height=40)
+        self.przycisk_scal.grid(row=7, column=0, columnspan=2, padx=10, pady=(20, 5), sticky="ew")
+        self.status_label_merge = customtkinter.CTkLabel(tab, text="Wybierz plik-część, aby rozpocząć.")
+        self.status_label_merge.grid(row=8, column=0, columnspan=2, padx=10, pady=(5, 10), sticky="ew")
+
+    def create_custom_merge_tab(self, tab):
+        tab.grid_columnconfigure(0, weight=1)
+
+        etykieta_pliki_custom = customtkinter.CTkLabel(tab, text="1. Wybierz pliki do scalenia:")
+        etykieta_pliki_custom.grid(row=0, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.label_pliki_custom_count = customtkinter.CTkLabel(tab, text="Nie wybrano plików.")
+        self.label_pliki_custom_count.grid(row=1, column=0, padx=10, pady=5, sticky="w")
+        przycisk_pliki_custom = customtkinter.CTkButton(tab, text="Wybierz wiele plików...", command=self.wybierz_wiele_plikow)
+        przycisk_pliki_custom.grid(row=1, column=1, padx=(5, 10), pady=5, sticky="e")
+
+        etykieta_arkusz_custom = customtkinter.CTkLabel(tab, text="2. Podaj numer porządkowy arkusza do scalenia:")
+        etykieta_arkusz_custom.grid(row=2, column=0, columnspan=2, padx=10, pady=(10, 5), sticky="w")
+        self.entry_arkusz_custom = customtkinter.CTkEntry(tab, placeholder_text="np. 1 dla pierwszego arkusza")
+        self.entry_arkusz_custom.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
+        
+        info_label = customtkinter.CTkLabel(tab, text="Info: Skrypt pominie pierwszy wiersz (nagłówek) z każdego pliku i utworzy nowy nagłówek 'cat', 'id' itd.", wraplength=400)
+        info_label.grid(row=4, column=0, columnspan=2, padx=10, pady=(10, 0), sticky="w")
+
+        self.przycisk_scal_custom = customtkinter.CTkButton(tab, text="Scal i utwórz nowy plik", command=self.uruchom_scalanie_niestandardowe, height=40)
+        self.przycisk_scal_custom.grid(row=5, column=0, columnspan=2, padx=10, pady=(20, 5), sticky="ew")
+        self.status_label_custom_merge = customtkinter.CTkLabel(tab, text="Wybierz pliki i podaj numer arkusza.")
+        self.status_label_custom_merge.grid(row=6, column=0, columnspan=2, padx=10, pady=(5, 10), sticky="ew")
+
+
+    # --- METODY OBSŁUGI ZDARZEŃ ---
+    def update_status_split(self, message): self.status_label_split.configure(text=message); self.update_idletasks()
+    def update_status_merge(self, message): self.status_label_merge.configure(text=message); self.update_idletasks()
+    def update_status_custom_merge(self, message): self.status_label_custom_merge.configure(text=message); self.update_idletasks()
+
+    def wybierz_plik_split(self):
+        filename = filedialog.askopenfilename(title="Wybierz plik Excel", filetypes=(("Pliki Excel", "*.xlsx *.xls *.xlsm"), ("Wszystkie pliki", "*.*")))
+        if filename: self.entry_plik_split.delete(0, "end"); self.entry_plik_split.insert(0, filename); self.wczytaj_arkusze_split()
+
+    def wybierz_folder_split(self):
+        foldername = filedialog.askdirectory(title="Wybierz folder do zapisu")
+        if foldername: self.entry_folder_split.delete(0, "end"); self.entry_folder_split.insert(0, foldername)
+            
+    def wybierz_plik_merge(self):
+        filename = filedialog.askopenfilename(title="Wybierz dowolną część pliku", filetypes=(("Pliki Excel", "*.xlsx *.xls *.xlsm"), ("Wszystkie pliki", "*.*")))
+        if filename: self.entry_plik_merge.delete(0, "end"); self.entry_plik_merge.insert(0, filename); self.wczytaj_arkusze_merge()
+
+    def wybierz_plik_zapisu(self):
+        return filedialog.asksaveasfilename(title="Zapisz scalony plik jako...", defaultextension=".xlsx", filetypes=[("Plik Excel", "*.xlsx")])
+
+    def wybierz_wiele_plikow(self):
+        filenames = filedialog.askopenfilenames(title="Wybierz pliki do scalenia", filetypes=(("Pliki Excel", "*.xlsx *.xls *.xlsm"), ("Wszystkie pliki", "*.*")))
+        if filenames:
+            self.custom_merge_files = filenames
+            self.label_pliki_custom_count.configure(text=f"Wybrano plików: {len(self.custom_merge_files)}")
+            self.update_status_custom_merge("Gotowy do scalenia.")
+
+    def wczytaj_arkusze_split(self):
+        filepath = self.entry_plik_split.get()
+        if not filepath: return
+        self.update_status_split("Wczytywanie arkuszy...")
+        sheet_info = get_sheet_info(filepath)
+        if sheet_info:
+            self.wymiary_split = dict(sheet_info)
+            sheet_names = [nazwa for nazwa, _ in sheet_info]
+            self.optionmenu_arkusz_split.configure(values=sheet_names, state="normal"); self.optionmenu_arkusz_split.set(sheet_names[0])
+            self.pokaz_wymiar_split(sheet_names[0])
+        else:
+            self.optionmenu_arkusz_split.configure(values=["Błąd odczytu"], state="disabled"); self.update_status_split("Błąd: Nie można wczytać arkuszy.")
+
+    def wczytaj_arkusze_merge(self):
+        filepath = self.entry_plik_merge.get()
+        if not filepath: return
+        self.update_status_merge("Wczytywanie arkuszy...")
+        sheet_info = get_sheet_info(filepath)
+        if sheet_info:
+            self.wymiary_merge = dict(sheet_info)
+            sheet_names = [nazwa for nazwa, _ in sheet_info]
+            self.optionmenu_arkusz_merge.configure(values=sheet_names, state="normal"); self.optionmenu_arkusz_merge.set(sheet_names[0])
+            self.pokaz_wymiar_merge(sheet_names[0])
+        else:
+            self.optionmenu_arkusz_merge.configure(values=["Błąd odczytu"], state="disabled"); self.update_status_merge("Błąd: Nie można wczytać arkuszy.")
+
+    # Wymiar arkusza z pliku (bez wczytywania skoroszytu) jest pokazywany przy wyborze arkusza
+    def pokaz_wymiar_split(self, nazwa):
+        self.update_status_split(f"Arkusz '{nazwa}': {opis_wymiaru(self.wymiary_split.get(nazwa))}. Ustaw parametry.")
+
+    def pokaz_wymiar_merge(self, nazwa):
+        self.update_status_merge(f"Arkusz '{nazwa}': {opis_wymiaru(self.wymiary_merge.get(nazwa))}. Podaj liczbę nagłówków i scal.")
+
+    # --- URUCHAMIANIE OPERACJI ---
+    def uruchom_podzial(self):
+        if not all([self.entry_plik_split.get(), self.entry_folder_split.get(), self.entry_wiersze_split.get(), self.entry_naglowek_split.get()]):
+            messagebox.showerror("Błąd", "Wypełnij wszystkie pola w zakładce Dzielenie.")
+            return
+        try:
+            wierszy = int(self.entry_wiersze_split.get()); naglowek = int(self.entry_naglowek_split.get())
+            if wierszy <= 0 or naglowek < 0: raise ValueError
+        except ValueError: messagebox.showerror("Błąd", "Liczba wierszy i nagłówka musi być prawidłową liczbą dodatnią."); return
+            
+        self.przycisk_podziel.configure(state="disabled")
+        if self.silnik_split.get() == SILNIK_EXCEL:
+            podziel = podziel_excel
+        else:
+            podziel = podziel_excel_strumieniowo
+        podziel(self.entry_plik_split.get(), wierszy, self.entry_folder_split.get(), naglowek, self.optionmenu_arkusz_split.get(), self)
+        self.przycisk_podziel.configure(state="normal")
+        
+    def uruchom_scalanie(self):
+        base_file_path = self.entry_plik_merge.get(); sheet_identifier = self.optionmenu_arkusz_merge.get(); header_rows_str = self.entry_naglowek_merge.get()
+        if not base_file_path or not header_rows_str or "Wybierz plik" in sheet_identifier or "Błąd" in sheet_identifier:
+            messagebox.showerror("Błąd", "Wypełnij wszystkie pola w zakładce Składanie.")
+            return
+        try:
+            header_rows_count = int(header_rows_str)
+            if header_rows_count < 0: raise ValueError
+        except ValueError: messagebox.showerror("Błąd", "Liczba wierszy nagłówka musi być prawidłową liczbą (0 lub więcej)."); return
+            
+        self.przycisk_scal.configure(state="disabled")
+        if self.silnik_merge.get() == SILNIK_EXCEL:
+            scal = scal_pliki
+        else:
+            scal = scal_pliki_strumieniowo
+        scal(base_file_path, sheet_identifier, header_rows_count, self)
+        self.przycisk_scal.configure(state="normal")
+
+    def uruchom_scalanie_niestandardowe(self):
+        if not self.custom_merge_files: messagebox.showerror("Błąd", "Najpierw wybierz pliki do scalenia."); return
+        sheet_num_str = self.entry_arkusz_custom.get()
+        if not sheet_num_str: messagebox.showerror("Błąd", "Podaj numer arkusza."); return
+        
+        try:
+            sheet_index = int(sheet_num_str) - 1
+            if sheet_index < 0: raise ValueError
+        except ValueError: messagebox.showerror("Błąd", "Numer arkusza musi być liczbą całkowitą większą od 0."); return
+
+        self.przycisk_scal_custom.configure(state="disabled")
+        scal_pliki_niestandardowo(self.custom_merge_files, sheet_index, self)
+        self.przycisk_scal_custom.configure(state="normal")
+
+
+if __name__ == '__main__':
+    app = App()
+    app.mainloop()
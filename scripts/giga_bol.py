@@ -2,355 +2,501 @@ import csv
 import requests
 import xml.etree.ElementTree as ET
 import re
-import customtkinter as ctk
-from tkinter import filedialog, messagebox
 import openpyxl
-import threading
-import platform
 import os
+import sys
+from pobieranie_feedow import KODOWANIA_TRANSFERU
+from delta_ofert import KOLUMNA_ZMIANY, ZMIANA_USUNIETA, MagazynOdciskow, tylko_zmiany
+# Komunikaty jak tkinter.messagebox; okno (customtkinter) jest w giga_bol_okno i ładuje się tylko dla GUI
+from konsola import StatusKonsoli, messagebox, utworz_parser, uruchom
+# xlwings (opcjonalny) jest importowany dopiero w update_excel_prices_xlwings
+
+
+CSV_HEADERS = ['id', 'stock', 'ean', 'price']
+DEFAULT_OUTPUT_PATH = os.path.join(os.path.expanduser('~'), 'Desktop', "giga_bolec.csv")
+FEED_URLS = [
+    "https://sm-prods.com/feeds/janshop_bol.xml",
+    "https://sm-prods.com/feeds/moltico_bol.xml",
+    "https://sm-prods.com/feeds/piotrmiedz_bol.xml",
+    "https://sm-prods.com/feeds/3mk_bol.xml",
+    "https://sm-prods.com/feeds/jumi_bol.xml",
+    "https://sm-prods.com/feeds/stiv_bol.xml",
+    "https://sm-prods.com/feeds/aiofactory_bol.xml",
+    "https://sm-prods.com/feeds/kalama_bol.xml",
+    "https://sm-prods.com/feeds/fixclima_bol.xml",
+    "https://sm-prods.com/feeds/bass_bol.xml",
+    "https://sm-prods.com/feeds/homla_bol.xml",
+    "https://sm-prods.com/feeds/kobi_bol.xml",
+    "https://sm-prods.com/feeds/fixfy_bol.xml",
+    "https://sm-prods.com/feeds/carbonyway_bol.xml",
+    "https://dkkapusta1997.usermd.net/Jurek/hurtmeblowy/feeds/hurtmeblowy_bol.xml",
+    "https://dkkapusta1997.usermd.net/Jurek/topeshop/feeds/topeshop_bol.xml",
+    "https://dkkapusta1997.usermd.net/Jurek/artdog/feeds/artdog_bol.xml"
+]
+# Odpowiedź jest parsowana kawałkami w trakcie pobierania, bez trzymania całej treści i drzewa
+ROZMIAR_FRAGMENTU = 256 * 1024
+NON_DIGITS_PATTERN = re.compile(r'\D')
+
+# --- Aktualizacja cen w pliku Excel ---
+UPDATE_ENGINE_OPENPYXL = "Bez Excela (openpyxl)"
+UPDATE_ENGINE_XLWINGS = "Excel (xlwings)"
+PRICE_COLUMN = 5  # kolumna E
+MIN_PRICE = 2.00
+PRICE_REPORT_HEADERS = ['wiersz', 'id', 'stara_cena', 'nowa_cena']
+
+
+def find_ean(offer):
+    """Tekst pierwszego elementu (w kolejności dokumentu) z atrybutem name="ean" (bez względu na wielkość liter)."""
+    for sub_element in offer.iter():
+        name = sub_element.get('name')
+        if name and name.lower() == 'ean':
+            return sub_element.text or ''
+    return ''
+
+
+class OfferFilter:
+    """
+    Strumieniowy filtr feedu: przyjmuje kolejne fragmenty bajtów (feed) i zwraca wiersze
+    CSV_HEADERS dla ofert <o> (na dowolnej głębokości), których id jest w id_filter_set.
+    Id sprawdzane jest od razu po otwarciu elementu; EAN szukany jest tylko w pasujących ofertach,
+    a przetworzone elementy są usuwane, więc w pamięci jest najwyżej bieżąca oferta.
+    Przy uszkodzonym XML feed/close zgłaszają ET.ParseError.
+    """
+
+    def __init__(self, id_filter_set):
+        self.id_filter_set = id_filter_set
+        self.offer_count = 0
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._open_elements = []
+        # dla każdej otwartej <o>: czy jej id jest w filtrze i wiersze ofert w niej zagnieżdżonych
+        self._open_offers = []
+
+    def feed(self, chunk):
+        self._parser.feed(chunk)
+        return self._read_events()
+
+    def close(self):
+        self._parser.close()
+        return self._read_events()
+
+    def _read_events(self):
+        rows = []
+        open_elements = self._open_elements
+        open_offers = self._open_offers
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                open_elements.append(element)
+                # Tak jak root.findall('.//o') - sam korzeń się nie liczy
+                if element.tag == 'o' and len(open_elements) > 1:
+                    self.offer_count += 1
+                    open_offers.append((element.get('id', '').strip() in self.id_filter_set, []))
+                continue
+            open_elements.pop()
+            if element.tag != 'o' or not open_elements:
+                continue
+            matches, nested_rows = open_offers.pop()
+            # Kolejność jak w findall: oferta przed ofertami w niej zagnieżdżonymi
+            target = open_offers[-1][1] if open_offers else rows
+            if matches:
+                target.append([element.get('id', '').strip(), element.get('stock', '0'),
+                               NON_DIGITS_PATTERN.sub('', find_ean(element)), element.get('price', '')])
+            target.extend(nested_rows)
+            # Oferta zagnieżdżona w innej <o> zostaje, bo zewnętrzna może jeszcze szukać w niej EAN
+            if not open_offers:
+                open_elements[-1].clear()
+        return rows
+
+
+def load_price_map(csv_path):
+    """
+    Wczytuje ceny z wynikowego CSV jako Series id -> tekst ceny (przy powtórzonym id wygrywa ostatni wiersz).
+    W trybie delta usunięte produkty nie mają ceny do wpisania.
+    """
+    import pandas as pd
+
+    prices = pd.read_csv(csv_path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    if KOLUMNA_ZMIANY in prices.columns:
+        prices = prices[prices[KOLUMNA_ZMIANY] != ZMIANA_USUNIETA]
+    prices = prices.drop_duplicates('id', keep='last')
+    return pd.Series(prices['price'].values, index=prices['id'].values)
+
+
+def normalize_ids(values):
+    """Id z kolumny arkusza jako tekst: liczby bez części ułamkowej (123.0 -> "123"), tekst bez spacji."""
+    import pandas as pd
+
+    ids = pd.Series(values, dtype=object)
+    normalized = ids.astype(str).str.strip()
+    numeric = ids.map(type).isin((int, float))
+    if numeric.any():
+        normalized[numeric] = ids[numeric].astype(float).astype('int64').astype(str)
+    return normalized
+
 
-try:
-    import xlwings as xw
-except ImportError:
-    # xlwings jest opcjonalny, potrzebny tylko do funkcji aktualizacji.
-    # Komunikat zostanie wyświetlony, jeśli użytkownik spróbuje go użyć bez instalacji.
-    pass
+class PriceUpdateReport:
+    """Wynik aktualizacji cen: zmienione komórki oraz liczniki pominiętych produktów."""
 
+    def __init__(self, price_count):
+        self.price_count = price_count      # liczba cen wczytanych z CSV
+        self.changes = []                   # (wiersz, id, stara cena, nowa cena)
+        self.unchanged = 0                  # cena w arkuszu była już aktualna
+        self.skipped_low_price = 0          # cena z CSV niższa niż MIN_PRICE
+        self.invalid = []                   # (id, tekst ceny), którego nie da się zamienić na liczbę
 
-class XmlProcessorApp(ctk.CTk):
+    def write_csv(self, path):
+        """Zapisuje listę zmienionych komórek do CSV."""
+        with open(path, 'w', newline='', encoding='utf-8-sig') as report_file:
+            writer = csv.writer(report_file)
+            writer.writerow(PRICE_REPORT_HEADERS)
+            writer.writerows(self.changes)
+
+
+def update_excel_prices_openpyxl(csv_path, excel_path):
     """
-    Aplikacja GUI do przetwarzania kanałów XML, filtrowania ich na podstawie pliku Excel,
-    i zapisywania wyników do pliku CSV. Opcjonalnie aktualizuje ceny w źródłowym pliku Excel.
+    Aktualizuje ceny (kolumna E aktywnego arkusza) bezpośrednio w pliku xlsx, bez uruchamiania Excela.
+    Dopasowanie id i próg MIN_PRICE liczone są wektorowo na całych kolumnach; zapisywane są
+    tylko komórki, w których cena faktycznie się zmienia, a plik - tylko gdy są zmiany.
+    Zwraca PriceUpdateReport.
     """
-    def __init__(self):
-        super().__init__()
-
-        # --- Konfiguracja okna ---
-        self.title("XML to CSV Processor (Filtr ID i Aktualizator Cen)")
-        self.geometry("650x550")
-        ctk.set_appearance_mode("System")
-        ctk.set_default_color_theme("blue")
-
-        self.grid_columnconfigure(1, weight=1)
-
-        # --- Zmienne stanu ---
-        self.excel_file_path = ctk.StringVar()
-        
-        # --- Automatyczne ustawianie ścieżki wyjściowej ---
-        desktop_path = os.path.join(os.path.expanduser('~'), 'Desktop')
-        default_output_file = os.path.join(desktop_path, "giga_bolec.csv")
-        self.output_csv_path = ctk.StringVar(value=default_output_file)
-        
-        self.id_filter_set = set()
-        self.should_update_excel = ctk.BooleanVar()
-
-        # --- Widżety interfejsu ---
-        # Wybór pliku Excel
-        self.excel_label = ctk.CTkLabel(self, text="Plik Excel z filtrem (ID):")
-        self.excel_label.grid(row=0, column=0, padx=20, pady=(20, 5), sticky="w")
-        self.excel_entry = ctk.CTkEntry(self, textvariable=self.excel_file_path, state="readonly", width=300)
-        self.excel_entry.grid(row=0, column=1, padx=20, pady=(20, 5), sticky="ew")
-        self.excel_button = ctk.CTkButton(self, text="Przeglądaj...", command=self.select_excel_file)
-        self.excel_button.grid(row=0, column=2, padx=20, pady=(20, 5))
-
-        # Wyświetlanie wyjściowego pliku CSV (bez możliwości zmiany przyciskiem)
-        self.output_label = ctk.CTkLabel(self, text="Wyjściowy plik CSV:")
-        self.output_label.grid(row=1, column=0, padx=20, pady=5, sticky="w")
-        self.output_entry = ctk.CTkEntry(self, textvariable=self.output_csv_path, state="readonly")
-        self.output_entry.grid(row=1, column=1, columnspan=2, padx=20, pady=5, sticky="ew")
-
-        # Checkbox aktualizacji Excela
-        self.update_excel_checkbox = ctk.CTkCheckBox(
-            self, text="Zaktualizuj ceny w pliku Excel (zachowuje formatowanie)",
-            variable=self.should_update_excel
-        )
-        self.update_excel_checkbox.grid(row=2, column=0, columnspan=3, padx=20, pady=10, sticky="w")
-
-        # Przycisk start
-        self.start_button = ctk.CTkButton(self, text="Rozpocznij przetwarzanie", command=self.start_processing_thread, height=40)
-        self.start_button.grid(row=3, column=0, columnspan=3, padx=20, pady=20, sticky="ew")
-
-        # Pole tekstowe postępu/statusu
-        self.status_textbox = ctk.CTkTextbox(self, state="disabled", height=150)
-        self.status_textbox.grid(row=4, column=0, columnspan=3, padx=20, pady=10, sticky="nsew")
-        self.grid_rowconfigure(4, weight=1)
-        
-        # Lista URL
-        self.urls = [
-            "https://sm-prods.com/feeds/janshop_bol.xml",
-            "https://sm-prods.com/feeds/moltico_bol.xml",
-            "https://sm-prods.com/feeds/piotrmiedz_bol.xml",
-            "https://sm-prods.com/feeds/3mk_bol.xml",
-            "https://sm-prods.com/feeds/jumi_bol.xml",
-            "https://sm-prods.com/feeds/stiv_bol.xml",
-            "https://sm-prods.com/feeds/aiofactory_bol.xml",
-            "https://sm-prods.com/feeds/kalama_bol.xml",
-            "https://sm-prods.com/feeds/fixclima_bol.xml",
-            "https://sm-prods.com/feeds/bass_bol.xml",
-            "https://sm-prods.com/feeds/homla_bol.xml",
-            "https://sm-prods.com/feeds/kobi_bol.xml",
-            "https://sm-prods.com/feeds/fixfy_bol.xml",
-            "https://sm-prods.com/feeds/carbonyway_bol.xml",
-            "https://dkkapusta1997.usermd.net/Jurek/hurtmeblowy/feeds/hurtmeblowy_bol.xml",
-            "https://dkkapusta1997.usermd.net/Jurek/topeshop/feeds/topeshop_bol.xml",
-            "https://dkkapusta1997.usermd.net/Jurek/artdog/feeds/artdog_bol.xml"
-        ]
-
-    def log_status(self, message):
-        """ Dołącza wiadomość do pola statusu w głównym wątku. """
-        def _update_textbox():
-            self.status_textbox.configure(state="normal")
-            self.status_textbox.insert("end", message + "\n")
-            self.status_textbox.configure(state="disabled")
-            self.status_textbox.see("end") # Automatyczne przewijanie
-        self.after(0, _update_textbox)
-
-    def select_excel_file(self):
-        """ Otwiera okno dialogowe do wyboru pliku Excel do filtrowania. """
-        path = filedialog.askopenfilename(
-            title="Wybierz plik Excel z filtrem",
-            filetypes=(("Pliki Excel", "*.xlsx *.xls"), ("Wszystkie pliki", "*.*"))
-        )
-        if path:
-            self.excel_file_path.set(os.path.abspath(path))
-            self.log_status(f"Wybrano plik z filtrem: {os.path.basename(path)}")
-
-    def load_id_filter(self):
-        """ Wczytuje ID z pierwszej kolumny wybranego pliku Excel. """
-        excel_path = self.excel_file_path.get()
-        if not excel_path:
-            messagebox.showerror("Błąd", "Proszę najpierw wybrać plik Excel z filtrem.")
-            return False
-        self.log_status("Wczytywanie ID z pliku Excel...")
-        self.id_filter_set.clear()
-        try:
-            workbook = openpyxl.load_workbook(excel_path)
-            sheet = workbook.active
-            for cell in sheet['A']:
-                if cell.value:
-                    value = cell.value
-                    if isinstance(value, (int, float)):
-                        processed_id = str(int(value))
-                    else:
-                        processed_id = str(value).strip()
-                    self.id_filter_set.add(processed_id)
-            
-            self.log_status(f"Pomyślnie załadowano {len(self.id_filter_set)} unikalnych ID do filtrowania.")
-            
-            if not self.id_filter_set:
-                self.log_status("UWAGA: Nie załadowano żadnych ID. Plik Excel może być pusty w kolumnie A.")
-                messagebox.showwarning("Brak ID", "Nie znaleziono żadnych ID w kolumnie A wybranego pliku Excel.")
-            return True
-        except Exception as e:
-            messagebox.showerror("Błąd odczytu Excela", f"Nie udało się odczytać pliku Excel.\nBłąd: {e}")
-            self.log_status(f"Błąd odczytu pliku Excel: {e}")
-            return False
-
-    def parse_xml_and_write_csv(self, url, csv_writer):
-        """ 
-        Parsuje pojedynczy URL XML, filtruje po ID i zapisuje do CSV.
-        Zwraca krotkę: (dodane_wiersze, znalezione_id_w_tym_url)
-        """
-        lines_added = 0
-        found_ids = set()
-        try:
-            response = requests.get(url, timeout=30)
+    import pandas as pd
+
+    prices = load_price_map(csv_path)
+    report = PriceUpdateReport(len(prices))
+    if prices.empty:
+        return report
+
+    workbook = openpyxl.load_workbook(excel_path, keep_vba=excel_path.lower().endswith('.xlsm'))
+    try:
+        sheet = workbook.active
+        ids = [row[0] for row in sheet.iter_rows(min_col=1, max_col=1, values_only=True)]
+        # Tak jak Ctrl+Strzałka w górę: zakres kończy się na ostatniej niepustej komórce w kolumnie A
+        last_row = next((i for i in range(len(ids), 0, -1) if ids[i - 1] is not None), 0)
+        if not last_row:
+            return report
+        ids = normalize_ids(ids[:last_row])
+        current = pd.Series([row[0] for row in sheet.iter_rows(
+            min_row=1, max_row=last_row, min_col=PRICE_COLUMN, max_col=PRICE_COLUMN, values_only=True)], dtype=object)
+
+        new_text = ids.map(prices)
+        matched = new_text.notna()
+        new_price = pd.to_numeric(new_text.str.replace(',', '.', regex=False), errors='coerce')
+        valid = matched & new_price.notna()
+        to_write = valid & (new_price >= MIN_PRICE)
+        changed = to_write & (current != new_price)
+
+        report.skipped_low_price = int((valid & ~to_write).sum())
+        report.unchanged = int((to_write & ~changed).sum())
+        report.invalid = list(zip(ids[matched & ~valid], new_text[matched & ~valid]))
+        for index in changed[changed].index:
+            row = index + 1
+            value = float(new_price[index])
+            report.changes.append((row, ids[index], current[index], value))
+            sheet.cell(row=row, column=PRICE_COLUMN, value=value)
+
+        if report.changes:
+            workbook.save(excel_path)
+    finally:
+        workbook.close()
+    return report
+
+
+def load_id_filter(excel_path, log):
+    """ Wczytuje ID z pierwszej kolumny wybranego pliku Excel. Zwraca zbiór ID albo None przy błędzie. """
+    if not excel_path:
+        messagebox.showerror("Błąd", "Proszę najpierw wybrać plik Excel z filtrem.")
+        return None
+    log("Wczytywanie ID z pliku Excel...")
+    id_filter_set = set()
+    try:
+        workbook = openpyxl.load_workbook(excel_path)
+        sheet = workbook.active
+        for cell in sheet['A']:
+            if cell.value:
+                value = cell.value
+                if isinstance(value, (int, float)):
+                    processed_id = str(int(value))
+                else:
+                    processed_id = str(value).strip()
+                id_filter_set.add(processed_id)
+
+        log(f"Pomyślnie załadowano {len(id_filter_set)} unikalnych ID do filtrowania.")
+
+        if not id_filter_set:
+            log("UWAGA: Nie załadowano żadnych ID. Plik Excel może być pusty w kolumnie A.")
+            messagebox.showwarning("Brak ID", "Nie znaleziono żadnych ID w kolumnie A wybranego pliku Excel.")
+        return id_filter_set
+    except Exception as e:
+        messagebox.showerror("Błąd odczytu Excela", f"Nie udało się odczytać pliku Excel.\nBłąd: {e}")
+        log(f"Błąd odczytu pliku Excel: {e}")
+        return None
+
+
+def parse_xml_and_write_csv(url, id_filter_set, csv_writer, log, fingerprint_store=None):
+    """ 
+    Parsuje pojedynczy URL XML, filtruje po ID i zapisuje do CSV.
+    W trybie delta (fingerprint_store) zapisuje tylko dodane/zmienione/usunięte produkty.
+    Zwraca krotkę: (dodane_wiersze, znalezione_id_w_tym_url)
+    """
+    lines_added = 0
+    found_ids = set()
+    rows = []
+    try:
+        # Jawnie negocjujemy kompresję transferu (requests rozpakowuje odpowiedź sam)
+        with requests.get(url, timeout=30, headers={'Accept-Encoding': KODOWANIA_TRANSFERU}, stream=True) as response:
             response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            self.log_status(f"BŁĄD pobierania {url}. Błąd: {e}")
-            return 0, found_ids
-        
+            offer_filter = OfferFilter(id_filter_set)
+            for chunk in response.iter_content(chunk_size=ROZMIAR_FRAGMENTU):
+                rows.extend(offer_filter.feed(chunk))
+            rows.extend(offer_filter.close())
+    except requests.exceptions.RequestException as e:
+        log(f"BŁĄD pobierania {url}. Błąd: {e}")
+        return 0, found_ids
+    except ET.ParseError as e:
+        log(f"BŁĄD parsowania XML z {url}. Błąd: {e}")
+        return 0, found_ids
+
+    if not offer_filter.offer_count:
+        return 0, found_ids
+
+    found_ids.update(row[0] for row in rows)
+    log(f"Znaleziono {len(rows)} pasujących produktów w {url}")
+    if fingerprint_store is not None:
+        rows = list(tylko_zmiany(rows, CSV_HEADERS, fingerprint_store))
+        log(f"Tryb delta: {len(rows)} zmian w {url}")
+    csv_writer.writerows(rows)
+    lines_added = len(rows)
+    return lines_added, found_ids
+
+
+def update_excel_prices(csv_path, excel_path, log, engine=UPDATE_ENGINE_OPENPYXL):
+    """ Aktualizuje ceny w źródłowym pliku Excel wybranym silnikiem. Zwraca False przy błędzie. """
+    if engine == UPDATE_ENGINE_XLWINGS:
+        return update_excel_prices_xlwings(csv_path, excel_path, log)
+
+    log("\n--- Rozpoczynanie aktualizacji cen w pliku Excel (bez Excela, openpyxl) ---")
+    try:
+        report = update_excel_prices_openpyxl(csv_path, excel_path)
+    except Exception as e:
+        log(f"Krytyczny błąd podczas aktualizacji pliku Excel: {e}")
+        messagebox.showerror("Błąd aktualizacji Excela", f"Wystąpił błąd podczas modyfikacji pliku Excel:\n{e}\n\nUpewnij się, że plik jest w formacie .xlsx/.xlsm i nie jest otwarty w innym programie.")
+        return False
+
+    log(f"Wczytano {report.price_count} cen z pliku CSV do aktualizacji.")
+    if not report.price_count:
+        log("Mapa cen jest pusta. Pomijanie aktualizacji Excela.")
+        return True
+    for product_id, price_text in report.invalid:
+        log(f"Pominięto ID {product_id}: nieprawidłowy format ceny '{price_text}'.")
+    if report.skipped_low_price > 0:
+        log(f"Pominięto {report.skipped_low_price} produktów, ponieważ ich cena była niższa niż {MIN_PRICE:.2f}.")
+    log(f"Ceny bez zmian: {report.unchanged}.")
+
+    updated_count = len(report.changes)
+    log(f"Pomyślnie zaktualizowano {updated_count} cen w pliku Excel.")
+    if updated_count > 0:
+        base, ext = os.path.splitext(csv_path)
+        report_path = f"{base}_zmiany_cen.csv"
         try:
-            root = ET.fromstring(response.content)
-        except ET.ParseError as e:
-            self.log_status(f"BŁĄD parsowania XML z {url}. Błąd: {e}")
-            return 0, found_ids
-        
-        offers = root.findall('.//o')
-        
-        if not offers:
-            return 0, found_ids
-
-        for offer in offers:
-            id_value = offer.attrib.get('id', '').strip()
-            
-            if id_value in self.id_filter_set:
-                stock_value = offer.attrib.get('stock', '0')
-                price_value = offer.attrib.get('price', '')
-                
-                ean_element = None
-                for sub_element in offer.iter():
-                    if 'name' in sub_element.attrib and sub_element.attrib['name'].lower() == 'ean':
-                        ean_element = sub_element
-                        break 
-
-                ean_value = ean_element.text if ean_element is not None and ean_element.text is not None else ''
-                ean_value = re.sub(r'\D', '', ean_value)
-                
-                csv_writer.writerow([id_value, stock_value, ean_value, price_value])
-                lines_added += 1
-                found_ids.add(id_value)
-
-        self.log_status(f"Znaleziono {lines_added} pasujących produktów w {url}")
-        return lines_added, found_ids
-
-    def update_excel_prices(self, csv_path, excel_path):
-        """ Aktualizuje ceny w źródłowym pliku Excel używając xlwings. """
-        self.log_status("\n--- Rozpoczynanie aktualizacji cen w pliku Excel (używając xlwings) ---")
-        
-        try:
-            import xlwings as xw
-        except ImportError:
-            self.log_status("BŁĄD: Biblioteka 'xlwings' nie jest zainstalowana. Użyj 'pip install xlwings', aby ją zainstalować.")
-            messagebox.showerror("Brak biblioteki", "Aby zaktualizować plik Excel, musisz zainstalować bibliotekę 'xlwings'.\n\nUruchom w terminalu: pip install xlwings")
-            return
-
-        price_map = {}
-        try:
-            with open(csv_path, mode='r', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    price_map[row['id']] = row['price']
-            self.log_status(f"Wczytano {len(price_map)} cen z pliku CSV do aktualizacji.")
-            if not price_map:
-                self.log_status("Mapa cen jest pusta. Pomijanie aktualizacji Excela.")
-                return
+            report.write_csv(report_path)
+            log(f"Zapisano raport zmian cen do pliku: {os.path.basename(report_path)}")
         except Exception as e:
-            self.log_status(f"Błąd odczytu pliku CSV do aktualizacji: {e}")
-            return
+            log(f"Błąd podczas zapisywania raportu zmian cen: {e}")
+        messagebox.showinfo("Aktualizacja Excela zakończona", f"Pomyślnie zaktualizowano {updated_count} cen w pliku:\n{os.path.basename(excel_path)}")
+    else:
+        messagebox.showinfo("Aktualizacja Excela", f"Nie znaleziono żadnych cen do zaktualizowania w pliku:\n{os.path.basename(excel_path)}")
+    return True
+
+
+def update_excel_prices_xlwings(csv_path, excel_path, log):
+    """ Aktualizuje ceny w źródłowym pliku Excel używając xlwings (wymaga zainstalowanego MS Excel). """
+    log("\n--- Rozpoczynanie aktualizacji cen w pliku Excel (używając xlwings) ---")
+
+    try:
+        import xlwings as xw
+    except ImportError:
+        log("BŁĄD: Biblioteka 'xlwings' nie jest zainstalowana. Użyj 'pip install xlwings', aby ją zainstalować.")
+        messagebox.showerror("Brak biblioteki", "Aby zaktualizować plik Excel, musisz zainstalować bibliotekę 'xlwings'.\n\nUruchom w terminalu: pip install xlwings")
+        return False
+
+    price_map = {}
+    try:
+        with open(csv_path, mode='r', encoding='utf-8-sig') as csvfile:
+            reader = csv.DictReader(csvfile)
+            for row in reader:
+                # W trybie delta usunięte produkty nie mają ceny do wpisania
+                if row.get(KOLUMNA_ZMIANY) == ZMIANA_USUNIETA:
+                    continue
+                price_map[row['id']] = row['price']
+        log(f"Wczytano {len(price_map)} cen z pliku CSV do aktualizacji.")
+        if not price_map:
+            log("Mapa cen jest pusta. Pomijanie aktualizacji Excela.")
+            return True
+    except Exception as e:
+        log(f"Błąd odczytu pliku CSV do aktualizacji: {e}")
+        return False
 
-        try:
-            with xw.App(visible=False) as app:
-                with app.books.open(excel_path) as book:
-                    sheet = book.sheets.active
-                    
-                    last_row = sheet.range('A' + str(sheet.cells.last_cell.row)).end('up').row
-                    
-                    id_range_values = sheet.range(f'A1:A{last_row}').value
-                    price_range_values_to_write = sheet.range(f'E1:E{last_row}').value
-
-                    updated_count = 0
-                    skipped_low_price = 0
-
-                    if not isinstance(price_range_values_to_write, list):
-                        price_range_values_to_write = [price_range_values_to_write]
-                    if not isinstance(id_range_values, list):
-                        id_range_values = [id_range_values]
-
-                    for i, current_id_obj in enumerate(id_range_values):
-                        if isinstance(current_id_obj, float):
-                             current_id_str = str(int(current_id_obj))
-                        else:
-                             current_id_str = str(current_id_obj).strip()
-
-                        if current_id_str in price_map:
-                            new_price_str = price_map[current_id_str]
-                            try:
-                                new_price_float = float(new_price_str.replace(',', '.'))
-                                if new_price_float >= 2.00:
-                                    price_range_values_to_write[i] = new_price_float
-                                    updated_count += 1
-                                else:
-                                    skipped_low_price += 1
-                            except (ValueError, TypeError):
-                                self.log_status(f"Pominięto ID {current_id_str}: nieprawidłowy format ceny '{new_price_str}'.")
-
-                    if updated_count > 0:
-                        sheet.range('E1').options(transpose=False).value = [[p] for p in price_range_values_to_write]
-                    
-                    if skipped_low_price > 0:
-                        self.log_status(f"Pominięto {skipped_low_price} produktów, ponieważ ich cena była niższa niż 2.00.")
-
-                    book.save()
-                    self.log_status(f"Pomyślnie zaktualizowano {updated_count} cen w pliku Excel.")
-                    if updated_count > 0:
-                        messagebox.showinfo("Aktualizacja Excela zakończona", f"Pomyślnie zaktualizowano {updated_count} cen w pliku:\n{os.path.basename(excel_path)}")
+    try:
+        with xw.App(visible=False) as app:
+            with app.books.open(excel_path) as book:
+                sheet = book.sheets.active
+
+                last_row = sheet.range('A' + str(sheet.cells.last_cell.row)).end('up').row
+
+                id_range_values = sheet.range(f'A1:A{last_row}').value
+                price_range_values_to_write = sheet.range(f'E1:E{last_row}').value
+
+                updated_count = 0
+                skipped_low_price = 0
+
+                if not isinstance(price_range_values_to_write, list):
+                    price_range_values_to_write = [price_range_values_to_write]
+                if not isinstance(id_range_values, list):
+                    id_range_values = [id_range_values]
+
+                for i, current_id_obj in enumerate(id_range_values):
+                    if isinstance(current_id_obj, float):
+                         current_id_str = str(int(current_id_obj))
                     else:
-                        messagebox.showinfo("Aktualizacja Excela", f"Nie znaleziono żadnych cen do zaktualizowania w pliku:\n{os.path.basename(excel_path)}")
-        
-        except Exception as e:
-            self.log_status(f"Krytyczny błąd podczas aktualizacji pliku Excel z xlwings: {e}")
-            messagebox.showerror("Błąd aktualizacji Excela", f"Wystąpił błąd podczas modyfikacji pliku Excel z xlwings:\n{e}\n\nUpewnij się, że plik nie jest uszkodzony i nie jest otwarty w innym programie.")
-
-    def start_processing_thread(self):
-        """ Uruchamia główną logikę przetwarzania w osobnym wątku. """
-        self.start_button.configure(state="disabled", text="Przetwarzanie...")
-        self.status_textbox.configure(state="normal")
-        self.status_textbox.delete("1.0", "end")
-        self.status_textbox.configure(state="disabled")
-        
-        thread = threading.Thread(target=self.run_processing, daemon=True)
-        thread.start()
-
-    def run_processing(self):
-        """ Główna logika aplikacji. """
-        if not self.load_id_filter():
-            self.start_button.configure(state="normal", text="Rozpocznij przetwarzanie")
-            return
-
-        output_path = self.output_csv_path.get()
-        if not output_path:
-            # Ta sytuacja nie powinna się zdarzyć przy automatycznym ustawianiu ścieżki
-            messagebox.showerror("Błąd", "Nie ustawiono ścieżki do pliku wyjściowego.")
-            self.start_button.configure(state="normal", text="Rozpocznij przetwarzanie")
-            return
-
-        total_lines_added = 0
-        found_ids_master_set = set()
-        try:
-            with open(output_path, mode='w', newline='', encoding='utf-8-sig') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['id', 'stock', 'ean', 'price'])
-                
-                self.log_status("\n--- Rozpoczynanie przetwarzania XML ---")
-                
-                for i, url in enumerate(self.urls):
-                    self.log_status(f"({i+1}/{len(self.urls)}) Przetwarzanie: {url}")
-                    lines_added, found_ids_in_url = self.parse_xml_and_write_csv(url, writer)
-                    total_lines_added += lines_added
-                    found_ids_master_set.update(found_ids_in_url)
-
-            if total_lines_added == 0:
-                 self.log_status("\nUWAGA: Nie znaleziono żadnych pasujących produktów we wszystkich plikach XML.")
-            
-            final_message = f"\nPrzetwarzanie zakończone. Całkowita liczba dodanych wierszy: {total_lines_added}"
-            self.log_status(final_message)
-            
-            missing_ids = self.id_filter_set - found_ids_master_set
-            missing_ids_path = ""
-            if missing_ids:
-                base, ext = os.path.splitext(output_path)
-                missing_ids_path = f"{base}_brakujace_id.csv"
-                try:
-                    with open(missing_ids_path, 'w', newline='', encoding='utf-8-sig') as f_missing:
-                        writer_missing = csv.writer(f_missing)
-                        writer_missing.writerow(['id'])
-                        for missing_id in sorted(list(missing_ids)):
-                            writer_missing.writerow([missing_id])
-                    self.log_status(f"Zapisano {len(missing_ids)} brakujących ID do pliku: {os.path.basename(missing_ids_path)}")
-                except Exception as e:
-                    self.log_status(f"Błąd podczas zapisywania pliku z brakującymi ID: {e}")
-            
-            success_message = f"Przetwarzanie zakończone!\n\nZapisano {total_lines_added} wierszy do {os.path.basename(output_path)}."
-            if missing_ids_path:
-                success_message += f"\n\nZapisano {len(missing_ids)} brakujących ID do pliku:\n{os.path.basename(missing_ids_path)}"
-            messagebox.showinfo("Sukces", success_message)
-
-            if self.should_update_excel.get():
-                if total_lines_added > 0:
-                    excel_path = self.excel_file_path.get()
-                    self.update_excel_prices(output_path, excel_path)
+                         current_id_str = str(current_id_obj).strip()
+
+                    if current_id_str in price_map:
+                        new_price_str = price_map[current_id_str]
+                        try:
+                            new_price_float = float(new_price_str.replace(',', '.'))
+                            if new_price_float >= 2.00:
+                                price_range_values_to_write[i] = new_price_float
+                                updated_count += 1
+                            else:
+                                skipped_low_price += 1
+                        except (ValueError, TypeError):
+                            log(f"Pominięto ID {current_id_str}: nieprawidłowy format ceny '{new_price_str}'.")
+
+                if updated_count > 0:
+                    sheet.range('E1').options(transpose=False).value = [[p] for p in price_range_values_to_write]
+
+                if skipped_low_price > 0:
+                    log(f"Pominięto {skipped_low_price} produktów, ponieważ ich cena była niższa niż 2.00.")
+
+                book.save()
+                log(f"Pomyślnie zaktualizowano {updated_count} cen w pliku Excel.")
+                if updated_count > 0:
+                    messagebox.showinfo("Aktualizacja Excela zakończona", f"Pomyślnie zaktualizowano {updated_count} cen w pliku:\n{os.path.basename(excel_path)}")
                 else:
-                    self.log_status("\nPominięto aktualizację Excela, ponieważ nie znaleziono żadnych produktów.")
+                    messagebox.showinfo("Aktualizacja Excela", f"Nie znaleziono żadnych cen do zaktualizowania w pliku:\n{os.path.basename(excel_path)}")
+        return True
 
-        except Exception as e:
-            error_message = f"Wystąpił nieoczekiwany błąd podczas przetwarzania: {e}"
-            self.log_status(error_message)
-            messagebox.showerror("Błąd wykonania", error_message)
-        finally:
-            self.after(0, lambda: self.start_button.configure(state="normal", text="Rozpocznij przetwarzanie"))
+    except Exception as e:
+        log(f"Krytyczny błąd podczas aktualizacji pliku Excel z xlwings: {e}")
+        messagebox.showerror("Błąd aktualizacji Excela", f"Wystąpił błąd podczas modyfikacji pliku Excel z xlwings:\n{e}\n\nUpewnij się, że plik nie jest uszkodzony i nie jest otwarty w innym programie.")
+        return False
 
-if __name__ == "__main__":
+
+def run_processing(urls, excel_path, output_path, log, should_update_excel=False,
+                   update_engine=UPDATE_ENGINE_OPENPYXL, delta_mode=False):
+    """
+    Główna logika aplikacji (wspólna dla okna i wiersza poleceń): filtruje feedy urls po ID
+    z pliku Excel, zapisuje wynik do output_path i opcjonalnie aktualizuje ceny w tym pliku Excel.
+    Komunikaty przekazuje do log. Zwraca True, gdy przetwarzanie zakończyło się bez błędu.
+    """
+    id_filter_set = load_id_filter(excel_path, log)
+    if id_filter_set is None:
+        return False
+
+    if not output_path:
+        # Ta sytuacja nie powinna się zdarzyć przy automatycznym ustawianiu ścieżki
+        messagebox.showerror("Błąd", "Nie ustawiono ścieżki do pliku wyjściowego.")
+        return False
+
+    total_lines_added = 0
+    found_ids_master_set = set()
+    fingerprint_stores = []
+    try:
+        with open(output_path, mode='w', newline='', encoding='utf-8-sig') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_HEADERS + [KOLUMNA_ZMIANY] if delta_mode else CSV_HEADERS)
+
+            log("\n--- Rozpoczynanie przetwarzania XML ---")
+
+            for i, url in enumerate(urls):
+                log(f"({i+1}/{len(urls)}) Przetwarzanie: {url}")
+                fingerprint_store = MagazynOdciskow('giga_bol', url) if delta_mode else None
+                lines_added, found_ids_in_url = parse_xml_and_write_csv(url, id_filter_set, writer, log, fingerprint_store)
+                total_lines_added += lines_added
+                found_ids_master_set.update(found_ids_in_url)
+                if fingerprint_store is not None:
+                    fingerprint_stores.append(fingerprint_store)
+
+        # Stan delta zapisujemy dopiero po zamknięciu pliku wynikowego
+        # (feedy, których nie udało się pobrać, zachowują poprzedni stan)
+        for fingerprint_store in fingerprint_stores:
+            fingerprint_store.zatwierdz()
+
+        if total_lines_added == 0:
+             log("\nUWAGA: Nie znaleziono żadnych pasujących produktów we wszystkich plikach XML.")
+
+        final_message = f"\nPrzetwarzanie zakończone. Całkowita liczba dodanych wierszy: {total_lines_added}"
+        log(final_message)
+
+        missing_ids = id_filter_set - found_ids_master_set
+        missing_ids_path = ""
+        if missing_ids:
+            base, ext = os.path.splitext(output_path)
+            missing_ids_path = f"{base}_brakujace_id.csv"
+            try:
+                with open(missing_ids_path, 'w', newline='', encoding='utf-8-sig') as f_missing:
+                    writer_missing = csv.writer(f_missing)
+                    writer_missing.writerow(['id'])
+                    for missing_id in sorted(list(missing_ids)):
+                        writer_missing.writerow([missing_id])
+                log(f"Zapisano {len(missing_ids)} brakujących ID do pliku: {os.path.basename(missing_ids_path)}")
+            except Exception as e:
+                log(f"Błąd podczas zapisywania pliku z brakującymi ID: {e}")
+
+        success_message = f"Przetwarzanie zakończone!\n\nZapisano {total_lines_added} wierszy do {os.path.basename(output_path)}."
+        if missing_ids_path:
+            success_message += f"\n\nZapisano {len(missing_ids)} brakujących ID do pliku:\n{os.path.basename(missing_ids_path)}"
+        messagebox.showinfo("Sukces", success_message)
+
+        if should_update_excel:
+            if total_lines_added > 0:
+                return update_excel_prices(output_path, excel_path, log, update_engine)
+            log("\nPominięto aktualizację Excela, ponieważ nie znaleziono żadnych produktów.")
+        return True
+
+    except Exception as e:
+        error_message = f"Wystąpił nieoczekiwany błąd podczas przetwarzania: {e}"
+        log(error_message)
+        messagebox.showerror("Błąd wykonania", error_message)
+        return False
+
+# --- Uruchamianie z wiersza poleceń (cron) ---
+
+def run_command(args):
+    # Każdy komunikat dziennika jest wypisywany (bez ograniczania częstotliwości)
+    engine = UPDATE_ENGINE_XLWINGS if args.engine == 'xlwings' else UPDATE_ENGINE_OPENPYXL
+    return run_processing(args.url or FEED_URLS, args.excel, args.output, StatusKonsoli(odstep=0),
+                          args.update_prices, engine, args.delta)
+
+
+def build_parser():
+    parser, commands = utworz_parser("Filtruje feedy *_bol.xml po ID z pliku Excel i zapisuje wynik do CSV.")
+    process = commands.add_parser('przetworz', help="pobiera feedy i zapisuje pasujące oferty do CSV")
+    process.add_argument('excel', help="plik Excel z filtrem (ID w kolumnie A)")
+    process.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help="wyjściowy plik CSV")
+    process.add_argument('--url', action='append', help="adres feedu (można podać wiele razy; domyślnie lista z programu)")
+    process.add_argument('--delta', action='store_true', help="tylko oferty zmienione od poprzedniego uruchomienia")
+    process.add_argument('--update-prices', action='store_true', help="zaktualizuj ceny w pliku Excel")
+    process.add_argument('--engine', choices=['openpyxl', 'xlwings'], default='openpyxl',
+                         help="silnik aktualizacji cen (xlwings wymaga MS Excel)")
+    process.set_defaults(polecenie=run_command)
+    return parser
+
+
+def run_window():
+    from giga_bol_okno import XmlProcessorApp
     app = XmlProcessorApp()
     app.mainloop()
 
+
+if __name__ == "__main__":
+    sys.exit(uruchom(build_parser(), run_window))
@@ -0,0 +1,125 @@
+import os
+import threading
+import customtkinter as ctk
+from tkinter import filedialog
+from postep import BuforKomunikatow
+from giga_bol import DEFAULT_OUTPUT_PATH, FEED_URLS, UPDATE_ENGINE_OPENPYXL, UPDATE_ENGINE_XLWINGS, run_processing
+
+# Okno giga_bol - importowane tylko przy uruchomieniu GUI (python giga_bol.py bez argumentów)
+
+
+class XmlProcessorApp(ctk.CTk):
+    """
+    Aplikacja GUI do przetwarzania kanałów XML, filtrowania ich na podstawie pliku Excel,
+    i zapisywania wyników do pliku CSV. Opcjonalnie aktualizuje ceny w źródłowym pliku Excel.
+    """
+    def __init__(self):
+        super().__init__()
+
+        # --- Konfiguracja okna ---
+        self.title("XML to CSV Processor (Filtr ID i Aktualizator Cen)")
+        self.geometry("650x600")
+        ctk.set_appearance_mode("System")
+        ctk.set_default_color_theme("blue")
+
+        self.grid_columnconfigure(1, weight=1)
+
+        # --- Zmienne stanu ---
+        self.excel_file_path = ctk.StringVar()
+        
+        # --- Automatyczne ustawianie ścieżki wyjściowej ---
+        self.output_csv_path = ctk.StringVar(value=DEFAULT_OUTPUT_PATH)
+        
+        self.should_update_excel = ctk.BooleanVar()
+        self.delta_mode = ctk.BooleanVar()
+
+        # --- Widżety interfejsu ---
+        # Wybór pliku Excel
+        self.excel_label = ctk.CTkLabel(self, text="Plik Excel z filtrem (ID):")
+        self.excel_label.grid(row=0, column=0, padx=20, pady=(20, 5), sticky="w")
+        self.excel_entry = ctk.CTkEntry(self, textvariable=self.excel_file_path, state="readonly", width=300)
+        self.excel_entry.grid(row=0, column=1, padx=20, pady=(20, 5), sticky="ew")
+        self.excel_button = ctk.CTkButton(self, text="Przeglądaj...", command=self.select_excel_file)
+        self.excel_button.grid(row=0, column=2, padx=20, pady=(20, 5))
+
+        # Wyświetlanie wyjściowego pliku CSV (bez możliwości zmiany przyciskiem)
+        self.output_label = ctk.CTkLabel(self, text="Wyjściowy plik CSV:")
+        self.output_label.grid(row=1, column=0, padx=20, pady=5, sticky="w")
+        self.output_entry = ctk.CTkEntry(self, textvariable=self.output_csv_path, state="readonly")
+        self.output_entry.grid(row=1, column=1, columnspan=2, padx=20, pady=5, sticky="ew")
+
+        # Checkbox aktualizacji Excela
+        self.update_excel_checkbox = ctk.CTkCheckBox(
+            self, text="Zaktualizuj ceny w pliku Excel (zachowuje formatowanie)",
+            variable=self.should_update_excel
+        )
+        self.update_excel_checkbox.grid(row=2, column=0, columnspan=3, padx=20, pady=(10, 0), sticky="w")
+
+        # Silnik aktualizacji: openpyxl zmienia tylko komórki z nową ceną (bez Excela, także poza Windows),
+        # xlwings przepisuje kolumnę przez uruchomiony MS Excel
+        self.update_engine = ctk.CTkSegmentedButton(self, values=[UPDATE_ENGINE_OPENPYXL, UPDATE_ENGINE_XLWINGS])
+        self.update_engine.grid(row=3, column=0, columnspan=3, padx=20, pady=(10, 0), sticky="w")
+        self.update_engine.set(UPDATE_ENGINE_OPENPYXL)
+
+        # Checkbox trybu delta
+        self.delta_checkbox = ctk.CTkCheckBox(
+            self, text="Tryb delta (tylko oferty zmienione od poprzedniego uruchomienia)",
+            variable=self.delta_mode
+        )
+        self.delta_checkbox.grid(row=4, column=0, columnspan=3, padx=20, pady=10, sticky="w")
+
+        # Przycisk start
+        self.start_button = ctk.CTkButton(self, text="Rozpocznij przetwarzanie", command=self.start_processing_thread, height=40)
+        self.start_button.grid(row=5, column=0, columnspan=3, padx=20, pady=20, sticky="ew")
+
+        # Pole tekstowe postępu/statusu
+        self.status_textbox = ctk.CTkTextbox(self, state="disabled", height=150)
+        self.status_textbox.grid(row=6, column=0, columnspan=3, padx=20, pady=10, sticky="nsew")
+        self.grid_rowconfigure(6, weight=1)
+        self.status_buffer = BuforKomunikatow(self, self._append_status_lines)
+        
+        # Lista URL
+        self.urls = list(FEED_URLS)
+
+    def log_status(self, message):
+        """ Dołącza wiadomość do pola statusu; komunikaty z wątku roboczego są wypisywane partiami (10 razy/s). """
+        self.status_buffer.dodaj(message)
+
+    def _append_status_lines(self, messages):
+        """ Wypisuje partię komunikatów w głównym wątku jednym wstawieniem. """
+        self.status_textbox.configure(state="normal")
+        self.status_textbox.insert("end", "\n".join(messages) + "\n")
+        self.status_textbox.configure(state="disabled")
+        self.status_textbox.see("end") # Automatyczne przewijanie
+
+    def select_excel_file(self):
+        """ Otwiera okno dialogowe do wyboru pliku Excel do filtrowania. """
+        path = filedialog.askopenfilename(
+            title="Wybierz plik Excel z filtrem",
+            filetypes=(("Pliki Excel", "*.xlsx *.xls"), ("Wszystkie pliki", "*.*"))
+        )
+        if path:
+            self.excel_file_path.set(os.path.abspath(path))
+            self.log_status(f"Wybrano plik z filtrem: {os.path.basename(path)}")
+
+    def start_processing_thread(self):
+        """ Uruchamia główną logikę przetwarzania w osobnym wątku. """
+        self.start_button.configure(state="disabled", text="Przetwarzanie...")
+        self.status_textbox.configure(state="normal")
+        self.status_textbox.delete("1.0", "end")
+        self.status_textbox.configure(state="disabled")
+        
+        thread = threading.Thread(target=self.run_processing, daemon=True)
+        thread.start()
+
+    def run_processing(self):
+        """ Główna logika aplikacji (w wątku roboczym). """
+        try:
+            run_processing(self.urls, self.excel_file_path.get(), self.output_csv_path.get(), self.log_status,
+                           self.should_update_excel.get(), self.update_engine.get(), self.delta_mode.get())
+        finally:
+            self.after(0, lambda: self.start_button.configure(state="normal", text="Rozpocznij przetwarzanie"))
+
+if __name__ == "__main__":
+    app = XmlProcessorApp()
+    app.mainloop()
@@ -1,14 +1,19 @@
-import tkinter as tk
-from tkinter import filedialog, messagebox
-import customtkinter as ctk
 import pandas as pd
 import os
 import re
 import json
-
-# --- Ustawienia CustomTkinter ---
-ctk.set_appearance_mode("System")
-ctk.set_default_color_theme("blue")
+import sys
+import time
+from postep import RaportPostepu
+# Komunikaty jak tkinter.messagebox; okno (customtkinter) jest w htmlv5_okno i ładuje się tylko dla GUI
+from konsola import StatusKonsoli, messagebox, utworz_parser, uruchom
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    # orjson jest opcjonalny - szybsze dekodowanie kolumny JSON przy łączeniu
+    json_loads = json.loads
 
 # --- Definicje Markerów i Nazw Kolumn ---
 # Używamy \u00A0 (non-breaking space) dla unikalności markera, jeśli jest to wymagane.
@@ -20,12 +25,42 @@ COMBINER_MARKER_CORE_ONLY = "___HtM1P14CEhO1D3R___" # Rdzeń markera do wyszukiw
 CSV_HTML_JSON_COLUMN_NAME = 'HTML_JSON_List'
 
 # --- Funkcja Ekstrahująca HTML ---
+
+# Wzorzec regex do znajdowania sekwencji HTML:
+# ((?:<[^>]+>\s*)+)
+# - Outer (...) creates a capturing group for the whole sequence.
+# - (?:<[^>]+>\s*) matches a single HTML tag (e.g., <p>, <div>, <span>, <br/>)
+#   followed by zero or more whitespace characters. <[^>]+> matches anything inside <...>.
+# - + after the non-capturing group means one or more such tags.
+HTML_SEQUENCE_PATTERN = re.compile(r"((?:<[^>]+>\s*)+)")
+
+def extract_html_segments(description, replacement_marker=EXTRACTOR_REPLACEMENT_MARKER):
+    """
+    Jednym przejściem finditer zwraca listę sekwencji HTML komórki (jako JSON)
+    i tekst komórki z sekwencjami zastąpionymi markerem.
+    """
+    if "<" not in description:
+        return "[]", description
+    segments = []
+    parts = []
+    position = 0
+    for match in HTML_SEQUENCE_PATTERN.finditer(description):
+        parts.append(description[position:match.start()])
+        parts.append(replacement_marker)
+        segments.append(match.group(1).strip())
+        position = match.end()
+    if not segments:
+        return "[]", description
+    parts.append(description[position:])
+    return json.dumps(segments, ensure_ascii=False), "".join(parts)
+
 def perform_extraction(input_xlsx_path, description_column_number,
                        replacement_marker=EXTRACTOR_REPLACEMENT_MARKER, progress_callback=None):
     """
     Ekstrahuje sekwencje HTML z określonej kolumny pliku XLSX.
     Zapisuje wyekstrahowany HTML jako listę stringów JSON do pliku CSV.
     Zastępuje HTML w oryginalnym pliku XLSX markerem.
+    Zwraca (ścieżka XLSX, ścieżka CSV) albo None przy błędzie.
     """
     try:
         df = pd.read_excel(input_xlsx_path, header=None)
@@ -38,56 +73,24 @@ def perform_extraction(input_xlsx_path, description_column_number,
         description_column_index = description_column_number - 1
         html_json_list_for_csv = []
         modified_descriptions_for_excel = []
-        
-        # Wzorzec regex do znajdowania sekwencji HTML:
-        # ((?:<[^>]+>\s*)+)
-        # - Outer (...) creates a capturing group for the whole sequence.
-        # - (?:<[^>]+>\s*) matches a single HTML tag (e.g., <p>, <div>, <span>, <br/>)
-        #   followed by zero or more whitespace characters. <[^>]+> matches anything inside <...>.
-        # - + after the non-capturing group means one or more such tags.
-        html_sequence_pattern = r"((?:<[^>]+>\s*)+)"
         total_rows = len(df)
+        # Jedno przejście po wartościach kolumny (zamiast df.iterrows()); pasek postępu jest
+        # odświeżany najwyżej 10 razy na sekundę, a nie dla każdego wiersza
+        raport = RaportPostepu(progress_callback, total_rows) if progress_callback else None
 
-        for index, row in df.iterrows():
-            if progress_callback:
-                progress_callback(int((index + 1) / total_rows * 100),"Przetwarzanie...")
-
-            current_cell_html_segments = []
-            if description_column_index < len(row) and pd.notna(row[description_column_index]):
-                description = str(row[description_column_index])
-                
-                # Znajdowanie wszystkich sekwencji HTML w komórce
-                # re.findall zwraca listę stringów, jeśli wzorzec ma jedną grupę przechwytującą
-                html_sequences_in_cell = re.findall(html_sequence_pattern, description)
-                
-                if html_sequences_in_cell:
-                    for seq_match in html_sequences_in_cell:
-                        cleaned_seq = seq_match.strip() # seq_match jest stringiem
-                        current_cell_html_segments.append(cleaned_seq)
-                    
-                    json_string_for_cell = json.dumps(current_cell_html_segments, ensure_ascii=False)
-                    html_json_list_for_csv.append(json_string_for_cell)
-                else:
-                    html_json_list_for_csv.append("[]") 
-                
-                # Zastępowanie sekwencji HTML markerem
-                modified_description_for_excel_cell, num_substitutions = re.subn(html_sequence_pattern, replacement_marker, description)
-                
-                # Sprawdzenie (opcjonalne, można usunąć jeśli niepotrzebne bez logowania)
-                if len(html_sequences_in_cell) != num_substitutions:
-                    # Ta sytuacja może wymagać dokładniejszej analizy wzorca regex lub danych wejściowych
-                    # W tej wersji bez logowania, po prostu kontynuujemy.
-                    pass
+        for index, value in enumerate(df.iloc[:, description_column_index].tolist()):
+            if raport:
+                raport.aktualizuj(index + 1)
 
+            if pd.notna(value):
+                json_string_for_cell, modified_description_for_excel_cell = extract_html_segments(str(value), replacement_marker)
+                html_json_list_for_csv.append(json_string_for_cell)
                 modified_descriptions_for_excel.append(modified_description_for_excel_cell)
-            else: 
+            else:
                 html_json_list_for_csv.append("[]")
-                modified_descriptions_for_excel.append(str(row.get(description_column_index, ""))) 
-            
-        while len(modified_descriptions_for_excel) < len(df):
-            modified_descriptions_for_excel.append("")
-        while len(html_json_list_for_csv) < len(df):
-            html_json_list_for_csv.append("[]")
+                modified_descriptions_for_excel.append(str(value))
+        if raport:
+            raport.zakoncz()
 
         output_xlsx_path = os.path.splitext(input_xlsx_path)[0] + "_modified.xlsx"
         modified_df = df.copy()
@@ -101,6 +104,7 @@ def perform_extraction(input_xlsx_path, description_column_number,
 
         if progress_callback: progress_callback(100, "Zakończono")
         messagebox.showinfo("Sukces ekstrakcji", f"Ekstrakcja zakończona.\nZmodyfikowany XLSX: '{output_xlsx_path}'.\nHTML JSON CSV: '{output_csv_path}'.")
+        return output_xlsx_path, output_csv_path
 
     except Exception as e:
         if progress_callback: progress_callback(100, "Błąd")
@@ -109,10 +113,48 @@ def perform_extraction(input_xlsx_path, description_column_number,
         if progress_callback: progress_callback(0, "Gotowy")
 
 # --- Funkcja Łącząca HTML ---
+
+def decode_html_segment_lists(json_strings):
+    """
+    Dekoduje kolumnę list JSON z CSV (orjson, jeśli jest dostępny).
+    Puste, nieprawidłowe lub niebędące listą wartości dają pustą listę.
+    """
+    segment_lists = []
+    for json_string in json_strings:
+        segments = []
+        if isinstance(json_string, str) and json_string.strip():
+            try:
+                loaded_json = json_loads(json_string)
+                if isinstance(loaded_json, list):
+                    segments = loaded_json
+            except ValueError:
+                pass
+        segment_lists.append(segments)
+    return segment_lists
+
+def strip_text_columns(df):
+    """Usuwa białe znaki z brzegów tekstów - tylko w kolumnach tekstowych, operacjami wektorowymi."""
+    for column in df.columns:
+        values = df[column]
+        if values.dtype != object and not pd.api.types.is_string_dtype(values):
+            continue
+        try:
+            stripped = values.str.strip()
+        except AttributeError:
+            # Kolumna object bez żadnych tekstów
+            continue
+        # .str.strip() daje NA dla wartości niebędących tekstem - te zostają bez zmian
+        df[column] = stripped.where(stripped.notna(), values)
+    return df
+
 def perform_combination(xlsx_path, csv_path, column_number, output_xlsx_path=None,
                         marker_full_complex=COMBINER_MARKER_FULL_COMPLEX,
                         marker_core_only=COMBINER_MARKER_CORE_ONLY,
                         progress_callback=None):
+    """
+    Wstawia segmenty HTML z kolumny JSON pliku CSV w miejsce markerów w kolumnie column_number pliku XLSX.
+    Zwraca ścieżkę pliku wynikowego albo None przy błędzie.
+    """
     try:
         df_opisy = pd.read_excel(xlsx_path, header=None)
         df_html_csv = pd.read_csv(csv_path, encoding='utf-8-sig', keep_default_na=False, na_filter=False)
@@ -177,44 +219,27 @@ def perform_combination(xlsx_path, csv_path, column_number, output_xlsx_path=Non
             return "".join(new_cell_elements)
 
         target_column_index_in_xlsx = column_number - 1
-        processed_xlsx_column_data = []
         total_rows = len(df_opisy)
+        raport = RaportPostepu(progress_callback, total_rows) if progress_callback else None
+        start_time = time.perf_counter()
 
-        for xlsx_row_idx in range(total_rows):
-            if progress_callback:
-                progress_callback(int((xlsx_row_idx + 1) / total_rows * 100), "Przetwarzanie...")
-
-            excel_cell_content = str(df_opisy.iloc[xlsx_row_idx, target_column_index_in_xlsx])
-            html_segments_for_current_cell = []
-
-            if xlsx_row_idx < len(df_html_csv):
-                if CSV_HTML_JSON_COLUMN_NAME in df_html_csv.columns:
-                    json_string_from_csv = df_html_csv.loc[xlsx_row_idx, CSV_HTML_JSON_COLUMN_NAME]
-                    try:
-                        if json_string_from_csv and isinstance(json_string_from_csv, str) and json_string_from_csv.strip():
-                            loaded_json = json.loads(json_string_from_csv)
-                            if isinstance(loaded_json, list):
-                                html_segments_for_current_cell = loaded_json
-                            else:
-                                html_segments_for_current_cell = []
-                        else:
-                            html_segments_for_current_cell = [] 
-                    except json.JSONDecodeError:
-                        html_segments_for_current_cell = []
-                else:
-                     html_segments_for_current_cell = []
-            else:
-                html_segments_for_current_cell = []
-            
-            processed_cell = replace_markers_in_cell(excel_cell_content, html_segments_for_current_cell, xlsx_row_idx)
-            processed_xlsx_column_data.append(processed_cell)
+        # Kolumny jako listy: segmenty HTML z CSV są dekodowane hurtowo, a wiersze łączone przez zip
+        excel_column = df_opisy.iloc[:, target_column_index_in_xlsx].tolist()
+        html_segment_lists = decode_html_segment_lists(df_html_csv[CSV_HTML_JSON_COLUMN_NAME].tolist()[:total_rows])
+        html_segment_lists.extend([[]] * (total_rows - len(html_segment_lists)))
+
+        processed_xlsx_column_data = []
+        for xlsx_row_idx, (excel_cell_content, html_segments_for_current_cell) in enumerate(zip(excel_column, html_segment_lists)):
+            if raport:
+                raport.aktualizuj(xlsx_row_idx + 1)
+            processed_xlsx_column_data.append(
+                replace_markers_in_cell(str(excel_cell_content), html_segments_for_current_cell, xlsx_row_idx))
+        if raport:
+            raport.zakoncz()
         
         df_opisy.iloc[:, target_column_index_in_xlsx] = processed_xlsx_column_data
-
-        def strip_if_string(value):
-            if isinstance(value, str): return value.strip()
-            return value
-        df_opisy = df_opisy.applymap(strip_if_string)
+        strip_text_columns(df_opisy)
+        rows_per_second = int(total_rows / max(time.perf_counter() - start_time, 1e-9))
 
         output_file_name = os.path.splitext(xlsx_path)[0] + "_combined_data.xlsx"
         if output_xlsx_path:
@@ -222,8 +247,9 @@ def perform_combination(xlsx_path, csv_path, column_number, output_xlsx_path=Non
 
         df_opisy.to_excel(output_file_name, index=False, header=False)
         
-        if progress_callback: progress_callback(100, "Zakończono")
-        messagebox.showinfo("Sukces łączenia", f"Dane połączone.\nPlik wynikowy: '{output_file_name}'.")
+        if progress_callback: progress_callback(100, f"Zakończono, {rows_per_second} wierszy/s")
+        messagebox.showinfo("Sukces łączenia", f"Dane połączone ({total_rows} wierszy, {rows_per_second} wierszy/s).\nPlik wynikowy: '{output_file_name}'.")
+        return output_file_name
 
     except ValueError as ve:
         if progress_callback: progress_callback(100, "Błąd")
@@ -234,173 +260,44 @@ def perform_combination(xlsx_path, csv_path, column_number, output_xlsx_path=Non
     finally:
         if progress_callback: progress_callback(0, "Gotowy")
 
-# --- Główna Aplikacja Launchera ---
-class AppLauncher(ctk.CTk):
-    def __init__(self):
-        super().__init__()
-        self.title("Narzędzia Excel - HTML (v3.0 - Bez Logowania)")
-        window_width = 750
-        window_height = 520
-        self.geometry(f"{window_width}x{window_height}")
-        self.center_window(window_width, window_height)
-        
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(1, weight=1)
-
-        self.operation_frame = ctk.CTkFrame(self)
-        self.operation_frame.grid(row=0, column=0, padx=20, pady=(20,10), sticky="ew")
-        
-        self.operation_label = ctk.CTkLabel(self.operation_frame, text="Wybierz operację:", font=ctk.CTkFont(size=14, weight="bold"))
-        self.operation_label.pack(side="left", padx=(10,10))
-        
-        self.operation_var = tk.StringVar(value="Ekstrakcja")
-        
-        self.radio_extract = ctk.CTkRadioButton(self.operation_frame, text="Ekstrahuj HTML", variable=self.operation_var, value="Ekstrakcja", command=self.update_ui)
-        self.radio_extract.pack(side="left", padx=10)
-        
-        self.radio_combine = ctk.CTkRadioButton(self.operation_frame, text="Połącz/Wstaw HTML", variable=self.operation_var, value="Łączenie", command=self.update_ui)
-        self.radio_combine.pack(side="left", padx=10)
-
-        self.content_frame = ctk.CTkFrame(self, fg_color="transparent")
-        self.content_frame.grid(row=1, column=0, padx=20, pady=10, sticky="nsew")
-        self.content_frame.grid_columnconfigure(0, weight=1)
-        self.content_frame.grid_rowconfigure(0, weight=1)
-
-        self.extract_ui_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        self.combine_ui_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-
-        self.progress_label = ctk.CTkLabel(self, text="Gotowy", font=ctk.CTkFont(size=10))
-        self.progress_label.grid(row=2, column=0, padx=20, pady=(5,0), sticky="ew")
-
-        self.progressbar = ctk.CTkProgressBar(self, mode="determinate")
-        self.progressbar.set(0)
-        self.progressbar.grid(row=3, column=0, padx=20, pady=(0,10), sticky="ew")
-
-        self.run_button = ctk.CTkButton(self, text="Uruchom wybraną operację", height=40, command=self.run_selected_operation)
-        self.run_button.grid(row=4, column=0, padx=20, pady=(10,20), sticky="ew")
-        
-        self.update_ui()
-
-    def center_window(self, width, height):
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        x = (screen_width // 2) - (width // 2)
-        y = (screen_height // 2) - (height // 2)
-        self.geometry(f'{width}x{height}+{x}+{y}')
-
-    def update_progress(self, value, text):
-        self.progressbar.set(value / 100)
-        self.progress_label.configure(text=f"{text} ({value}%)")
-        self.update_idletasks()
-
-    def setup_extract_ui(self):
-        if hasattr(self, 'extract_ui_frame') and self.extract_ui_frame.winfo_exists():
-            self.extract_ui_frame.destroy()
-            
-        self.extract_ui_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        self.extract_ui_frame.grid(row=0, column=0, sticky="nsew")
-        self.extract_ui_frame.grid_columnconfigure(1, weight=1)
-
-        title = ctk.CTkLabel(self.extract_ui_frame, text="Ekstrakcja HTML z pliku XLSX", font=ctk.CTkFont(size=16, weight="bold"))
-        title.grid(row=0, column=0, columnspan=3, pady=(10,15), padx=20, sticky="ew")
-
-        ctk.CTkLabel(self.extract_ui_frame, text="Plik XLSX do przetworzenia:", anchor="w").grid(row=1, column=0, padx=(20,5), pady=5, sticky="w")
-        self.extract_xlsx_entry = ctk.CTkEntry(self.extract_ui_frame, placeholder_text="Ścieżka do pliku .xlsx")
-        self.extract_xlsx_entry.grid(row=1, column=1, padx=(0,5), pady=5, sticky="ew")
-        ctk.CTkButton(self.extract_ui_frame, text="Przeglądaj...", width=100, command=lambda: self.browse_file_for_entry(self.extract_xlsx_entry, "xlsx")).grid(row=1, column=2, padx=(0,20), pady=5, sticky="e")
-
-        ctk.CTkLabel(self.extract_ui_frame, text="Numer kolumny z opisami (od 1):", anchor="w").grid(row=2, column=0, padx=(20,5), pady=(5,20), sticky="w")
-        self.extract_column_entry = ctk.CTkEntry(self.extract_ui_frame, width=120)
-        self.extract_column_entry.grid(row=2, column=1, padx=(0,5), pady=(5,20), sticky="w")
-
-    def setup_combine_ui(self):
-        if hasattr(self, 'combine_ui_frame') and self.combine_ui_frame.winfo_exists():
-            self.combine_ui_frame.destroy()
-            
-        self.combine_ui_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        self.combine_ui_frame.grid(row=0, column=0, sticky="nsew")
-        self.combine_ui_frame.grid_columnconfigure(1, weight=1)
-
-        title = ctk.CTkLabel(self.combine_ui_frame, text="Łączenie danych i wstawianie HTML", font=ctk.CTkFont(size=16, weight="bold"))
-        title.grid(row=0, column=0, columnspan=3, pady=(10,15), padx=20, sticky="ew")
-
-        ctk.CTkLabel(self.combine_ui_frame, text="Plik XLSX z markerami:", anchor="w").grid(row=1, column=0, padx=(20,5), pady=5, sticky="w")
-        self.combine_xlsx_entry = ctk.CTkEntry(self.combine_ui_frame, placeholder_text="Ścieżka do pliku .xlsx (zmodyfikowany)")
-        self.combine_xlsx_entry.grid(row=1, column=1, padx=(0,5), pady=5, sticky="ew")
-        ctk.CTkButton(self.combine_ui_frame, text="Przeglądaj...", width=100, command=lambda: self.browse_file_for_entry(self.combine_xlsx_entry, "xlsx")).grid(row=1, column=2, padx=(0,20), pady=5, sticky="e")
-
-        ctk.CTkLabel(self.combine_ui_frame, text="Plik CSV z HTML (JSON):", anchor="w").grid(row=2, column=0, padx=(20,5), pady=5, sticky="w")
-        self.combine_csv_entry = ctk.CTkEntry(self.combine_ui_frame, placeholder_text="Ścieżka do pliku .csv (z JSON)")
-        self.combine_csv_entry.grid(row=2, column=1, padx=(0,5), pady=5, sticky="ew")
-        ctk.CTkButton(self.combine_ui_frame, text="Przeglądaj...", width=100, command=lambda: self.browse_file_for_entry(self.combine_csv_entry, "csv")).grid(row=2, column=2, padx=(0,20), pady=5, sticky="e")
-
-        ctk.CTkLabel(self.combine_ui_frame, text="Numer kolumny do podmiany (od 1):", anchor="w").grid(row=3, column=0, padx=(20,5), pady=(5,20), sticky="w")
-        self.combine_column_entry = ctk.CTkEntry(self.combine_ui_frame, width=120)
-        self.combine_column_entry.grid(row=3, column=1, padx=(0,5), pady=(5,20), sticky="w")
-
-    def update_ui(self):
-        self.update_progress(0, "Gotowy")
-        operation = self.operation_var.get()
-        
-        self.extract_ui_frame.grid_remove()
-        self.combine_ui_frame.grid_remove()
-
-        if operation == "Ekstrakcja":
-            self.setup_extract_ui()
-            self.extract_ui_frame.grid()
-        elif operation == "Łączenie":
-            self.setup_combine_ui()
-            self.combine_ui_frame.grid()
-
-    def browse_file_for_entry(self, entry_widget, file_type):
-        if file_type == "xlsx": filetypes = [("Pliki Excel", "*.xlsx"), ("Wszystkie pliki", "*.*")]
-        elif file_type == "csv": filetypes = [("Pliki CSV", "*.csv"), ("Wszystkie pliki", "*.*")]
-        else: 
-            tk.messagebox.showerror("Błąd", f"Nieobsługiwany typ pliku: {file_type}")
-            return
-            
-        filename = filedialog.askopenfilename(title=f"Wybierz plik {file_type.upper()}", filetypes=filetypes, defaultextension=f".{file_type}")
-        if filename:
-            entry_widget.delete(0, tk.END)
-            entry_widget.insert(0, filename)
-
-    def run_selected_operation(self):
-        operation = self.operation_var.get()
-        self.update_progress(0, "Rozpoczynanie...")
-        
-        if operation == "Ekstrakcja":
-            xlsx_path = self.extract_xlsx_entry.get()
-            column_str = self.extract_column_entry.get()
-            if not xlsx_path or not column_str: 
-                messagebox.showerror("Błąd danych", "Wszystkie pola dla ekstrakcji muszą być wypełnione.")
-                self.update_progress(0, "Błąd danych")
-                return
-            try: 
-                column_num = int(column_str)
-                if column_num <= 0: raise ValueError("Numer kolumny musi być dodatni.")
-            except ValueError: 
-                messagebox.showerror("Błąd danych", "Nieprawidłowy numer kolumny. Musi to być liczba dodatnia.")
-                self.update_progress(0, "Błąd danych")
-                return
-            perform_extraction(xlsx_path, column_num, progress_callback=self.update_progress)
-            
-        elif operation == "Łączenie":
-            xlsx_path = self.combine_xlsx_entry.get()
-            csv_path = self.combine_csv_entry.get()
-            column_str = self.combine_column_entry.get()
-            if not xlsx_path or not csv_path or not column_str: 
-                messagebox.showerror("Błąd danych", "Wszystkie pola dla łączenia muszą być wypełnione.")
-                self.update_progress(0, "Błąd danych")
-                return
-            try: 
-                column_num = int(column_str)
-                if column_num <= 0: raise ValueError("Numer kolumny musi być dodatni.")
-            except ValueError: 
-                messagebox.showerror("Błąd danych", "Nieprawidłowy numer kolumny. Musi to być liczba dodatnia.")
-                self.update_progress(0, "Błąd danych")
-                return
-            perform_combination(xlsx_path, csv_path, column_num, progress_callback=self.update_progress)
-
-if __name__ == "__main__":
+# --- Wiersz poleceń (cron) ---
+
+def status_postepu():
+    """progress_callback(procent, tekst) wypisujący postęp na konsolę."""
+    status = StatusKonsoli()
+    return lambda value, text: status(f"{text} ({value}%)")
+
+def numer_kolumny(tekst):
+    numer = int(tekst)
+    if numer <= 0:
+        raise ValueError("Numer kolumny musi być dodatni.")
+    return numer
+
+def polecenie_ekstrahuj(args):
+    return perform_extraction(args.xlsx, args.kolumna, progress_callback=status_postepu())
+
+def polecenie_polacz(args):
+    return perform_combination(args.xlsx, args.csv, args.kolumna, args.wynik, progress_callback=status_postepu())
+
+def zbuduj_parser():
+    parser, polecenia = utworz_parser("Ekstrakcja i ponowne wstawianie HTML w opisach plików XLSX.")
+    ekstrahuj = polecenia.add_parser('ekstrahuj', help="zapisuje <plik>_modified.xlsx z markerami i <plik>_html_json.csv")
+    ekstrahuj.add_argument('xlsx', help="plik XLSX do przetworzenia")
+    ekstrahuj.add_argument('kolumna', type=numer_kolumny, help="numer kolumny z opisami (od 1)")
+    ekstrahuj.set_defaults(polecenie=polecenie_ekstrahuj)
+
+    polacz = polecenia.add_parser('polacz', help="wstawia HTML z CSV w miejsce markerów")
+    polacz.add_argument('xlsx', help="plik XLSX z markerami")
+    polacz.add_argument('csv', help="plik CSV z HTML (JSON)")
+    polacz.add_argument('kolumna', type=numer_kolumny, help="numer kolumny do podmiany (od 1)")
+    polacz.add_argument('--wynik', help="plik wynikowy (domyślnie <plik>_combined_data.xlsx)")
+    polacz.set_defaults(polecenie=polecenie_polacz)
+    return parser
+
+def uruchom_okno():
+    from htmlv5_okno import AppLauncher
     app = AppLauncher()
     app.mainloop()
+
+if __name__ == "__main__":
+    sys.exit(uruchom(zbuduj_parser(), uruchom_okno))
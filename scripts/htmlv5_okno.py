@@ -0,0 +1,181 @@
+import tkinter as tk
+from tkinter import filedialog, messagebox
+import customtkinter as ctk
+from htmlv5 import perform_combination, perform_extraction
+
+# Okno htmlv5 - importowane tylko przy uruchomieniu GUI (python htmlv5.py bez argumentów)
+
+# --- Ustawienia CustomTkinter ---
+ctk.set_appearance_mode("System")
+ctk.set_default_color_theme("blue")
+
+# --- Główna Aplikacja Launchera ---
+class AppLauncher(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+        self.title("Narzędzia Excel - HTML (v3.0 - Bez Logowania)")
+        window_width = 750
+        window_height = 520
+        self.geometry(f"{window_width}x{window_height}")
+        self.center_window(window_width, window_height)
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self.operation_frame = ctk.CTkFrame(self)
+        self.operation_frame.grid(row=0, column=0, padx=20, pady=(20,10), sticky="ew")
+        
+        self.operation_label = ctk.CTkLabel(self.operation_frame, text="Wybierz operację:", font=ctk.CTkFont(size=14, weight="bold"))
+        self.operation_label.pack(side="left", padx=(10,10))
+        
+        self.operation_var = tk.StringVar(value="Ekstrakcja")
+        
+        self.radio_extract = ctk.CTkRadioButton(self.operation_frame, text="Ekstrahuj HTML", variable=self.operation_var, value="Ekstrakcja", command=self.update_ui)
+        self.radio_extract.pack(side="left", padx=10)
+        
+        self.radio_combine = ctk.CTkRadioButton(self.operation_frame, text="Połącz/Wstaw HTML", variable=self.operation_var, value="Łączenie", command=self.update_ui)
+        self.radio_combine.pack(side="left", padx=10)
+
+        self.content_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.content_frame.grid(row=1, column=0, padx=20, pady=10, sticky="nsew")
+        self.content_frame.grid_columnconfigure(0, weight=1)
+        self.content_frame.grid_rowconfigure(0, weight=1)
+
+        self.extract_ui_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self.combine_ui_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+
+        self.progress_label = ctk.CTkLabel(self, text="Gotowy", font=ctk.CTkFont(size=10))
+        self.progress_label.grid(row=2, column=0, padx=20, pady=(5,0), sticky="ew")
+
+        self.progressbar = ctk.CTkProgressBar(self, mode="determinate")
+        self.progressbar.set(0)
+        self.progressbar.grid(row=3, column=0, padx=20, pady=(0,10), sticky="ew")
+
+        self.run_button = ctk.CTkButton(self, text="Uruchom wybraną operację", height=40, command=self.run_selected_operation)
+        self.run_button.grid(row=4, column=0, padx=20, pady=(10,20), sticky="ew")
+        
+        self.update_ui()
+
+    def center_window(self, width, height):
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        x = (screen_width // 2) - (width // 2)
+        y = (screen_height // 2) - (height // 2)
+        self.geometry(f'{width}x{height}+{x}+{y}')
+
+    def update_progress(self, value, text):
+        self.progressbar.set(value / 100)
+        self.progress_label.configure(text=f"{text} ({value}%)")
+        self.update_idletasks()
+
+    def setup_extract_ui(self):
+        if hasattr(self, 'extract_ui_frame') and self.extract_ui_frame.winfo_exists():
+            self.extract_ui_frame.destroy()
+            
+        self.extract_ui_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self.extract_ui_frame.grid(row=0, column=0, sticky="nsew")
+        self.extract_ui_frame.grid_columnconfigure(1, weight=1)
+
+        title = ctk.CTkLabel(self.extract_ui_frame, text="Ekstrakcja HTML z pliku XLSX", font=ctk.CTkFont(size=16, weight="bold"))
+        title.grid(row=0, column=0, columnspan=3, pady=(10,15), padx=20, sticky="ew")
+
+        ctk.CTkLabel(self.extract_ui_frame, text="Plik XLSX do przetworzenia:", anchor="w").grid(row=1, column=0, padx=(20,5), pady=5, sticky="w")
+        self.extract_xlsx_entry = ctk.CTkEntry(self.extract_ui_frame, placeholder_text="Ścieżka do pliku .xlsx")
+        self.extract_xlsx_entry.grid(row=1, column=1, padx=(0,5), pady=5, sticky="ew")
+        ctk.CTkButton(self.extract_ui_frame, text="Przeglądaj...", width=100, command=lambda: self.browse_file_for_entry(self.extract_xlsx_entry, "xlsx")).grid(row=1, column=2, padx=(0,20), pady=5, sticky="e")
+
+        ctk.CTkLabel(self.extract_ui_frame, text="Numer kolumny z opisami (od 1):", anchor="w").grid(row=2, column=0, padx=(20,5), pady=(5,20), sticky="w")
+        self.extract_column_entry = ctk.CTkEntry(self.extract_ui_frame, width=120)
+        self.extract_column_entry.grid(row=2, column=1, padx=(0,5), pady=(5,20), sticky="w")
+
+    def setup_combine_ui(self):
+        if hasattr(self, 'combine_ui_frame') and self.combine_ui_frame.winfo_exists():
+            self.combine_ui_frame.destroy()
+            
+        self.combine_ui_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self.combine_ui_frame.grid(row=0, column=0, sticky="nsew")
+        self.combine_ui_frame.grid_columnconfigure(1, weight=1)
+
+        title = ctk.CTkLabel(self.combine_ui_frame, text="Łączenie danych i wstawianie HTML", font=ctk.CTkFont(size=16, weight="bold"))
+        title.grid(row=0, column=0, columnspan=3, pady=(10,15), padx=20, sticky="ew")
+
+        ctk.CTkLabel(self.combine_ui_frame, text="Plik XLSX z markerami:", anchor="w").grid(row=1, column=0, padx=(20,5), pady=5, sticky="w")
+        self.combine_xlsx_entry = ctk.CTkEntry(self.combine_ui_frame, placeholder_text="Ścieżka do pliku .xlsx (zmodyfikowany)")
+        self.combine_xlsx_entry.grid(row=1, column=1, padx=(0,5), pady=5, sticky="ew")
+        ctk.CTkButton(self.combine_ui_frame, text="Przeglądaj...", width=100, command=lambda: self.browse_file_for_entry(self.combine_xlsx_entry, "xlsx")).grid(row=1, column=2, padx=(0,20), pady=5, sticky="e")
+
+        ctk.CTkLabel(self.combine_ui_frame, text="Plik CSV z HTML (JSON):", anchor="w").grid(row=2, column=0, padx=(20,5), pady=5, sticky="w")
+        self.combine_csv_entry = ctk.CTkEntry(self.combine_ui_frame, placeholder_text="Ścieżka do pliku .csv (z JSON)")
+        self.combine_csv_entry.grid(row=2, column=1, padx=(0,5), pady=5, sticky="ew")
+        ctk.CTkButton(self.combine_ui_frame, text="Przeglądaj...", width=100, command=lambda: self.browse_file_for_entry(self.combine_csv_entry, "csv")).grid(row=2, column=2, padx=(0,20), pady=5, sticky="e")
+
+        ctk.CTkLabel(self.combine_ui_frame, text="Numer kolumny do podmiany (od 1):", anchor="w").grid(row=3, column=0, padx=(20,5), pady=(5,20), sticky="w")
+        self.combine_column_entry = ctk.CTkEntry(self.combine_ui_frame, width=120)
+        self.combine_column_entry.grid(row=3, column=1, padx=(0,5), pady=(5,20), sticky="w")
+
+    def update_ui(self):
+        self.update_progress(0, "Gotowy")
+        operation = self.operation_var.get()
+        
+        self.extract_ui_frame.grid_remove()
+        self.combine_ui_frame.grid_remove()
+
+        if operation == "Ekstrakcja":
+            self.setup_extract_ui()
+            self.extract_ui_frame.grid()
+        elif operation == "Łączenie":
+            self.setup_combine_ui()
+            self.combine_ui_frame.grid()
+
+    def browse_file_for_entry(self, entry_widget, file_type):
+        if file_type == "xlsx": filetypes = [("Pliki Excel", "*.xlsx"), ("Wszystkie pliki", "*.*")]
+        elif file_type == "csv": filetypes = [("Pliki CSV", "*.csv"), ("Wszystkie pliki", "*.*")]
+        else: 
+            tk.messagebox.showerror("Błąd", f"Nieobsługiwany typ pliku: {file_type}")
+            return
+            
+        filename = filedialog.askopenfilename(title=f"Wybierz plik {file_type.upper()}", filetypes=filetypes, defaultextension=f".{file_type}")
+        if filename:
+            entry_widget.delete(0, tk.END)
+            entry_widget.insert(0, filename)
+
+    def run_selected_operation(self):
+        operation = self.operation_var.get()
+        self.update_progress(0, "Rozpoczynanie...")
+        
+        if operation == "Ekstrakcja":
+            xlsx_path = self.extract_xlsx_entry.get()
+            column_str = self.extract_column_entry.get()
+            if not xlsx_path or not column_str: 
+                messagebox.showerror("Błąd danych", "Wszystkie pola dla ekstrakcji muszą być wypełnione.")
+                self.update_progress(0, "Błąd danych")
+                return
+            try: 
+                column_num = int(column_str)
+                if column_num <= 0: raise ValueError("Numer kolumny musi być dodatni.")
+            except ValueError: 
+                messagebox.showerror("Błąd danych", "Nieprawidłowy numer kolumny. Musi to być liczba dodatnia.")
+                self.update_progress(0, "Błąd danych")
+                return
+            perform_extraction(xlsx_path, column_num, progress_callback=self.update_progress)
+            
+        elif operation == "Łączenie":
+            xlsx_path = self.combine_xlsx_entry.get()
+            csv_path = self.combine_csv_entry.get()
+            column_str = self.combine_column_entry.get()
+            if not xlsx_path or not csv_path or not column_str: 
+                messagebox.showerror("Błąd danych", "Wszystkie pola dla łączenia muszą być wypełnione.")
+                self.update_progress(0, "Błąd danych")
+                return
+            try: 
+                column_num = int(column_str)
+                if column_num <= 0: raise ValueError("Numer kolumny musi być dodatni.")
+            except ValueError: 
+                messagebox.showerror("Błąd danych", "Nieprawidłowy numer kolumny. Musi to być liczba dodatnia.")
+                self.update_progress(0, "Błąd danych")
+                return
+            perform_combination(xlsx_path, csv_path, column_num, progress_callback=self.update_progress)
+
+if __name__ == "__main__":
+    app = AppLauncher()
+    app.mainloop()
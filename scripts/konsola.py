@@ -0,0 +1,158 @@
+import argparse
+import re
+import sys
+import time
+
+# Wspólne uruchamianie skryptów bez okna (cron, przetwarzanie wsadowe): xmlcsv2, giga_bol,
+# cdon_for_dawid, dziel_lacz, poprawa_znak, htmlv5. Uruchomiony bez argumentów skrypt otwiera okno
+# jak dotąd (tak startuje go PythonRunner); z poleceniem wykonuje je bez importowania
+# customtkinter/tkinter. Silniki zgłaszają komunikaty przez konsola.messagebox - w oknie są to
+# zwykłe okna dialogowe tkinter, w trybie konsolowym wiersze na stdout/stderr.
+
+ODSTEP_STATUSU = 1.0  # s - powtarzające się komunikaty postępu są wypisywane najwyżej raz na sekundę
+KOD_SUKCESU = 0
+KOD_BLEDU = 1
+KOD_PRZERWANIA = 130
+
+_WZORZEC_LICZB = re.compile(r'\d+')
+# Ostatni komunikat statusu pominięty przez StatusKonsoli: (tekst, strumien) albo None
+_zalegly_status = None
+
+
+def _wypisz_zalegly_status():
+    global _zalegly_status
+    if _zalegly_status is not None:
+        tekst, strumien = _zalegly_status
+        _zalegly_status = None
+        print(tekst, file=strumien or sys.stdout, flush=True)
+
+
+def wypisz(tekst, strumien=None):
+    """
+    Wypisuje wiersz od razu (bez buforowania do końca zadania, gdy wyjście trafia do pliku).
+    Wcześniej wypisuje pominięty komunikat statusu, aby stan końcowy pętli był przed kolejnymi wierszami.
+    """
+    _wypisz_zalegly_status()
+    strumien = strumien or sys.stdout
+    print(tekst, file=strumien, flush=True)
+
+
+class Komunikaty:
+    """
+    Zamiennik tkinter.messagebox dla silników skryptów. Dopóki konsola jest False, wywołania
+    trafiają do tkinter.messagebox (importowanego dopiero przy pierwszym komunikacie).
+    W trybie konsolowym komunikaty są wypisywane, a pytania dostają odpowiedź odpowiedz_tak.
+    """
+
+    def __init__(self):
+        self.konsola = False
+        self.odpowiedz_tak = False
+
+    def _okna(self):
+        from tkinter import messagebox
+        return messagebox
+
+    def _wypisz(self, rodzaj, title, message, strumien):
+        wypisz(f"{rodzaj}{title}: {message}", strumien)
+
+    def showinfo(self, title=None, message=None, **opcje):
+        if not self.konsola:
+            return self._okna().showinfo(title, message, **opcje)
+        self._wypisz("", title, message, sys.stdout)
+        return "ok"
+
+    def showwarning(self, title=None, message=None, **opcje):
+        if not self.konsola:
+            return self._okna().showwarning(title, message, **opcje)
+        self._wypisz("UWAGA - ", title, message, sys.stderr)
+        return "ok"
+
+    def showerror(self, title=None, message=None, **opcje):
+        if not self.konsola:
+            return self._okna().showerror(title, message, **opcje)
+        self._wypisz("BŁĄD - ", title, message, sys.stderr)
+        return "ok"
+
+    def askyesno(self, title=None, message=None, **opcje):
+        if not self.konsola:
+            return self._okna().askyesno(title, message, **opcje)
+        odpowiedz = "tak" if self.odpowiedz_tak else "nie (użyj --tak, aby potwierdzać)"
+        self._wypisz("", title, f"{message} -> {odpowiedz}", sys.stderr)
+        return self.odpowiedz_tak
+
+    def askokcancel(self, title=None, message=None, **opcje):
+        if not self.konsola:
+            return self._okna().askokcancel(title, message, **opcje)
+        return self.askyesno(title, message)
+
+
+messagebox = Komunikaty()
+
+
+class StatusKonsoli:
+    """
+    Wypisuje komunikaty statusu, które w oknie trafiają na etykietę. Kolejne komunikaty różniące
+    się tylko liczbami (np. "Pobieranie: 3/17 plików, 12.5 MB...") są wypisywane najwyżej raz
+    na odstep sekund. Ostatni pominięty komunikat jest wypisywany przed każdym następnym
+    wierszem (i na końcu polecenia), więc stan końcowy pętli (np. "78/78") nie ginie w odstępie.
+    """
+
+    def __init__(self, odstep=ODSTEP_STATUSU, strumien=None):
+        self.odstep = odstep
+        self.strumien = strumien
+        self._ostatni_wzorzec = None
+        self._ostatni_czas = 0.0
+        self._ostatni_komunikat = None
+
+    def __call__(self, komunikat, postep=None):
+        global _zalegly_status
+        komunikat = str(komunikat).strip()
+        if not komunikat or komunikat == self._ostatni_komunikat:
+            return
+        wzorzec = _WZORZEC_LICZB.sub('#', komunikat)
+        teraz = time.monotonic()
+        if wzorzec == self._ostatni_wzorzec:
+            if teraz - self._ostatni_czas < self.odstep:
+                _zalegly_status = (komunikat, self.strumien)
+                return
+            # Nowszy stan tego samego postępu zastępuje pominięty
+            _zalegly_status = None
+        self._ostatni_wzorzec = wzorzec
+        self._ostatni_czas = teraz
+        self._ostatni_komunikat = komunikat
+        wypisz(komunikat, self.strumien)
+
+
+def utworz_parser(opis):
+    """Parser z poleceniami (add_subparsers) i wspólną opcją --tak."""
+    parser = argparse.ArgumentParser(
+        description=f"{opis} Bez argumentów otwiera okno programu.")
+    parser.add_argument('-y', '--tak', action='store_true',
+                        help="odpowiada 'tak' na pytania (np. o nadpisanie istniejącego pliku)")
+    polecenia = parser.add_subparsers(title="polecenia", dest='nazwa_polecenia', metavar='POLECENIE')
+    polecenia.required = True
+    return parser, polecenia
+
+
+def uruchom(parser, uruchom_okno, argv=None):
+    """
+    Bez argumentów wywołuje uruchom_okno() (import GUI dopiero tam). Z argumentami przełącza
+    komunikaty na konsolę i wykonuje args.polecenie(args). Zwraca kod wyjścia: 0, gdy polecenie
+    zwróciło wartość prawdziwą, 1 przy błędzie, 130 po przerwaniu (Ctrl+C).
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        uruchom_okno()
+        return KOD_SUKCESU
+
+    args = parser.parse_args(argv)
+    messagebox.konsola = True
+    messagebox.odpowiedz_tak = args.tak
+    try:
+        wynik = args.polecenie(args)
+    except KeyboardInterrupt:
+        wypisz("Przerwano.", sys.stderr)
+        return KOD_PRZERWANIA
+    finally:
+        _wypisz_zalegly_status()
+    return KOD_SUKCESU if wynik else KOD_BLEDU
@@ -0,0 +1,195 @@
+import re
+
+# Wspólna korekta znaków dla poprawa_znak i tłumaczenia v2: zamiana błędnych encji/sekwencji
+# na polskie znaki, usunięcie emoji i wiodących białych znaków.
+# Wszystkie klucze mapy są zamieniane jednym skompilowanym wyrażeniem (najdłuższe najpierw),
+# więc komórka jest skanowana raz, a nie osobno dla każdego klucza.
+
+# Wzorzec Regex do usuwania większości znaków emoji
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emotikony
+    "\U0001F300-\U0001F5FF"  # symbole i piktogramy
+    "\U0001F680-\U0001F6FF"  # transport i symbole map
+    "\U0001F700-\U0001F77F"  # symbole alchemiczne
+    "\U0001F780-\U0001F7FF"  # Rozszerzone kształty geometryczne
+    "\U0001F800-\U0001F8FF"  # Dodatkowe strzałki-C
+    "\U0001F900-\U0001F9FF"  # Dodatkowe symbole i piktogramy
+    "\U0001FA00-\U0001FA6F"  # Symbole szachowe
+    "\U0001FA70-\U0001FAFF"  # Symbole i piktogramy rozszerzone-A
+    "\U00002702-\U000027B0"  # Dingbaty
+    "\U000024C2-\U0001F251"
+    "\U0001f926-\U0001f937"
+    "\U00010000-\U0010ffff"
+    "\u2640-\u2642"
+    "\u2600-\u2B55"
+    "\u200d"
+    "\u23cf"
+    "\u23e9"
+    "\u231a"
+    "\ufe0f"  # selektor wariacji
+    "\u3030"
+    "]+",
+    flags=re.UNICODE,
+)
+
+# Słownik mapujący nieprawidłowe znaki/encje na poprawne polskie litery i symbole.
+POLISH_CHAR_MAP = {
+    # Złożone/długie encje jako pierwsze
+    '&#378;ó&#322;ty': 'żółty',
+
+    # Nazwane encje HTML (Wielkie litery)
+    '&Aacute;': 'Ą', '&Cacute;': 'Ć', '&Eacute;': 'Ę', '&Lacute;': 'Ł',
+    '&Nacute;': 'Ń', '&Oacute;': 'Ó', '&Sacute;': 'Ś', '&Zacute;': 'Ź',
+    '&Zdot;': 'Ż',
+
+    # Nazwane encje HTML (Małe litery)
+    '&aacute;': 'ą', '&cacute;': 'ć', '&eacute;': 'ę', '&lacute;': 'ł',
+    '&nacute;': 'ń', '&oacute;': 'ó', '&sacute;': 'ś', '&zacute;': 'ź',
+    '&zdot;': 'ż',
+
+    # Numeryczne encje HTML (Wielkie litery)
+    '&#260;': 'Ą', '&#262;': 'Ć', '&#280;': 'Ę', '&#321;': 'Ł',
+    '&#323;': 'Ń', '&#211;': 'Ó', '&#346;': 'Ś', '&#377;': 'Ź',
+    '&#379;': 'Ż',
+
+    # Numeryczne encje HTML (Małe litery)
+    '&#261;': 'ą', '&#263;': 'ć', '&#281;': 'ę', '&#322;': 'ł',
+    '&#324;': 'ń', '&#243;': 'ó', '&#347;': 'ś', '&#378;': 'ź',
+    '&#380;': 'ż',
+    
+    # Inne popularne symbole i encje
+    '&deg;': '°', '&bull;': '•', '&ndash;': '–', '&rsquo;': '’',
+    '&bdquo;': '„', '&rdquo;': '”', '&#10036;&#65039;': '', '&#10035;&#65039;': '',
+    '&#9851;&#65039;': '', '&#128209;': '', '&#8222;': '„', '&#8221;': '”',
+    '&#8216;': '‘', '&#8217;': '’', '&#8211;': '–', '&#8203;': '',
+    '&#9989;': '', '&#9749;': '', '&#11088;': '', '&#10003;': '',
+    '&#34;': '"', '&#39;': "'", '&#x2013;': '–', '&#2013;': '–',
+    '&#2019;': '’', '&nbsp;': ' ', '&amp;': '&', '&lt;': '<',
+    '&gt;': '>', '&quot;': '"', '&apos;': "'", '&#178;': '²',
+    '&#8220;': '“', '&#8230;': '…', '&#9679;': '•',
+
+    # Znaki do usunięcia
+    '✔': '', '✅': '', '❓': '', '▶️': '', '⭐': '', '⚡': '', '➡': '',
+}
+# Kolejność oryginalnego algorytmu: najpierw dłuższe klucze
+POLISH_CHAR_MAP_SORTED = dict(sorted(POLISH_CHAR_MAP.items(), key=lambda item: len(item[0]), reverse=True))
+
+
+def _klucze_kaskadowe(mapa_posortowana):
+    """
+    Klucze, które w algorytmie sekwencyjnym powstają dopiero po wcześniejszej zamianie,
+    np. '&amp;lt;' -> '&lt;' -> '<'. Dodane do wyrażenia dają ten sam wynik w jednym przebiegu.
+    """
+    klucze = list(mapa_posortowana)
+    kaskadowe = {}
+    for i, klucz in enumerate(klucze):
+        wartosc = mapa_posortowana[klucz]
+        if not wartosc:
+            continue
+        for pozniejszy in klucze[i + 1:]:
+            if len(pozniejszy) > len(wartosc) and pozniejszy.startswith(wartosc):
+                kaskadowe.setdefault(klucz + pozniejszy[len(wartosc):], mapa_posortowana[pozniejszy])
+    return kaskadowe
+
+
+_MAPA_ZAMIAN = dict(POLISH_CHAR_MAP_SORTED)
+for _klucz, _wartosc in _klucze_kaskadowe(POLISH_CHAR_MAP_SORTED).items():
+    _MAPA_ZAMIAN.setdefault(_klucz, _wartosc)
+
+
+def _wyrazenie_drzewa(klucze):
+    """
+    Buduje wyrażenie regularne w postaci drzewa prefiksów (wspólne początki kluczy, np. '&#', są
+    sprawdzane raz). Gałęzie są zachłanne, więc na danej pozycji wygrywa najdłuższy klucz.
+    """
+    drzewo = {}
+    for klucz in klucze:
+        wezel = drzewo
+        for znak in klucz:
+            wezel = wezel.setdefault(znak, {})
+        wezel[''] = {}
+
+    def zbuduj(wezel):
+        koniec = '' in wezel
+        galezie = [re.escape(znak) + zbuduj(dalej) for znak, dalej in sorted(wezel.items()) if znak]
+        if not galezie:
+            return ''
+        if len(galezie) == 1 and not koniec:
+            return galezie[0]
+        alternatywa = '(?:' + '|'.join(galezie) + ')'
+        return alternatywa + '?' if koniec else alternatywa
+
+    return re.compile(zbuduj(drzewo))
+
+
+# Jedno wyrażenie ze wszystkimi kluczami - komórka jest skanowana raz
+WZORZEC_ZAMIAN = _wyrazenie_drzewa(_MAPA_ZAMIAN)
+
+# Najmniejszy znak, jaki może dopasować EMOJI_PATTERN; tekst bez znaków od tego progu
+# (zwykły polski tekst) nie musi być przeszukiwany wzorcem emoji
+_PROG_EMOJI = next(chr(kod) for kod in range(0x110000) if EMOJI_PATTERN.match(chr(kod)))
+
+# Usunięcie klucza (zamiana na '') może skleić sąsiednie znaki w nowy klucz, np. '&&#8203;lt;'.
+# Takie (rzadkie) komórki poprawiamy algorytmem sekwencyjnym, aby wynik był identyczny.
+_ZNAKI_KLUCZY = frozenset(znak for klucz in POLISH_CHAR_MAP if len(klucz) > 1 for znak in klucz)
+
+
+class _Sklejenie(Exception):
+    pass
+
+
+def _zamien(dopasowanie):
+    wartosc = _MAPA_ZAMIAN[dopasowanie.group()]
+    if not wartosc:
+        tekst = dopasowanie.string
+        poczatek, koniec = dopasowanie.span()
+        if 0 < poczatek and koniec < len(tekst) and tekst[poczatek - 1] in _ZNAKI_KLUCZY and tekst[koniec] in _ZNAKI_KLUCZY:
+            raise _Sklejenie
+    return wartosc
+
+
+def _popraw_sekwencyjnie(text):
+    """Oryginalny algorytm: osobna zamiana dla każdego klucza (najdłuższe najpierw)."""
+    for wrong_str, correct_char in POLISH_CHAR_MAP_SORTED.items():
+        if wrong_str in text:
+            text = text.replace(wrong_str, correct_char)
+    return text
+
+
+def correct_text(text):
+    """Stosuje wszystkie zdefiniowane poprawki do pojedynczego ciągu tekstowego."""
+    if not isinstance(text, str) or not text:
+        return text
+
+    # 1. Zamień wszystkie znane nieprawidłowe sekwencje znaków (jeden przebieg)
+    try:
+        corrected_text = WZORZEC_ZAMIAN.sub(_zamien, text)
+    except _Sklejenie:
+        corrected_text = _popraw_sekwencyjnie(text)
+
+    # 2. Usuń wszystkie znaki emoji za pomocą wzorca regex
+    if not corrected_text.isascii() and max(corrected_text) >= _PROG_EMOJI:
+        corrected_text = EMOJI_PATTERN.sub('', corrected_text)
+
+    # 3. Usuń wiodące białe znaki
+    return corrected_text.lstrip()
+
+
+def correct_texts(values):
+    """
+    Poprawia całą kolumnę/listę wartości naraz i zwraca listę wyników.
+    Wartości niebędące tekstem są przepisywane bez zmian; powtarzające się teksty
+    (np. kategorie, nazwy producentów) są poprawiane tylko raz.
+    """
+    wyniki = {}
+    poprawione = []
+    for wartosc in values:
+        if isinstance(wartosc, str) and wartosc:
+            wynik = wyniki.get(wartosc)
+            if wynik is None:
+                wynik = wyniki[wartosc] = correct_text(wartosc)
+            poprawione.append(wynik)
+        else:
+            poprawione.append(wartosc)
+    return poprawione
@@ -1,24 +1,61 @@
 import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    # pyarrow jest opcjonalny - bez niego teksty są przycinane typem string pandas
+    pa = None
+    pc = None
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
 import re
+from wczytywanie_excel import wczytaj_excele
+
+def _przytnij_teksty(kolumna):
+    """Przycina teksty kolumny zawierającej wyłącznie teksty i braki; braki zamienia na ''."""
+    if pa is None:
+        return kolumna.astype('string').str.strip().fillna('')
+    # Kolumna tekstowa pyarrow: przycinanie i wypełnianie braków bez pętli w Pythonie
+    teksty = pa.array(kolumna, type=pa.string(), from_pandas=True)
+    teksty = pc.fill_null(pc.utf8_trim_whitespace(teksty), '')
+    return pd.Series(pd.arrays.ArrowStringArray(teksty), index=kolumna.index, name=kolumna.name)
 
 def usun_nadmiarowe_spacje(df):
     """
-    Usuwa białe znaki z początku i końca każdej komórki w DataFrame 
-    (tylko dla stringów w kolumnach typu object) i konwertuje 'nan' na ''.
+    Usuwa białe znaki z początku i końca tekstów w kolumnach tekstowych (object / string)
+    i zamienia brakujące wartości (NaN/None) w tych kolumnach na ''.
+    Operacje są wektorowe; liczby i daty w kolumnach mieszanych pozostają bez zmian,
+    a komórka z tekstem "nan" nie jest już traktowana jak brak wartości.
     """
     for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].astype(str).str.strip().replace('nan', '')
+        kolumna = df[col]
+        if kolumna.dtype == object:
+            rodzaj = pd.api.types.infer_dtype(kolumna, skipna=True)
+            if rodzaj in ('string', 'empty'):
+                df[col] = _przytnij_teksty(kolumna)
+            elif rodzaj in ('mixed', 'mixed-integer'):
+                # Teksty obok liczb/dat: .str.strip() zwraca NA dla nie-tekstów - te bierzemy z oryginału
+                try:
+                    oczyszczone = kolumna.str.strip()
+                except AttributeError:
+                    # Mieszanka bez żadnego tekstu (np. liczby obok dat)
+                    df[col] = kolumna.fillna('')
+                    continue
+                df[col] = oczyszczone.where(oczyszczone.notna(), kolumna).fillna('')
+            else:
+                # Kolumna bez żadnych tekstów (np. same liczby i puste komórki, także 'mixed-integer-float')
+                df[col] = kolumna.fillna('')
+        elif pd.api.types.is_string_dtype(kolumna):
+            df[col] = _przytnij_teksty(kolumna)
     return df
 
-def polacz_pliki(folder_z_plikami, liczba_wierszy_bloku_naglowka):
+def polacz_pliki(folder_z_plikami, liczba_wierszy_bloku_naglowka, postep=None):
     """
     Łączy wszystkie pliki Excel z folderu. Cały blok nagłówka z pierwszego pliku (wg sortowania)
     jest umieszczany na górze. Ostatni wiersz tego bloku definiuje nazwy kolumn dla danych.
     Obsługuje pliki z różną liczbą kolumn.
+    postep(tekst) - opcjonalne wyświetlanie postępu wczytywania plików.
     """
     try:
         pliki_do_polaczenia = []
@@ -57,17 +94,21 @@ def polacz_pliki(folder_z_plikami, liczba_wierszy_bloku_naglowka):
         
         # --- Krok 2: Wczytaj dane ze WSZYSTKICH plików ---
         list_of_data_dfs = []
-        for path_pliku in pliki_do_polaczenia:
+
+        def postep_wczytywania(gotowe, wszystkie, sciezka):
+            if postep:
+                postep(f"Wczytano plik {gotowe}/{wszystkie} ({os.path.basename(sciezka)})...")
+
+        # Wczytaj dane z każdego pliku (równolegle), pomijając wiersze nagłówka; wyniki są w kolejności plików
+        wczytane = wczytaj_excele(pliki_do_polaczenia, postep_wczytywania, header=None, skiprows=liczba_wierszy_bloku_naglowka)
+        for path_pliku, (df_data, blad) in zip(pliki_do_polaczenia, wczytane):
             nazwa_pliku_base = os.path.basename(path_pliku)
-            try:
-                # Wczytaj dane z każdego pliku, pomijając wiersze nagłówka
-                df_data = pd.read_excel(path_pliku, header=None, skiprows=liczba_wierszy_bloku_naglowka)
-                if not df_data.empty:
-                    df_data = usun_nadmiarowe_spacje(df_data)
-                    list_of_data_dfs.append(df_data)
-            except Exception as e:
+            if blad is not None:
                 messagebox.showwarning(f"Błąd Odczytu ({nazwa_pliku_base})", 
-                                       f"Nie udało się odczytać danych z pliku '{nazwa_pliku_base}': {e}. Plik zostanie pominięty.")
+                                       f"Nie udało się odczytać danych z pliku '{nazwa_pliku_base}': {blad}. Plik zostanie pominięty.")
+                continue
+            if not df_data.empty:
+                list_of_data_dfs.append(df_data)
 
         # --- Krok 3: Połącz wszystkie wczytane dane ---
         merged_data_df = pd.DataFrame()
@@ -75,6 +116,8 @@ def polacz_pliki(folder_z_plikami, liczba_wierszy_bloku_naglowka):
             try:
                 # Concat połączy ramki danych, dodając NaN tam, gdzie brakuje kolumn
                 merged_data_df = pd.concat(list_of_data_dfs, ignore_index=True)
+                # Czyszczenie raz, na połączonych danych (a nie osobno dla każdego pliku)
+                merged_data_df = usun_nadmiarowe_spacje(merged_data_df)
             except ValueError as ve: 
                 messagebox.showerror("Błąd Łączenia Danych", f"Wystąpił błąd podczas łączenia danych: {ve}.")
                 return
@@ -131,6 +174,10 @@ def wybierz_folder():
         entry_folder.delete(0, tk.END)
         entry_folder.insert(tk.END, folder_wybrany)
 
+def pokaz_postep(tekst):
+    status_label.config(text=tekst)
+    root.update_idletasks()
+
 def uruchom_polaczenie():
     folder_z_plikami = entry_folder.get()
     liczba_wierszy_bloku_naglowka_val = 0 
@@ -149,37 +196,43 @@ def uruchom_polaczenie():
     if not folder_z_plikami or not os.path.isdir(folder_z_plikami):
         messagebox.showerror("Błąd", "Nie wybrano prawidłowego folderu z plikami.")
     else:
-        polacz_pliki(folder_z_plikami, liczba_wierszy_bloku_naglowka_val)
+        status_label.config(text="Wczytywanie plików...")
+        polacz_pliki(folder_z_plikami, liczba_wierszy_bloku_naglowka_val, pokaz_postep)
+        status_label.config(text="Gotowy.")
 
 # --- Tworzenie okna głównego ---
-root = tk.Tk()
-root.title("Łączenie Plików Excel")
-
-ramka_folderu = tk.Frame(root, padx=10, pady=5)
-ramka_folderu.pack(fill=tk.X)
-etykieta_folder = tk.Label(ramka_folderu, text="Folder z plikami:")
-etykieta_folder.pack(side=tk.LEFT, padx=(0,5))
-entry_folder = tk.Entry(ramka_folderu, width=50)
-entry_folder.pack(side=tk.LEFT, expand=True, fill=tk.X)
-przycisk_folder = tk.Button(ramka_folderu, text="Przeglądaj", command=wybierz_folder)
-przycisk_folder.pack(side=tk.LEFT, padx=(5,0))
-
-ramka_opcji = tk.Frame(root, padx=10, pady=5)
-ramka_opcji.pack(fill=tk.X, pady=10)
-etykieta_liczba_wierszy_bloku_naglowka = tk.Label(ramka_opcji,
-    text="Ile wierszy od góry PIERWSZEGO pliku tworzy blok nagłówka (np. 3)?\n"
-         "Ten blok zostanie w całości umieszczony na górze połączonego pliku.\n"
-         "OSTATNI wiersz tego bloku (np. 3-ci) posłuży jako nazwy kolumn dla DANYCH.\n"
-         "W kolejnych plikach tyle samo wierszy od góry zostanie pominiętych.\n"
-         "Wpisz 0, jeśli pliki nie mają bloku nagłówka (wszystkie wiersze to dane).",
-    justify=tk.LEFT)
-etykieta_liczba_wierszy_bloku_naglowka.pack(anchor='w')
-entry_liczba_wierszy_bloku_naglowka = tk.Entry(ramka_opcji, width=10)
-entry_liczba_wierszy_bloku_naglowka.insert(0, "1") 
-entry_liczba_wierszy_bloku_naglowka.pack(anchor='w', pady=(5,10))
-
-przycisk_polacz = tk.Button(root, text="Połącz Pliki", command=uruchom_polaczenie, width=20, height=2)
-przycisk_polacz.pack(pady=20)
-
-root.minsize(500, 280) 
-root.mainloop()
\ No newline at end of file
+# Pod warunkiem __main__, bo procesy robocze wczytywania importują ten moduł ponownie (Windows)
+if __name__ == '__main__':
+    root = tk.Tk()
+    root.title("Łączenie Plików Excel")
+
+    ramka_folderu = tk.Frame(root, padx=10, pady=5)
+    ramka_folderu.pack(fill=tk.X)
+    etykieta_folder = tk.Label(ramka_folderu, text="Folder z plikami:")
+    etykieta_folder.pack(side=tk.LEFT, padx=(0,5))
+    entry_folder = tk.Entry(ramka_folderu, width=50)
+    entry_folder.pack(side=tk.LEFT, expand=True, fill=tk.X)
+    przycisk_folder = tk.Button(ramka_folderu, text="Przeglądaj", command=wybierz_folder)
+    przycisk_folder.pack(side=tk.LEFT, padx=(5,0))
+
+    ramka_opcji = tk.Frame(root, padx=10, pady=5)
+    ramka_opcji.pack(fill=tk.X, pady=10)
+    etykieta_liczba_wierszy_bloku_naglowka = tk.Label(ramka_opcji,
+        text="Ile wierszy od góry PIERWSZEGO pliku tworzy blok nagłówka (np. 3)?\n"
+             "Ten blok zostanie w całości umieszczony na górze połączonego pliku.\n"
+             "OSTATNI wiersz tego bloku (np. 3-ci) posłuży jako nazwy kolumn dla DANYCH.\n"
+             "W kolejnych plikach tyle samo wierszy od góry zostanie pominiętych.\n"
+             "Wpisz 0, jeśli pliki nie mają bloku nagłówka (wszystkie wiersze to dane).",
+        justify=tk.LEFT)
+    etykieta_liczba_wierszy_bloku_naglowka.pack(anchor='w')
+    entry_liczba_wierszy_bloku_naglowka = tk.Entry(ramka_opcji, width=10)
+    entry_liczba_wierszy_bloku_naglowka.insert(0, "1") 
+    entry_liczba_wierszy_bloku_naglowka.pack(anchor='w', pady=(5,10))
+
+    przycisk_polacz = tk.Button(root, text="Połącz Pliki", command=uruchom_polaczenie, width=20, height=2)
+    przycisk_polacz.pack(pady=(20, 5))
+    status_label = tk.Label(root, text="Gotowy.")
+    status_label.pack(pady=(0, 10))
+
+    root.minsize(500, 280) 
+    root.mainloop()
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import pandas as pd
+from zapis_tabel import wczytaj_tabele
 import os
 import datetime
 
@@ -71,7 +72,7 @@ class CSVToExcelApp(ctk.CTk):
         """Otwiera okno dialogowe do wyboru jednego lub wielu plików CSV."""
         file_paths = filedialog.askopenfilenames(
             title="Wybierz pliki CSV",
-            filetypes=(("Pliki CSV", "*.csv"), ("Wszystkie pliki", "*.*"))
+            filetypes=(("Pliki CSV / Parquet", "*.csv *.parquet"), ("Wszystkie pliki", "*.*"))
         )
         if file_paths:
             self.selected_csv_files = list(file_paths) # Konwertuj tuple na listę
@@ -147,9 +148,9 @@ class CSVToExcelApp(ctk.CTk):
                 excel_file_name = f"{excel_prefix}.xlsx"
                 excel_full_path = os.path.join(output_folder, excel_file_name)
 
-                # Odczyt pliku CSV za pomocą pandas
-                # 'on_bad_lines="skip"' ignoruje źle sformatowane wiersze
-                df = pd.read_csv(csv_file, sep=separator, header=0 if has_header else None, encoding='utf-8', on_bad_lines='skip')
+                # Odczyt pliku CSV (pandas, 'on_bad_lines="skip"' ignoruje źle sformatowane wiersze)
+                # lub Parquet - wtedy bez parsowania tekstu
+                df = wczytaj_tabele(csv_file, separator, has_header)
 
                 # Stwórz obiekt ExcelWriter do zarządzania wieloma arkuszami w *jednym* pliku Excela
                 with pd.ExcelWriter(excel_full_path, engine='openpyxl') as writer:
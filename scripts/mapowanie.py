@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import pandas as pd
+from zapis_tabel import wczytaj_tabele
 import os
 import datetime
 
@@ -71,7 +72,7 @@ class CSVToExcelApp(ctk.CTk):
         """Otwiera okno dialogowe do wyboru jednego lub wielu plików CSV."""
         file_paths = filedialog.askopenfilenames(
             title="Wybierz pliki CSV",
-            filetypes=(("Pliki CSV", "*.csv"), ("Wszystkie pliki", "*.*"))
+            filetypes=(("Pliki CSV / Parquet", "*.csv *.parquet"), ("Wszystkie pliki", "*.*"))
         )
         if file_paths:
             self.selected_csv_files = list(file_paths) # Konwertuj tuple na listę
@@ -156,8 +157,8 @@ class CSVToExcelApp(ctk.CTk):
                             sheet_name = f"{original_sheet_name}_{counter}"
                             counter += 1
 
-                        # Odczyt pliku CSV za pomocą pandas
-                        df = pd.read_csv(csv_file, sep=separator, header=0 if has_header else None, encoding='utf-8', on_bad_lines='skip')
+                        # Odczyt pliku CSV za pomocą pandas; z Parquet czytana jest tylko kolumna 'cat'
+                        df = wczytaj_tabele(csv_file, separator, has_header, kolumny=['cat'])
 
                         # Sprawdź, czy kolumna 'cat' istnieje
                         if 'cat' in df.columns:
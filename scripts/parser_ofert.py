@@ -0,0 +1,185 @@
+import gzip
+import re
+import xml.etree.ElementTree as ET
+
+try:
+    import zstandard
+except ImportError:
+    # zstandard jest opcjonalny, potrzebny tylko do feedów .zst
+    zstandard = None
+
+# Wspólny silnik parsowania ofert <o> dla konwerterów feedów (xmlcsv2, xmlcsv3, aps, xmlcsv_idbl, tłumaczenia).
+# Każda oferta jest przechodzona tylko raz: dzieci są rozdzielane po tagu do zwartego rekordu (Oferta),
+# a każdy skrypt deklaruje listę kolumn, z której raz budowana jest projekcja rekord -> krotka.
+
+POLA_PODSTAWOWE = ['id', 'url', 'price', 'avail', 'weight', 'stock', 'cat', 'name', 'desc']
+POLA_ELEMENTU = ('id', 'url', 'price', 'avail', 'weight', 'stock')
+POLA_TEKSTOWE = ('cat', 'name', 'desc')
+_WZORZEC_OBRAZU = re.compile(r"image(\d+)$")
+NAGLOWEK_GZIP = b'\x1f\x8b'
+NAGLOWEK_ZSTD = b'\x28\xb5\x2f\xfd'
+
+
+def clean_text(text):
+    """Zastępuje znaki nowej linii i inne białe znaki pojedynczą spacją."""
+    if not text:
+        return ""
+    # Rozdziela tekst po białych znakach (spacje, tabulatory, entery),
+    # łączy je z powrotem pojedynczą spacją i usuwa wiodące/końcowe białe znaki.
+    return " ".join(text.split())
+
+
+class Oferta:
+    """
+    Zwarty rekord jednej oferty. Teksty są przechowywane w surowej postaci
+    i czyszczone dopiero w projekcji, tylko dla kolumn, które skrypt zapisuje.
+    """
+    __slots__ = ('pola_o', 'cat', 'name', 'desc', 'atrybuty', 'obrazy')
+
+    def __init__(self, pola_o):
+        self.pola_o = pola_o      # atrybuty samego elementu <o> (id, url, price...)
+        self.cat = None
+        self.name = None
+        self.desc = None
+        self.atrybuty = {}        # nazwa z <attrs><a name=...> -> surowy tekst
+        self.obrazy = []          # adresy w kolejności kolumn image0, image1...
+
+    def atrybut(self, nazwa):
+        """Zwraca oczyszczoną wartość atrybutu z <attrs> albo pusty tekst."""
+        return clean_text(self.atrybuty.get(nazwa))
+
+    def liczba_obrazow(self):
+        """Liczba kolumn image* potrzebnych dla oferty (najwyższy indeks z adresem + 1)."""
+        for i in range(len(self.obrazy) - 1, -1, -1):
+            if self.obrazy[i]:
+                return i + 1
+        return 0
+
+
+def otworz_feed(sciezka_pliku):
+    """
+    Otwiera feed do odczytu binarnego. Pliki gzip i zstd (.xml.gz / .xml.zst, rozpoznawane
+    po nagłówku) są rozpakowywane strumieniowo, bez zapisywania rozpakowanej kopii na dysku.
+    """
+    with open(sciezka_pliku, 'rb') as plik:
+        naglowek = plik.read(4)
+    if naglowek.startswith(NAGLOWEK_GZIP):
+        return gzip.open(sciezka_pliku, 'rb')
+    if naglowek.startswith(NAGLOWEK_ZSTD):
+        if zstandard is None:
+            raise ValueError(f"Plik {sciezka_pliku} jest skompresowany zstd, a pakiet zstandard nie jest zainstalowany.")
+        return zstandard.ZstdDecompressor().stream_reader(open(sciezka_pliku, 'rb'), read_across_frames=True, closefd=True)
+    return open(sciezka_pliku, 'rb')
+
+
+def iteruj_elementy_o(sciezka_pliku):
+    """Strumieniowo zwraca kolejne elementy <o> z pliku XML, zwalniając pamięć po każdym z nich."""
+    korzen = None
+    glebokosc = 0
+    with otworz_feed(sciezka_pliku) as zrodlo:
+        for zdarzenie, element in ET.iterparse(zrodlo, events=("start", "end")):
+            if zdarzenie == "start":
+                if korzen is None:
+                    korzen = element
+                glebokosc += 1
+                continue
+            glebokosc -= 1
+            # Tak jak root.findall("o") - tylko bezpośrednie dzieci korzenia
+            if glebokosc == 1 and element.tag == "o":
+                yield element
+                # Oferta przetworzona - usuwamy ją z korzenia, aby drzewo nie rosło
+                korzen.clear()
+
+
+def oferta_z_elementu(element, atrybuty=None, obrazy=True, pierwszy_atrybut=False):
+    """
+    Buduje rekord Oferta w jednym przejściu po dzieciach elementu <o>.
+    atrybuty - zbiór nazw z <attrs> do zachowania (None = wszystkie).
+    obrazy - czy zbierać adresy z <imgs>.
+    pierwszy_atrybut - przy powtórzonej nazwie w <attrs> zostaje pierwsze <a> (dawne pętle
+    z break, np. id_bl), a domyślnie ostatnie (dawne wiersz[nazwa] = ...).
+    """
+    oferta = Oferta(element.attrib)
+    for dziecko in element:
+        tag = dziecko.tag
+        if tag == "attrs":
+            slownik = oferta.atrybuty
+            for atrybut in dziecko:
+                if atrybut.tag != "a":
+                    continue
+                nazwa_atrybutu = atrybut.get("name")
+                if nazwa_atrybutu and (atrybuty is None or nazwa_atrybutu in atrybuty):
+                    if pierwszy_atrybut:
+                        slownik.setdefault(nazwa_atrybutu, atrybut.text)
+                    else:
+                        slownik[nazwa_atrybutu] = atrybut.text
+        elif tag == "imgs":
+            if obrazy:
+                glowny = None
+                dodatkowe = []
+                for obraz in dziecko:
+                    if obraz.tag == "i":
+                        dodatkowe.append(obraz.get("url"))
+                    elif obraz.tag == "main" and glowny is None:
+                        glowny = obraz.get("url") or ""
+                # Obraz główny zajmuje image0, a dodatkowe numerowane są od image1;
+                # bez obrazu głównego dodatkowe zaczynają się od image0
+                oferta.obrazy = [glowny] + dodatkowe if glowny else dodatkowe
+        # Tak jak element.find() - liczy się pierwszy element o danym tagu
+        elif tag == "cat":
+            if oferta.cat is None:
+                oferta.cat = dziecko.text or ""
+        elif tag == "name":
+            if oferta.name is None:
+                oferta.name = dziecko.text or ""
+        elif tag == "desc":
+            if oferta.desc is None:
+                oferta.desc = dziecko.text or ""
+    return oferta
+
+
+def iteruj_oferty(sciezka_pliku, atrybuty=None, obrazy=True, pierwszy_atrybut=False):
+    """Strumieniowo zwraca rekordy Oferta z pliku XML."""
+    for element in iteruj_elementy_o(sciezka_pliku):
+        yield oferta_z_elementu(element, atrybuty, obrazy, pierwszy_atrybut)
+
+
+def _pobieracz(pole):
+    """Zwraca funkcję wyciągającą wartość jednej kolumny z rekordu Oferta."""
+    if pole in POLA_ELEMENTU:
+        def pobierz(oferta):
+            # Atrybut z <attrs> o tej samej nazwie nadpisuje pole elementu (jak w dawnych słownikach)
+            if pole in oferta.atrybuty:
+                return clean_text(oferta.atrybuty[pole])
+            return oferta.pola_o.get(pole)
+        return pobierz
+    if pole in POLA_TEKSTOWE:
+        def pobierz(oferta):
+            if pole in oferta.atrybuty:
+                return clean_text(oferta.atrybuty[pole])
+            return clean_text(getattr(oferta, pole))
+        return pobierz
+    dopasowanie = _WZORZEC_OBRAZU.match(pole)
+    if dopasowanie:
+        indeks = int(dopasowanie.group(1))
+        def pobierz(oferta):
+            obrazy = oferta.obrazy
+            return (obrazy[indeks] or "") if indeks < len(obrazy) else ""
+        return pobierz
+    def pobierz(oferta):
+        return clean_text(oferta.atrybuty.get(pole))
+    return pobierz
+
+
+def zbuduj_projekcje(pola, nadpisania=None):
+    """
+    Zwraca funkcję oferta -> krotka wartości w kolejności kolumn pola.
+    nadpisania - słownik {kolumna: funkcja(oferta)} dla kolumn o nietypowej logice.
+    Pobieracze są wybierane raz, więc pętla po ofertach nie sprawdza nazw kolumn.
+    """
+    nadpisania = nadpisania or {}
+    pobieracze = [nadpisania[pole] if pole in nadpisania else _pobieracz(pole) for pole in pola]
+
+    def projekcja(oferta):
+        return tuple([pobierz(oferta) for pobierz in pobieracze])
+    return projekcja
@@ -0,0 +1,339 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from urllib.parse import urlparse
+
+try:
+    import zstandard
+except ImportError:
+    # zstandard jest opcjonalny - bez niego serwer dostaje tylko gzip/deflate
+    zstandard = None
+
+# Wspólne pobieranie feedów XML dla konwerterów (xmlcsv2, xmlcsv3, aps, xmlcsv_idbl, tłumaczenia).
+# Pliki są pobierane równolegle w puli wątków, a wątek wywołujący (GUI) dostaje je
+# w kolejności ukończenia, więc parsowanie może ruszyć zanim skończą się pozostałe pobrania.
+# Pobrane treści trafiają do trwałego cache (klucz = URL) z ETag/Last-Modified, więc przy
+# kolejnym uruchomieniu serwer może odpowiedzieć 304 i feed nie jest pobierany ponownie.
+
+# --- Limity współbieżności ---
+MAKS_POBIERAN = 8           # łączna liczba jednoczesnych pobrań
+MAKS_POBIERAN_NA_HOST = 4   # aby nie przeciążać pojedynczego serwera (np. sm-prods.com)
+ROZMIAR_BLOKU = 256 * 1024
+TIMEOUT_SEKUNDY = 60
+# Kompresja transferu - odpowiedź jest rozpakowywana strumieniowo podczas zapisu do cache
+KODOWANIA_TRANSFERU = 'zstd, gzip, deflate' if zstandard else 'gzip, deflate'
+NAGLOWKI = {'User-agent': 'Mozilla/5.0', 'Accept-Encoding': KODOWANIA_TRANSFERU}
+# ----------------------------------------------------
+
+
+def _gigabajty_ze_srodowiska(zmienna, domyslnie):
+    """Limit w bajtach z liczby GB w zmiennej środowiskowej (np. 50 albo 7.5); bez niej lub przy błędzie - domyślny."""
+    try:
+        return int(float(os.environ.get(zmienna) or domyslnie) * 1024 * 1024 * 1024)
+    except ValueError:
+        return int(domyslnie * 1024 * 1024 * 1024)
+
+
+# --- Cache feedów ---
+KATALOG_CACHE = os.environ.get('FEEDY_CACHE') or os.path.join(os.path.expanduser('~'), '.cache', 'feedy_xml')
+# Po przekroczeniu usuwane są najdawniej używane wpisy. Domyślne 20 GB mieści ponad 30 feedów
+# po kilkaset MB (treść w cache jest rozpakowana); zmiana: FEEDY_CACHE_MAKS_GB
+MAKS_ROZMIAR_CACHE = _gigabajty_ze_srodowiska('FEEDY_CACHE_MAKS_GB', 20)
+MAKS_WPISOW_CACHE = 200
+# ----------------------------------------------------
+
+_blokada_cache = threading.Lock()
+_blokady_url = {}
+
+
+class LicznikBajtow:
+    """
+    Bezpieczny wątkowo licznik pobranych bajtów (suma ze wszystkich pobrań).
+    Licznik z nadrzednym (np. dla jednego URL-a) przekazuje bajty także do licznika łącznego.
+    """
+
+    def __init__(self, nadrzedny=None):
+        self._blokada = threading.Lock()
+        self.bajty = 0
+        self.nadrzedny = nadrzedny
+
+    def dodaj(self, ile):
+        with self._blokada:
+            self.bajty += ile
+        if self.nadrzedny is not None:
+            self.nadrzedny.dodaj(ile)
+
+
+def nazwa_pliku_z_url(url, numer):
+    """Zwraca nazwę pliku z URL-a lub nazwę zastępczą feed_<numer>.xml."""
+    return os.path.basename(urlparse(url).path) or f"feed_{numer}.xml"
+
+
+def sciezka_tymczasowa(url, numer, katalog_tymczasowy):
+    """Buduje unikalną ścieżkę pliku tymczasowego dla pobieranego feeda."""
+    nazwa_bazowa_xml = os.path.splitext(nazwa_pliku_z_url(url, numer))[0]
+    teraz_timestamp_temp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+    return os.path.join(katalog_tymczasowy, f"temp_{nazwa_bazowa_xml}_{numer}_{teraz_timestamp_temp}.xml")
+
+
+class _DekoderDeflate:
+    """Dekoder 'deflate' - część serwerów wysyła surowy strumień zamiast formatu zlib."""
+
+    def __init__(self):
+        self._obiekt = None
+
+    def decompress(self, dane):
+        if self._obiekt is None:
+            naglowek_zlib = len(dane) >= 2 and (dane[0] & 0x0f) == 8 and (dane[0] * 256 + dane[1]) % 31 == 0
+            self._obiekt = zlib.decompressobj(zlib.MAX_WBITS if naglowek_zlib else -zlib.MAX_WBITS)
+        return self._obiekt.decompress(dane)
+
+    def flush(self):
+        return self._obiekt.flush() if self._obiekt is not None else b''
+
+
+def _dekoder_transferu(kodowanie):
+    """Zwraca obiekt z metodami decompress/flush dla nagłówka Content-Encoding albo None."""
+    kodowanie = (kodowanie or '').strip().lower()
+    if kodowanie in ('', 'identity'):
+        return None
+    if kodowanie in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if kodowanie == 'deflate':
+        return _DekoderDeflate()
+    if kodowanie == 'zstd' and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise ValueError(f"Nieobsługiwane kodowanie odpowiedzi: {kodowanie}")
+
+
+def _klucz_cache(url):
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def _sciezki_cache(url, katalog_cache):
+    klucz = _klucz_cache(url)
+    return os.path.join(katalog_cache, klucz + '.xml'), os.path.join(katalog_cache, klucz + '.json')
+
+
+def _blokada_dla_url(url):
+    with _blokada_cache:
+        return _blokady_url.setdefault(url, threading.Lock())
+
+
+def _wczytaj_metadane(sciezka_meta, sciezka_tresci):
+    """Zwraca metadane wpisu albo None, jeśli wpisu brak lub jest niekompletny."""
+    if not os.path.exists(sciezka_tresci):
+        return None
+    try:
+        with open(sciezka_meta, encoding='utf-8') as plik:
+            return json.load(plik)
+    except (OSError, ValueError):
+        return None
+
+
+def _zapisz_metadane(sciezka_meta, metadane):
+    tymczasowa = sciezka_meta + '.part'
+    with open(tymczasowa, 'w', encoding='utf-8') as plik:
+        json.dump(metadane, plik)
+    os.replace(tymczasowa, sciezka_meta)
+
+
+def przytnij_cache(katalog_cache=KATALOG_CACHE, maks_rozmiar=MAKS_ROZMIAR_CACHE, maks_wpisow=MAKS_WPISOW_CACHE):
+    """
+    Usuwa najdawniej używane wpisy, aż cache zmieści się w limitach rozmiaru i liczby wpisów.
+    Wpis jest usuwany pod blokadą swojego URL-a; wpis w użyciu (właśnie pobierany albo
+    udostępniany) jest pomijany, tak samo jak wpis użyty ponownie od odczytu listy.
+    """
+    with _blokada_cache:
+        wpisy = []
+        for nazwa in os.listdir(katalog_cache):
+            if not nazwa.endswith('.json'):
+                continue
+            sciezka_meta = os.path.join(katalog_cache, nazwa)
+            sciezka_tresci = sciezka_meta[:-len('.json')] + '.xml'
+            metadane = _wczytaj_metadane(sciezka_meta, sciezka_tresci)
+            if metadane is None:
+                continue
+            wpisy.append((metadane.get('ostatnie_uzycie', 0), metadane.get('rozmiar', 0), sciezka_tresci,
+                          sciezka_meta, metadane.get('url')))
+
+        wpisy.sort(key=lambda w: w[:4])
+        laczny_rozmiar = sum(w[1] for w in wpisy)
+        liczba_wpisow = len(wpisy)
+        for ostatnie_uzycie, rozmiar, sciezka_tresci, sciezka_meta, url in wpisy:
+            if laczny_rozmiar <= maks_rozmiar and liczba_wpisow <= maks_wpisow:
+                break
+            # Bez czekania: _blokada_cache jest trzymana, a wątek z blokadą URL-a nie sięga po nią
+            blokada_url = _blokady_url.setdefault(url, threading.Lock())
+            if not blokada_url.acquire(blocking=False):
+                continue
+            try:
+                metadane = _wczytaj_metadane(sciezka_meta, sciezka_tresci)
+                if metadane is None or metadane.get('ostatnie_uzycie', 0) != ostatnie_uzycie:
+                    continue
+                for sciezka in (sciezka_meta, sciezka_tresci):
+                    try:
+                        os.remove(sciezka)
+                    except OSError:
+                        pass
+            finally:
+                blokada_url.release()
+            laczny_rozmiar -= rozmiar
+            liczba_wpisow -= 1
+
+
+def _udostepnij(sciezka_cache, sciezka_docelowa):
+    # Twarde dowiązanie nie kopiuje danych; usunięcie pliku tymczasowego nie narusza cache,
+    # a podmiana (os.replace) lub usunięcie wpisu w cache nie zmienia już udostępnionego pliku.
+    try:
+        os.link(sciezka_cache, sciezka_docelowa)
+    except OSError:
+        shutil.copyfile(sciezka_cache, sciezka_docelowa)
+
+
+def pobierz_z_cache(url, licznik=None, katalog_cache=KATALOG_CACHE, timeout=TIMEOUT_SEKUNDY, sciezka_docelowa=None):
+    """
+    Zwraca ścieżkę do aktualnej treści feeda w cache.
+    Jeśli wpis istnieje, wysyła zapytanie warunkowe (If-None-Match / If-Modified-Since)
+    i przy odpowiedzi 304 używa zapisanej treści. W razie błędu zgłasza wyjątek.
+    Ścieżka w cache jest ważna tylko do przycięcia cache przez kolejne pobranie - z sciezka_docelowa
+    treść jest dowiązywana (albo kopiowana) tam jeszcze pod blokadą URL-a i zwracana jest sciezka_docelowa.
+    """
+    os.makedirs(katalog_cache, exist_ok=True)
+    sciezka_tresci, sciezka_meta = _sciezki_cache(url, katalog_cache)
+
+    with _blokada_dla_url(url):
+        metadane = _wczytaj_metadane(sciezka_meta, sciezka_tresci)
+        # Użycie nagłówka User-Agent, aby uniknąć blokowania przez niektóre serwery
+        naglowki = dict(NAGLOWKI)
+        if metadane:
+            if metadane.get('etag'):
+                naglowki['If-None-Match'] = metadane['etag']
+            if metadane.get('last_modified'):
+                naglowki['If-Modified-Since'] = metadane['last_modified']
+
+        zadanie = urllib.request.Request(url, headers=naglowki)
+        try:
+            odpowiedz = urllib.request.urlopen(zadanie, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and metadane:
+                metadane['ostatnie_uzycie'] = time.time()
+                _zapisz_metadane(sciezka_meta, metadane)
+                if sciezka_docelowa is None:
+                    return sciezka_tresci
+                _udostepnij(sciezka_tresci, sciezka_docelowa)
+                return sciezka_docelowa
+            raise
+
+        tymczasowa = sciezka_tresci + '.part'
+        try:
+            with odpowiedz, open(tymczasowa, 'wb') as plik:
+                dekoder = _dekoder_transferu(odpowiedz.headers.get('Content-Encoding'))
+                while True:
+                    blok = odpowiedz.read(ROZMIAR_BLOKU)
+                    if not blok:
+                        break
+                    # Licznik pokazuje bajty przesłane siecią (przed rozpakowaniem)
+                    if licznik is not None:
+                        licznik.dodaj(len(blok))
+                    plik.write(dekoder.decompress(blok) if dekoder else blok)
+                if dekoder:
+                    plik.write(dekoder.flush())
+                etag = odpowiedz.headers.get('ETag')
+                last_modified = odpowiedz.headers.get('Last-Modified')
+            os.replace(tymczasowa, sciezka_tresci)
+        except Exception:
+            if os.path.exists(tymczasowa):
+                os.remove(tymczasowa)
+            raise
+
+        _zapisz_metadane(sciezka_meta, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'rozmiar': os.path.getsize(sciezka_tresci),
+            'ostatnie_uzycie': time.time(),
+        })
+        if sciezka_docelowa is not None:
+            _udostepnij(sciezka_tresci, sciezka_docelowa)
+
+    przytnij_cache(katalog_cache)
+    return sciezka_tresci if sciezka_docelowa is None else sciezka_docelowa
+
+
+def pobierz_do_pliku(url, sciezka_docelowa, licznik=None, timeout=TIMEOUT_SEKUNDY):
+    """Pobiera feed (przez cache) i udostępnia go pod wskazaną ścieżką. W razie błędu zgłasza wyjątek."""
+    pobierz_z_cache(url, licznik, timeout=timeout, sciezka_docelowa=sciezka_docelowa)
+
+
+def _pobierz_albo_usun(url, sciezka, licznik):
+    try:
+        pobierz_do_pliku(url, sciezka, licznik)
+    except Exception:
+        if os.path.exists(sciezka):
+            os.remove(sciezka)
+        raise
+
+
+def pobierz_wiele(urls, katalog_tymczasowy, status_callback=None,
+                  maks_pobieran=MAKS_POBIERAN, maks_na_host=MAKS_POBIERAN_NA_HOST, odstep_statusu=0.25,
+                  pomiary=None):
+    """
+    Pobiera wiele URL-i równolegle i zwraca (generator) krotki
+    (indeks, url, sciezka_lokalna, blad) w kolejności ukończenia pobrań.
+    Przy błędzie sciezka_lokalna to None, a blad zawiera wyjątek.
+
+    status_callback(pobrane_bajty, ukonczone, wszystkie) jest wywoływany w wątku
+    wywołującym, więc można w nim bezpiecznie aktualizować GUI.
+    Z włączonymi pomiarami (pomiary.Pomiary) każdy URL dostaje wpis 'pobieranie' z czasem
+    (łącznie z oczekiwaniem na limit hosta), bajtami przesłanymi siecią i rozmiarem na dysku.
+    """
+    licznik = LicznikBajtow()
+    semafory_hostow = {}
+    for url in urls:
+        semafory_hostow.setdefault(urlparse(url).netloc, threading.Semaphore(maks_na_host))
+
+    def _zadanie(indeks, url):
+        sciezka = sciezka_tymczasowa(url, indeks + 1, katalog_tymczasowy)
+        if pomiary is None or not pomiary.wlaczone:
+            with semafory_hostow[urlparse(url).netloc]:
+                _pobierz_albo_usun(url, sciezka, licznik)
+            return sciezka
+        licznik_url = LicznikBajtow(licznik)
+        with pomiary.etap('pobieranie', url) as wpis:
+            with semafory_hostow[urlparse(url).netloc]:
+                _pobierz_albo_usun(url, sciezka, licznik_url)
+            wpis['bajty'] = licznik_url.bajty
+            wpis['bajty_na_dysku'] = os.path.getsize(sciezka)
+            # Odpowiedź 304 - treść wzięta z cache, bez transferu
+            wpis['z_cache'] = licznik_url.bajty == 0
+        return sciezka
+
+    wszystkie = len(urls)
+    ukonczone = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(maks_pobieran, wszystkie))) as pula:
+        oczekujace = {pula.submit(_zadanie, i, url): (i, url) for i, url in enumerate(urls)}
+        while oczekujace:
+            gotowe, _ = wait(oczekujace, timeout=odstep_statusu, return_when=FIRST_COMPLETED)
+            if status_callback:
+                status_callback(licznik.bajty, ukonczone + len(gotowe), wszystkie)
+            for przyszlosc in gotowe:
+                indeks, url = oczekujace.pop(przyszlosc)
+                ukonczone += 1
+                try:
+                    yield indeks, url, przyszlosc.result(), None
+                except Exception as e:
+                    yield indeks, url, None, e
+
+
+def opis_postepu(pobrane_bajty, ukonczone, wszystkie):
+    """Zwraca tekst statusu z łączną liczbą pobranych megabajtów."""
+    return f"Pobieranie: {ukonczone}/{wszystkie} plików, {pobrane_bajty / (1024 * 1024):.1f} MB..."
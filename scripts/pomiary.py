@@ -0,0 +1,129 @@
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:
+    # resource jest tylko na Linux/macOS - na Windows pomiary nie zawierają szczytowego RSS
+    resource = None
+
+# Opcjonalne pomiary etapów przetwarzania feedów (xmlcsv2, xmlcsv3): czas i bajty pobierania
+# każdego URL-a, czas parsowania, zapisu, liczba wierszy na sekundę i szczytowe zużycie pamięci.
+# Włączane przez zmienną środowiskową FEEDY_POMIARY=1 (także dla okna) albo opcję --pomiary.
+# Wynik to dziennik JSON-lines obok zapisanego pliku - jeden obiekt na etap, ostatni to podsumowanie,
+# np. `jq -s 'map(select(.etap=="pobieranie")) | sort_by(-.czas_s)' wynik.pomiary.jsonl`.
+
+ZMIENNA_WLACZAJACA = 'FEEDY_POMIARY'
+ROZSZERZENIE_DZIENNIKA = '.pomiary.jsonl'
+# ru_maxrss jest w kilobajtach na Linux, a w bajtach na macOS
+_JEDNOSTKA_RSS = 1 if sys.platform == 'darwin' else 1024
+# Liczniki, dla których dziennik dopisuje tempo (<licznik>_na_s)
+_LICZNIKI_TEMPA = ('oferty', 'wiersze')
+
+
+def wlaczone_w_srodowisku():
+    return os.environ.get(ZMIENNA_WLACZAJACA, '').strip().lower() in ('1', 'tak', 'true', 'yes')
+
+
+def szczyt_rss_mb():
+    """Największe dotychczasowe zużycie pamięci procesu (MB) albo None, gdy nie da się go odczytać."""
+    if resource is None:
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _JEDNOSTKA_RSS / (1024 * 1024), 1)
+
+
+def sciezka_obok(sciezka_wyniku):
+    """Ścieżka dziennika obok pliku wynikowego: wynik.csv -> wynik.pomiary.jsonl."""
+    return os.path.splitext(sciezka_wyniku)[0] + ROZSZERZENIE_DZIENNIKA
+
+
+def policz(elementy, wpis, klucz):
+    """Przepuszcza elementy bez zmian, zliczając je w wpis[klucz]."""
+    wpis.setdefault(klucz, 0)
+    for element in elementy:
+        wpis[klucz] += 1
+        yield element
+
+
+class Pomiary:
+    """
+    Dziennik etapów jednego uruchomienia. Wyłączony (domyślnie) nie mierzy niczego, a etap()
+    i dodaj() kosztują tylko wywołanie funkcji. dodaj() jest bezpieczne wątkowo - wołają je
+    wątki pobierania w pobierz_wiele.
+    """
+
+    def __init__(self, skrypt, wlaczone=None):
+        self.skrypt = skrypt
+        self.wlaczone = wlaczone_w_srodowisku() if wlaczone is None else wlaczone
+        self.uruchomienie = uuid.uuid4().hex[:12]
+        self.start = time.perf_counter()
+        self.wpisy = []
+        self._blokada = threading.Lock()
+
+    def dodaj(self, etap, czas_s, url=None, **pola):
+        """Zapisuje zmierzony etap; dla bajtów i liczników (oferty, wiersze) dopisuje tempo."""
+        if not self.wlaczone:
+            return
+        wpis = {'etap': etap, 'url': url, 'czas_s': round(czas_s, 4)}
+        wpis.update(pola)
+        if czas_s > 0:
+            if wpis.get('bajty'):
+                wpis['mb_na_s'] = round(wpis['bajty'] / (1024 * 1024) / czas_s, 2)
+            for licznik in _LICZNIKI_TEMPA:
+                if licznik in wpis:
+                    wpis[f'{licznik}_na_s'] = round(wpis[licznik] / czas_s, 1)
+        wpis['szczyt_rss_mb'] = szczyt_rss_mb()
+        with self._blokada:
+            self.wpisy.append(wpis)
+
+    @contextmanager
+    def etap(self, etap, url=None, **pola):
+        """
+        Mierzy blok kodu. Zwracany słownik przyjmuje liczniki ustalone w trakcie etapu
+        (np. wpis['oferty'] = n); etap przerwany wyjątkiem jest zapisywany z polem 'blad'.
+        """
+        wpis = dict(pola)
+        if not self.wlaczone:
+            yield wpis
+            return
+        szczyt_przed = szczyt_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield wpis
+        except BaseException as e:
+            wpis['blad'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            if szczyt_przed is not None:
+                # Dodatni przyrost wskazuje etap, który podniósł szczyt pamięci procesu
+                wpis['przyrost_szczytu_rss_mb'] = round(szczyt_rss_mb() - szczyt_przed, 1)
+            self.dodaj(etap, time.perf_counter() - start, url, **wpis)
+
+    def zapisz(self, sciezka_dziennika, **podsumowanie):
+        """
+        Zapisuje wpisy (każdy z identyfikatorem uruchomienia i nazwą skryptu) i wiersz
+        podsumowania. Zwraca ścieżkę dziennika albo None, gdy pomiary są wyłączone lub zapis
+        się nie udał - pomiary nigdy nie przerywają przetwarzania.
+        """
+        if not self.wlaczone:
+            return None
+        wspolne = {'uruchomienie': self.uruchomienie, 'skrypt': self.skrypt}
+        with self._blokada:
+            wpisy = list(self.wpisy)
+        wpisy.append(dict(etap='podsumowanie', czas_s=round(time.perf_counter() - self.start, 4),
+                          data=datetime.now().isoformat(timespec='seconds'), szczyt_rss_mb=szczyt_rss_mb(),
+                          **podsumowanie))
+        try:
+            with open(sciezka_dziennika, 'a', encoding='utf-8') as plik:
+                for wpis in wpisy:
+                    plik.write(json.dumps({**wspolne, **wpis}, ensure_ascii=False) + '\n')
+        except OSError as e:
+            print(f"Ostrzeżenie: Nie udało się zapisać dziennika pomiarów {sciezka_dziennika}: {e}")
+            return None
+        return sciezka_dziennika
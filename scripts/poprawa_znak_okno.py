@@ -0,0 +1,143 @@
+import customtkinter
+from tkinter import filedialog, messagebox
+import os
+from poprawa_znak import ENGINE_EXCEL, ENGINE_OPTIONS, ENGINE_PARALLEL, ENGINE_STANDARD, PYWIN32_AVAILABLE, correct_excel_chars
+
+# Window of the Polish character corrector - imported only for the GUI (python poprawa_znak.py without arguments)
+customtkinter.set_appearance_mode("System")
+customtkinter.set_default_color_theme("blue")
+
+class App(customtkinter.CTk):
+    def __init__(self):
+        super().__init__()
+        self.title("Korektor Polskich Znaków w Excelu")
+        self.geometry("600x450")
+        self.resizable(False, False)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(5, weight=1)
+
+        self.selected_file_path = None
+
+        # --- Widgets ---
+        self.file_frame = customtkinter.CTkFrame(self)
+        self.file_frame.grid(row=0, column=0, padx=20, pady=10, sticky="nsew")
+        self.file_frame.grid_columnconfigure(0, weight=1)
+
+        self.file_path_label = customtkinter.CTkLabel(self.file_frame, text="Nie wybrano pliku Excel")
+        self.file_path_label.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+
+        self.select_file_button = customtkinter.CTkButton(self.file_frame, text="Wybierz plik", command=self.select_file)
+        self.select_file_button.grid(row=0, column=1, padx=10, pady=10)
+
+        self.engine_frame = customtkinter.CTkFrame(self)
+        self.engine_frame.grid(row=1, column=0, padx=20, pady=5, sticky="ew")
+        self.engine_frame.grid_columnconfigure(1, weight=1)
+        
+        customtkinter.CTkLabel(self.engine_frame, text="Silnik przetwarzania:").grid(row=0, column=0, padx=10, pady=10)
+        
+        engine_options = ENGINE_OPTIONS
+        self.engine_selector = customtkinter.CTkSegmentedButton(self.engine_frame, values=engine_options, command=self.on_engine_change)
+        self.engine_selector.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
+        
+        self.engine_selector.set(engine_options[0])
+        
+        self.action_frame = customtkinter.CTkFrame(self)
+        self.action_frame.grid(row=2, column=0, padx=20, pady=5, sticky="nsew")
+        self.action_frame.grid_columnconfigure(0, weight=1)
+
+        self.start_button = customtkinter.CTkButton(self.action_frame, text="Rozpocznij korekcję", command=self.start_correction, state="disabled")
+        self.start_button.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+        
+        self.excel_warning_label = customtkinter.CTkLabel(self, text="", text_color="#E53935", wraplength=550, font=customtkinter.CTkFont(weight="bold"))
+        self.excel_warning_label.grid(row=3, column=0, padx=20, pady=(5, 0), sticky="ew")
+        
+        self.info_label = customtkinter.CTkLabel(self, text="", text_color="gray", wraplength=550)
+        self.info_label.grid(row=4, column=0, padx=20, pady=5, sticky="ew")
+
+        self.status_label = customtkinter.CTkLabel(self, text="Wybierz plik i silnik, aby rozpocząć.", text_color="gray")
+        self.status_label.grid(row=5, column=0, padx=20, pady=10, sticky="ew")
+        
+        self.on_engine_change(engine_options[0])
+
+    def on_engine_change(self, value):
+        if value == ENGINE_STANDARD:
+            self.info_label.configure(text="Silnik Standardowy: Szybki, nie wymaga Excela, ale usuwa formatowanie.", text_color="gray")
+            self.excel_warning_label.configure(text="")
+        elif value == ENGINE_PARALLEL:
+            self.info_label.configure(text=f"Silnik Wielordzeniowy: Dzieli pracę na {os.cpu_count() or 1} procesów, najszybszy dla bardzo dużych plików. Usuwa formatowanie.", text_color="gray")
+            self.excel_warning_label.configure(text="")
+        else:
+            if PYWIN32_AVAILABLE:
+                self.info_label.configure(text="Silnik Excel: Zachowuje formatowanie. Wymaga MS Excel i działa tylko na Windows.", text_color="orange")
+                self.excel_warning_label.configure(text="UWAGA: Ta operacja może zamknąć wszystkie otwarte pliki Excel. Zapisz swoją pracę przed kontynuacją!")
+            else:
+                self.info_label.configure(text="Silnik Excel jest niedostępny. Zainstaluj pywin32 lub upewnij się, że jesteś na Windows.", text_color="red")
+                self.excel_warning_label.configure(text="")
+
+    def select_file(self):
+        filepath = filedialog.askopenfilename(title="Wybierz plik Excel", filetypes=[("Pliki Excel", "*.xlsx;*.xlsm;*.xlsb;*.xls")])
+        if filepath:
+            self.selected_file_path = filepath
+            self.file_path_label.configure(text=f"Plik: {os.path.basename(filepath)}")
+            self.start_button.configure(state="normal")
+            self.update_status("Plik wybrany. Możesz rozpocząć korekcję.", "blue")
+        else:
+            self.selected_file_path = None
+            self.file_path_label.configure(text="Nie wybrano pliku Excel")
+            self.start_button.configure(state="disabled")
+            self.update_status("Anulowano wybór. Wybierz plik.", "gray")
+
+    def start_correction(self):
+        if not self.selected_file_path:
+            messagebox.showwarning("Brak pliku", "Najpierw wybierz plik Excel.")
+            return
+
+        selected_engine = self.engine_selector.get()
+        if selected_engine == ENGINE_EXCEL and PYWIN32_AVAILABLE:
+            proceed = messagebox.askokcancel(
+                "Potwierdzenie operacji",
+                "Używasz silnika Excel. Ta operacja może spowodować zamknięcie wszystkich niezapisanych plików Excel.\n\n"
+                "Upewnij się, że zapisałeś swoją pracę. Czy chcesz kontynuować?"
+            )
+            if not proceed:
+                return
+
+        self.set_ui_state("disabled")
+        self.update_status("Rozpoczynam przetwarzanie...", "orange")
+        self.after(100, self.run_correction_task)
+
+    def run_correction_task(self):
+        selected_engine = self.engine_selector.get()
+        try:
+            new_filepath, corrected_count = correct_excel_chars(self.selected_file_path, selected_engine, self.update_progress)
+
+            success_message = (f"Korekta zakończona! Wprowadzono zmiany w {corrected_count} komórkach.\n\n"
+                               f"Zapisano jako: {os.path.basename(new_filepath)}")
+            self.update_status(f"Sukces! Wprowadzono zmiany w {corrected_count} komórkach.", "green")
+            messagebox.showinfo("Sukces", success_message)
+        except Exception as e:
+            self.handle_error(e)
+        finally:
+            self.set_ui_state("normal")
+
+    def handle_error(self, error):
+        self.update_status(f"Wystąpił błąd: {error}", "red")
+        messagebox.showerror("Błąd krytyczny", f"Wystąpił nieoczekiwany błąd:\n\n{error}")
+
+    def set_ui_state(self, state):
+        self.start_button.configure(state=state)
+        self.select_file_button.configure(state=state)
+        self.engine_selector.configure(state=state)
+
+    def update_status(self, text, color):
+        self.status_label.configure(text=text, text_color=color)
+        self.update_idletasks()
+
+    def update_progress(self, progress_text):
+        self.status_label.configure(text=progress_text)
+        self.update_idletasks()
+
+if __name__ == "__main__":
+    app = App()
+    app.mainloop()
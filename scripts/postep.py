@@ -0,0 +1,132 @@
+import threading
+import time
+from collections import deque
+
+# Wspólne raportowanie postępu dla długich operacji (htmlv5, dziel_lacz, giga_bol, poprawa_znak,
+# cdon_for_dawid). Pętle zgłaszają postęp przy każdym wierszu, ale interfejs jest odświeżany
+# najwyżej CZESTOTLIWOSC_ODSWIEZANIA razy na sekundę - koszt rysowania nie zależy od liczby wierszy.
+
+CZESTOTLIWOSC_ODSWIEZANIA = 10  # Hz
+ROZMIAR_BUFORA_KOMUNIKATOW = 1000  # komunikaty czekające na wypisanie między odświeżeniami
+
+
+def formatuj_czas(sekundy):
+    """Czas w postaci G:MM:SS lub M:SS."""
+    sekundy = int(sekundy)
+    godziny, reszta = divmod(sekundy, 3600)
+    minuty, sekundy = divmod(reszta, 60)
+    if godziny:
+        return f"{godziny}:{minuty:02d}:{sekundy:02d}"
+    return f"{minuty}:{sekundy:02d}"
+
+
+def _liczba(wartosc):
+    """Liczba całkowita z odstępami tysięcy (12 345)."""
+    return f"{int(wartosc):,}".replace(",", " ")
+
+
+class RaportPostepu:
+    """
+    Postęp operacji na wierszach: aktualizuj(gotowe) można wołać dla każdego wiersza,
+    a wyswietl(procent, tekst) jest wywoływane najwyżej 10 razy na sekundę (i zawsze w zakoncz).
+    Tekst zawiera tempo (wierszy/s) i szacowany czas do końca, gdy znana jest liczba wszystkich wierszy.
+    """
+
+    def __init__(self, wyswietl, wszystkie=None, opis="Przetwarzanie...", jednostka="wierszy",
+                 czestotliwosc=CZESTOTLIWOSC_ODSWIEZANIA):
+        self.wyswietl = wyswietl
+        self.wszystkie = wszystkie
+        self.opis = opis
+        self.jednostka = jednostka
+        self.gotowe = 0
+        self.start = time.perf_counter()
+        self._odstep = 1.0 / czestotliwosc
+        self._nastepne_odswiezenie = 0.0
+
+    def aktualizuj(self, gotowe, opis=None):
+        """Zapisuje stan; wyświetla go tylko, gdy minął odstęp odświeżania."""
+        self.gotowe = gotowe
+        if opis is not None:
+            self.opis = opis
+        teraz = time.perf_counter()
+        if teraz >= self._nastepne_odswiezenie:
+            self._nastepne_odswiezenie = teraz + self._odstep
+            self.wyswietl(self.procent(), self.tekst())
+
+    def zakoncz(self, opis=None):
+        """Wyświetla stan końcowy bez względu na odstęp odświeżania."""
+        if opis is not None:
+            self.opis = opis
+        self.wyswietl(self.procent(), self.tekst())
+
+    def czas(self):
+        return time.perf_counter() - self.start
+
+    def tempo(self):
+        """Liczba wierszy na sekundę od początku operacji."""
+        return self.gotowe / max(self.czas(), 1e-9)
+
+    def pozostalo(self):
+        """Szacowany czas do końca w sekundach albo None, gdy nie da się go policzyć."""
+        tempo = self.tempo()
+        if not self.wszystkie or not self.gotowe or tempo <= 0:
+            return None
+        return max(self.wszystkie - self.gotowe, 0) / tempo
+
+    def procent(self):
+        if not self.wszystkie:
+            return 0
+        return min(int(self.gotowe * 100 / self.wszystkie), 100)
+
+    def tekst(self):
+        """Np. "Przetwarzanie... 12 000/50 000, 4 210 wierszy/s, pozostało 0:09"."""
+        if not self.gotowe:
+            return self.opis
+        licznik = _liczba(self.gotowe) + (f"/{_liczba(self.wszystkie)}" if self.wszystkie else "")
+        czesci = [f"{self.opis} {licznik}"]
+        if self.czas() < self._odstep:
+            # Tuż po starcie tempo i czas do końca byłyby przypadkowe
+            return czesci[0]
+        czesci.append(f"{_liczba(self.tempo())} {self.jednostka}/s")
+        pozostalo = self.pozostalo()
+        if pozostalo is not None and self.gotowe < self.wszystkie:
+            czesci.append(f"pozostało {formatuj_czas(pozostalo)}")
+        return ", ".join(czesci)
+
+
+class BuforKomunikatow:
+    """
+    Komunikaty dziennika z dowolnego wątku zbierane w buforze cyklicznym; widget Tk wypisuje je
+    partią co 1/czestotliwosc s (jedno wywołanie after na partię zamiast na każdy komunikat).
+    Przy przepełnieniu najstarsze komunikaty są pomijane, a partia zaczyna się od ich liczby.
+    """
+
+    def __init__(self, widget, wypisz, czestotliwosc=CZESTOTLIWOSC_ODSWIEZANIA, rozmiar=ROZMIAR_BUFORA_KOMUNIKATOW):
+        self.widget = widget
+        self.wypisz = wypisz
+        self.odstep_ms = max(int(1000 / czestotliwosc), 1)
+        self._bufor = deque(maxlen=rozmiar)
+        self._pominiete = 0
+        self._zaplanowane = False
+        self._blokada = threading.Lock()
+
+    def dodaj(self, komunikat):
+        with self._blokada:
+            if len(self._bufor) == self._bufor.maxlen:
+                self._pominiete += 1
+            self._bufor.append(komunikat)
+            if self._zaplanowane:
+                return
+            self._zaplanowane = True
+        self.widget.after(self.odstep_ms, self._zrzuc)
+
+    def _zrzuc(self):
+        with self._blokada:
+            komunikaty = list(self._bufor)
+            self._bufor.clear()
+            if self._pominiete:
+                komunikaty.insert(0, f"... (pominięto {self._pominiete} komunikatów)")
+                self._pominiete = 0
+            self._zaplanowane = False
+        if komunikaty:
+            self.wypisz(komunikaty)
@@ -0,0 +1,259 @@
+import atexit
+import codecs
+import importlib
+import json
+import os
+import runpy
+import selectors
+import signal
+import sys
+import traceback
+
+# Rezydentny proces roboczy PythonRunnera (main.cpp). Ciężkie moduły wspólne (pandas, openpyxl,
+# requests, customtkinter i moduły z tego katalogu) są importowane raz, przy starcie launchera,
+# a każdy skrypt jest wykonywany w procesie potomnym utworzonym przez fork - bez startu nowego
+# interpretera i bez ponownych importów. Launcher i serwer wymieniają obiekty JSON, jeden w wierszu:
+#
+#   stdin  (polecenia): {"polecenie": "uruchom", "id": 1, "skrypt": "/sciezka/giga_bol.py", "argumenty": []}
+#                       {"polecenie": "zatrzymaj", "id": 1}
+#                       {"polecenie": "zakoncz"}
+#   stdout (zdarzenia): {"zdarzenie": "gotowy", "pid": 100}
+#                       {"zdarzenie": "start", "id": 1, "pid": 101}
+#                       {"zdarzenie": "stdout" albo "stderr", "id": 1, "tekst": "..."}
+#                       {"zdarzenie": "koniec", "id": 1, "kod": 0}  (kod < 0: zabity sygnałem -kod)
+#                       {"zdarzenie": "blad", "id": 1, "tekst": "..."}
+#
+# Tylko Linux - na Windows nie ma fork, a na macOS fork bez exec nie jest bezpieczny (Cocoa, Tk,
+# SystemConfiguration przy wyszukiwaniu proxy), więc tam launcher uruchamia skrypty jak dotąd, nowym interpreterem.
+# Uruchomienie: python serwer_skryptow.py (robi to launcher; zamknięcie stdin kończy serwer)
+
+KATALOG_SKRYPTOW = os.path.dirname(os.path.abspath(__file__))
+ROZMIAR_ODCZYTU = 65536
+KOD_NIEOBSLUGIWANEJ_PLATFORMY = 2
+
+MODULY_WSPOLNE = [
+    'numpy', 'pandas', 'openpyxl', 'requests', 'lxml.etree', 'xml.etree.ElementTree', 'csv', 'sqlite3',
+    'concurrent.futures', 'tkinter', 'tkinter.filedialog', 'tkinter.messagebox',
+    'konsola', 'postep', 'pobieranie_feedow', 'parser_ofert', 'delta_ofert', 'zapis_excel', 'zapis_tabel',
+    'wczytywanie_excel', 'korekta_znakow', 'customtkinter',
+]
+
+
+def zaladuj_moduly(moduly=MODULY_WSPOLNE):
+    """Importuje dostępne moduły wspólne; brakujące pomija (skrypt zgłosi je sam przy imporcie)."""
+    zaladowane = []
+    for nazwa in moduly:
+        try:
+            importlib.import_module(nazwa)
+        except Exception:
+            continue
+        zaladowane.append(nazwa)
+    return zaladowane
+
+
+def _kod_wyjscia(wyjatek):
+    """Kod wyjścia z SystemExit - tak jak przy `python skrypt.py`."""
+    if wyjatek.code is None:
+        return 0
+    if isinstance(wyjatek.code, int):
+        return wyjatek.code
+    print(wyjatek.code, file=sys.stderr)
+    return 1
+
+
+def _wykonaj_w_potomku(skrypt, argumenty, wyjscie, bledy, zamknij):
+    """Proces potomny: wykonuje skrypt jak `python skrypt argumenty` i kończy się jego kodem wyjścia."""
+    kod = 0
+    try:
+        # Własna grupa procesów: "zatrzymaj" obejmuje też procesy robocze uruchomione przez skrypt
+        # (rodzic ustawia ją również po swojej stronie fork)
+        try:
+            os.setpgid(0, 0)
+        except OSError:
+            pass
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        for deskryptor in zamknij:
+            os.close(deskryptor)
+        pusty = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(pusty, 0)
+        os.close(pusty)
+        os.dup2(wyjscie, 1)
+        os.dup2(bledy, 2)
+        os.close(wyjscie)
+        os.close(bledy)
+        sys.stdin = open(os.devnull, encoding='utf-8')
+        # Wiersze trafiają do konsoli launchera od razu, a nie dopiero po zapełnieniu bufora
+        sys.stdout.reconfigure(line_buffering=True)
+        sys.stderr.reconfigure(line_buffering=True)
+
+        sys.argv = [skrypt] + list(argumenty)
+        sys.path[0] = os.path.dirname(os.path.abspath(skrypt))
+        runpy.run_path(skrypt, run_name='__main__')
+    except SystemExit as e:
+        kod = _kod_wyjscia(e)
+    except KeyboardInterrupt:
+        kod = 130
+    except BaseException:
+        traceback.print_exc()
+        kod = 1
+    finally:
+        try:
+            # os._exit pomija zakończenie interpretera, więc funkcje atexit skryptu są wołane tutaj
+            atexit._run_exitfuncs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(kod)
+
+
+class Zadanie:
+    """Uruchomiony skrypt: pid procesu potomnego i otwarte końce potoków stdout/stderr."""
+
+    def __init__(self, id_zadania, pid):
+        self.id = id_zadania
+        self.pid = pid
+        self.potoki = {}  # deskryptor -> (nazwa strumienia, dekoder UTF-8)
+
+
+class SerwerSkryptow:
+    """Pętla zdarzeń serwera: polecenia ze stdin, wyjście procesów potomnych i ich zakończenie."""
+
+    def __init__(self, kanal):
+        self.kanal = kanal
+        self.wybor = selectors.DefaultSelector()
+        self.zadania = {}
+        self.dziala = True
+        self._bufor_polecen = b''
+        self.wybor.register(0, selectors.EVENT_READ, None)
+
+    def wyslij(self, **zdarzenie):
+        # ensure_ascii: kanał jest czysto ASCII, niezależnie od kodowania ustawionego w systemie
+        self.kanal.write(json.dumps(zdarzenie) + '\n')
+        self.kanal.flush()
+
+    def petla(self):
+        while self.dziala or self.zadania:
+            for klucz, _ in self.wybor.select():
+                if klucz.data is None:
+                    self._czytaj_polecenia()
+                else:
+                    self._czytaj_wyjscie(klucz.fd, klucz.data)
+
+    def _czytaj_polecenia(self):
+        dane = os.read(0, ROZMIAR_ODCZYTU)
+        if not dane:
+            # Launcher został zamknięty - tak jak QProcess przy zamykaniu okna, zatrzymuje uruchomione skrypty
+            self.wybor.unregister(0)
+            self._zakoncz()
+            return
+        self._bufor_polecen += dane
+        *wiersze, self._bufor_polecen = self._bufor_polecen.split(b'\n')
+        for wiersz in wiersze:
+            if not wiersz.strip():
+                continue
+            try:
+                polecenie = json.loads(wiersz)
+            except ValueError as e:
+                self.wyslij(zdarzenie='blad', id=None, tekst=f"Niepoprawne polecenie: {e}")
+                continue
+            self.wykonaj(polecenie)
+
+    def wykonaj(self, polecenie):
+        rodzaj = polecenie.get('polecenie')
+        id_zadania = polecenie.get('id')
+        if rodzaj == 'uruchom':
+            self.uruchom(id_zadania, polecenie.get('skrypt', ''), polecenie.get('argumenty') or [])
+        elif rodzaj == 'zatrzymaj':
+            self.zatrzymaj(id_zadania)
+        elif rodzaj == 'zakoncz':
+            self._zakoncz()
+        else:
+            self.wyslij(zdarzenie='blad', id=id_zadania, tekst=f"Nieznane polecenie: {rodzaj}")
+
+    def uruchom(self, id_zadania, skrypt, argumenty):
+        if id_zadania in self.zadania:
+            self.wyslij(zdarzenie='blad', id=id_zadania, tekst="Zadanie o tym identyfikatorze już działa.")
+            return
+        if not os.path.isfile(skrypt):
+            self.wyslij(zdarzenie='blad', id=id_zadania, tekst=f"Nie znaleziono skryptu: {skrypt}")
+            return
+        wyjscie_r, wyjscie_w = os.pipe()
+        bledy_r, bledy_w = os.pipe()
+        # Potomek nie potrzebuje kanału zdarzeń ani potoków innych zadań
+        zamknij = [self.kanal.fileno(), wyjscie_r, bledy_r]
+        zamknij += [deskryptor for zadanie in self.zadania.values() for deskryptor in zadanie.potoki]
+        # Bufory kopiowane do potomka muszą być puste, inaczej ich zawartość zostałaby wypisana dwa razy
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            _wykonaj_w_potomku(skrypt, argumenty, wyjscie_w, bledy_w, zamknij)
+        # Grupę ustawia też rodzic - "zatrzymaj" tuż po starcie nie może trafić przed setpgid w potomku
+        try:
+            os.setpgid(pid, pid)
+        except OSError:
+            # Potomek zdążył już sam ustawić grupę albo się zakończył
+            pass
+        os.close(wyjscie_w)
+        os.close(bledy_w)
+
+        zadanie = Zadanie(id_zadania, pid)
+        for deskryptor, strumien in ((wyjscie_r, 'stdout'), (bledy_r, 'stderr')):
+            zadanie.potoki[deskryptor] = (strumien, codecs.getincrementaldecoder('utf-8')('replace'))
+            self.wybor.register(deskryptor, selectors.EVENT_READ, zadanie)
+        self.zadania[id_zadania] = zadanie
+        self.wyslij(zdarzenie='start', id=id_zadania, pid=pid)
+
+    def zatrzymaj(self, id_zadania):
+        """Zabija proces skryptu razem z jego procesami potomnymi (jak QProcess::kill)."""
+        zadanie = self.zadania.get(id_zadania)
+        if zadanie is None:
+            return
+        try:
+            os.killpg(zadanie.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _zakoncz(self):
+        self.dziala = False
+        for id_zadania in list(self.zadania):
+            self.zatrzymaj(id_zadania)
+
+    def _czytaj_wyjscie(self, deskryptor, zadanie):
+        strumien, dekoder = zadanie.potoki[deskryptor]
+        dane = os.read(deskryptor, ROZMIAR_ODCZYTU)
+        tekst = dekoder.decode(dane, final=not dane)
+        if tekst:
+            self.wyslij(zdarzenie=strumien, id=zadanie.id, tekst=tekst)
+        if dane:
+            return
+        self.wybor.unregister(deskryptor)
+        os.close(deskryptor)
+        del zadanie.potoki[deskryptor]
+        if not zadanie.potoki:
+            # Oba potoki zamknięte - proces się kończy (albo już się zakończył)
+            _, status = os.waitpid(zadanie.pid, 0)
+            del self.zadania[zadanie.id]
+            self.wyslij(zdarzenie='koniec', id=zadanie.id, kod=os.waitstatus_to_exitcode(status))
+
+
+def main():
+    if not sys.platform.startswith('linux'):
+        print("Serwer skryptów działa tylko na Linux (fork bez exec).", file=sys.stderr)
+        return KOD_NIEOBSLUGIWANEJ_PLATFORMY
+    # Zdarzenia idą prywatną kopią stdout; przypadkowe print() modułów wspólnych trafiają na stderr
+    kanal = os.fdopen(os.dup(1), 'w', encoding='ascii', newline='\n')
+    os.dup2(2, 1)
+    if KATALOG_SKRYPTOW not in sys.path:
+        sys.path.insert(0, KATALOG_SKRYPTOW)
+    zaladuj_moduly()
+
+    serwer = SerwerSkryptow(kanal)
+    serwer.wyslij(zdarzenie='gotowy', pid=os.getpid())
+    serwer.petla()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,12 @@
 import xml.etree.ElementTree as ET
 import os
-import urllib.request
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from datetime import datetime
-from urllib.parse import urlparse
 import tempfile
 import time
-import openpyxl
-import re
+from pobieranie_feedow import pobierz_wiele, nazwa_pliku_z_url, opis_postepu
+from parser_ofert import iteruj_oferty, zbuduj_projekcje
+from zapis_excel import ZapisExcel
 
 # Ustawienia CustomTkinter
 ctk.set_appearance_mode("System")
@@ -20,156 +18,24 @@ DOMYSLNA_SCIEZKA_ZAPISU = os.path.join(os.path.expanduser("~"), "Downloads")
 
 # --- LOGIKA KOREKTY ZNAKÓW (ZE SKRYPTU 2) ---
 
-# Wzorzec Regex do usuwania większości znaków emoji
-EMOJI_PATTERN = re.compile(
-    "["
-    "\U0001F600-\U0001F64F"  # emotikony
-    "\U0001F300-\U0001F5FF"  # symbole i piktogramy
-    "\U0001F680-\U0001F6FF"  # transport i symbole map
-    "\U0001F700-\U0001F77F"  # symbole alchemiczne
-    "\U0001F780-\U0001F7FF"  # Rozszerzone kształty geometryczne
-    "\U0001F800-\U0001F8FF"  # Dodatkowe strzałki-C
-    "\U0001F900-\U0001F9FF"  # Dodatkowe symbole i piktogramy
-    "\U0001FA00-\U0001FA6F"  # Symbole szachowe
-    "\U0001FA70-\U0001FAFF"  # Symbole i piktogramy rozszerzone-A
-    "\U00002702-\U000027B0"  # Dingbaty
-    "\U000024C2-\U0001F251"
-    "\U0001f926-\U0001f937"
-    "\U00010000-\U0010ffff"
-    "\u2640-\u2642"
-    "\u2600-\u2B55"
-    "\u200d"
-    "\u23cf"
-    "\u23e9"
-    "\u231a"
-    "\ufe0f"  # selektor wariacji
-    "\u3030"
-    "]+",
-    flags=re.UNICODE,
-)
-
-# Słownik mapujący nieprawidłowe znaki/encje na poprawne polskie litery i symbole.
-POLISH_CHAR_MAP = {
-    # Złożone/długie encje jako pierwsze
-    '&#378;ó&#322;ty': 'żółty',
-
-    # Nazwane encje HTML (Wielkie litery)
-    '&Aacute;': 'Ą', '&Cacute;': 'Ć', '&Eacute;': 'Ę', '&Lacute;': 'Ł',
-    '&Nacute;': 'Ń', '&Oacute;': 'Ó', '&Sacute;': 'Ś', '&Zacute;': 'Ź',
-    '&Zdot;': 'Ż',
-
-    # Nazwane encje HTML (Małe litery)
-    '&aacute;': 'ą', '&cacute;': 'ć', '&eacute;': 'ę', '&lacute;': 'ł',
-    '&nacute;': 'ń', '&oacute;': 'ó', '&sacute;': 'ś', '&zacute;': 'ź',
-    '&zdot;': 'ż',
-
-    # Numeryczne encje HTML (Wielkie litery)
-    '&#260;': 'Ą', '&#262;': 'Ć', '&#280;': 'Ę', '&#321;': 'Ł',
-    '&#323;': 'Ń', '&#211;': 'Ó', '&#346;': 'Ś', '&#377;': 'Ź',
-    '&#379;': 'Ż',
-
-    # Numeryczne encje HTML (Małe litery)
-    '&#261;': 'ą', '&#263;': 'ć', '&#281;': 'ę', '&#322;': 'ł',
-    '&#324;': 'ń', '&#243;': 'ó', '&#347;': 'ś', '&#378;': 'ź',
-    '&#380;': 'ż',
-    
-    # Inne popularne symbole i encje
-    '&deg;': '°', '&bull;': '•', '&ndash;': '–', '&rsquo;': '’',
-    '&bdquo;': '„', '&rdquo;': '”', '&#10036;&#65039;': '', '&#10035;&#65039;': '',
-    '&#9851;&#65039;': '', '&#128209;': '', '&#8222;': '„', '&#8221;': '”',
-    '&#8216;': '‘', '&#8217;': '’', '&#8211;': '–', '&#8203;': '',
-    '&#9989;': '', '&#9749;': '', '&#11088;': '', '&#10003;': '',
-    '&#34;': '"', '&#39;': "'", '&#x2013;': '–', '&#2013;': '–',
-    '&#2019;': '’', '&nbsp;': ' ', '&amp;': '&', '&lt;': '<',
-    '&gt;': '>', '&quot;': '"', '&apos;': "'", '&#178;': '²',
-    '&#8220;': '“', '&#8230;': '…', '&#9679;': '•',
-
-    # Znaki do usunięcia
-    '✔': '', '✅': '', '❓': '', '▶️': '', '⭐': '', '⚡': '', '➡': '',
-}
-# Sortowanie słownika, aby najpierw przetwarzać dłuższe klucze
-POLISH_CHAR_MAP_SORTED = dict(sorted(POLISH_CHAR_MAP.items(), key=lambda item: len(item[0]), reverse=True))
-
-def correct_text(text):
-    """Stosuje wszystkie zdefiniowane poprawki do pojedynczego ciągu tekstowego."""
-    if not isinstance(text, str) or not text:
-        return text
-    
-    corrected_text = text
-    
-    # 1. Zamień wszystkie znane nieprawidłowe sekwencje znaków
-    for wrong_str, correct_char in POLISH_CHAR_MAP_SORTED.items():
-        if wrong_str in corrected_text:
-            corrected_text = corrected_text.replace(wrong_str, correct_char)
-            
-    # 2. Usuń wszystkie znaki emoji za pomocą wzorca regex
-    corrected_text = EMOJI_PATTERN.sub(r'', corrected_text)
-    
-    # 3. Usuń wiodące białe znaki
-    corrected_text = corrected_text.lstrip()
-    
-    return corrected_text
+# Mapa znaków, wzorzec emoji i correct_text są w module korekta_znakow (wspólnym z poprawa_znak)
+from korekta_znakow import correct_texts
 
 # --- FUNKCJE PODSTAWOWE (ZE SKRYPTU 1 Z MODYFIKACJAMI) ---
 
-def clean_text(text):
-    """Zastępuje znaki nowej linii i inne białe znaki pojedynczą spacją."""
-    if not text:
-        return ""
-    return " ".join(text.split())
+POLA_EXCEL = ['id', 'EAN', 'id_bl', 'name', 'desc']
 
-def pobierz_xml(url, sciezka_docelowa):
-    """Pobiera plik XML z podanego URL."""
-    try:
-        opener = urllib.request.build_opener()
-        opener.addheaders = [('User-agent', 'Mozilla/5.0')]
-        urllib.request.install_opener(opener)
-        urllib.request.urlretrieve(url, sciezka_docelowa)
-        return True
-    except Exception as e:
-        messagebox.showerror(f"Błąd pobierania ({url})", f"Wystąpił błąd: {e}")
-        return False
+def ean_oferty(oferta):
+    """EAN z atrybutu elementu <o>, a jeśli go brak - z <attrs>."""
+    return oferta.pola_o.get("EAN") or oferta.atrybut("EAN")
+
+PROJEKCJA_EXCEL = zbuduj_projekcje(POLA_EXCEL, {'EAN': ean_oferty})
 
 def parsuj_xml(sciezka_pliku):
     """Parsuje plik XML i ekstrahuje id, name, desc, EAN oraz id_bl."""
     try:
-        drzewo = ET.parse(sciezka_pliku)
-        root = drzewo.getroot()
-        dane = []
-
-        for element in root.findall("o"):
-            name_elem = element.find("name")
-            desc_elem = element.find("desc")
-
-            wiersz = {
-                "id": element.get("id"),
-                "EAN": "",
-                "name": clean_text(name_elem.text) if name_elem is not None else "",
-                "desc": clean_text(desc_elem.text) if desc_elem is not None else "",
-                "id_bl": ""
-            }
-
-            ean_val = element.get("EAN")
-            if ean_val:
-                wiersz["EAN"] = ean_val
-            else:
-                atrybuty_elem = element.find("attrs")
-                if atrybuty_elem is not None:
-                    for atrybut in atrybuty_elem.findall("a"):
-                        if atrybut.get("name") == "EAN":
-                            wiersz["EAN"] = clean_text(atrybut.text)
-                            break
-
-            atrybuty_idbl = element.find("attrs")
-            if atrybuty_idbl is not None:
-                for atrybut_idbl in atrybuty_idbl.findall("a"):
-                    if atrybut_idbl.get("name") == "id_bl":
-                        wiersz["id_bl"] = clean_text(atrybut_idbl.text)
-                        break
-
-            dane.append(wiersz)
-            
-        return dane
+        # Z <attrs> potrzebne są tylko EAN i id_bl (przy powtórzeniach pierwsze); obrazy są pomijane
+        return [PROJEKCJA_EXCEL(oferta) for oferta in iteruj_oferty(sciezka_pliku, {'EAN', 'id_bl'}, obrazy=False, pierwszy_atrybut=True)]
         
     except FileNotFoundError:
         messagebox.showerror("Błąd pliku", f"Nie znaleziono pliku: {sciezka_pliku}")
@@ -182,35 +48,21 @@ def parsuj_xml(sciezka_pliku):
         return []
 
 def zapisz_do_excel(dane, sciezka_pliku):
-    """Zapisuje dane do pliku Excel, jednocześnie korygując znaki."""
-    pola = ['id', 'EAN', 'id_bl', 'name', 'desc']
-    workbook = openpyxl.Workbook()
-    sheet = workbook.active
-    sheet.title = "Produkty"
-    sheet.append(pola) # Zapis nagłówków
-
+    """Zapisuje dane do pliku Excel (wiersz po wierszu, tryb write-only), jednocześnie korygując znaki."""
     try:
-        for wiersz_danych in dane:
-            wiersz_do_zapisu = []
-            for pole in pola:
-                wartosc = wiersz_danych.get(pole, "")
-                # Stosuj korektę tylko do ciągów tekstowych
-                poprawiona_wartosc = correct_text(wartosc) if isinstance(wartosc, str) else wartosc
-                wiersz_do_zapisu.append(poprawiona_wartosc)
-            sheet.append(wiersz_do_zapisu)
-        
-        workbook.save(sciezka_pliku)
+        with ZapisExcel(sciezka_pliku, POLA_EXCEL, "Produkty", stala_pamiec=True) as arkusz:
+            for wiersz_danych in dane:
+                # Wiersze są krotkami w kolejności POLA_EXCEL; korekta dotyczy tylko ciągów tekstowych
+                arkusz.writerow(correct_texts(wiersz_danych))
         return True
     except Exception as e:
         messagebox.showerror(f"Błąd zapisu Excel ({os.path.basename(sciezka_pliku)})", f"Wystąpił błąd: {e}")
         return False
-    finally:
-        if workbook:
-            workbook.close()
 
 def przetworz_wiele_url_osobne_pliki(urls, sciezka_zapisu, app_instance):
     """Przetwarza wiele URL-i i zapisuje każdy do osobnego, poprawionego pliku Excel."""
     katalog_tymczasowy = tempfile.gettempdir()
+    urls = [url.strip() for url in urls if url.strip()]
     liczba_url = len(urls)
     sukcesy = 0
     bledy_pobierania, bledy_parsowania, bledy_zapisu = 0, 0, 0
@@ -226,15 +78,14 @@ def przetworz_wiele_url_osobne_pliki(urls, sciezka_zapisu, app_instance):
             messagebox.showerror("Błąd ścieżki zapisu", f"Nie można utworzyć katalogu: {sciezka_zapisu}\nBłąd: {e}")
             return
 
-    for i, url in enumerate(urls):
-        url = url.strip()
-        if not url:
-            continue
-
-        postep = (i + 1) / liczba_url
-        nazwa_pliku_url = os.path.basename(urlparse(url).path) or f"feed_{i+1}.xml"
-        app_instance.update_status(f"Przetwarzanie {i+1}/{liczba_url}: {nazwa_pliku_url}...", postep)
+    def pokaz_postep_pobierania(pobrane_bajty, ukonczone, wszystkie):
+        app_instance.update_status(opis_postepu(pobrane_bajty, ukonczone, wszystkie), ukonczone / wszystkie)
 
+    # Pobieranie odbywa się równolegle; każdy feed jest przetwarzany zaraz po pobraniu
+    for ukonczone, (i, url, sciezka_lokalna_xml, blad) in enumerate(
+            pobierz_wiele(urls, katalog_tymczasowy, pokaz_postep_pobierania), start=1):
+        postep = ukonczone / liczba_url
+        nazwa_pliku_url = nazwa_pliku_z_url(url, i + 1)
         nazwa_bazowa_xml = os.path.splitext(nazwa_pliku_url)[0]
         
         # --- MODYFIKACJA: Wyodrębnij nazwę hurtowni ---
@@ -243,34 +94,34 @@ def przetworz_wiele_url_osobne_pliki(urls, sciezka_zapisu, app_instance):
         nazwa_hurtowni = nazwa_bazowa_xml.split('_')[0]
         # --- KONIEC MODYFIKACJI ---
 
-        teraz_timestamp_temp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        sciezka_lokalna_xml = os.path.join(katalog_tymczasowy, f"temp_{nazwa_bazowa_xml}_{teraz_timestamp_temp}.xml")
-
-        if pobierz_xml(url, sciezka_lokalna_xml):
-            dane = parsuj_xml(sciezka_lokalna_xml)
-            if dane:
-                # --- MODYFIKACJA: Użyj nazwy hurtowni do stworzenia nazwy pliku Excel ---
-                nazwa_pliku_excel = os.path.join(sciezka_zapisu, f"{nazwa_hurtowni}.xlsx")
-                # --- KONIEC MODYFIKACJI ---
-                
-                app_instance.update_status(f"Zapisywanie: {os.path.basename(nazwa_pliku_excel)}...", postep)
-                if zapisz_do_excel(dane, nazwa_pliku_excel):
-                    sukcesy += 1
-                else:
-                    bledy_zapisu += 1
-            else:
-                bledy_parsowania += 1
-                app_instance.update_status(f"Błąd parsowania {nazwa_pliku_url}. Pomijanie.", postep)
-                time.sleep(0.5)
-            
-            try:
-                os.remove(sciezka_lokalna_xml)
-            except Exception as e:
-                print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {sciezka_lokalna_xml}: {e}")
-        else:
+        if blad is not None:
+            messagebox.showerror(f"Błąd pobierania ({url})", f"Wystąpił błąd: {blad}")
             bledy_pobierania += 1
             app_instance.update_status(f"Błąd pobierania {nazwa_pliku_url}. Pomijanie.", postep)
             time.sleep(0.5)
+            continue
+
+        app_instance.update_status(f"Przetwarzanie {ukonczone}/{liczba_url}: {nazwa_pliku_url}...", postep)
+        dane = parsuj_xml(sciezka_lokalna_xml)
+        if dane:
+            # --- MODYFIKACJA: Użyj nazwy hurtowni do stworzenia nazwy pliku Excel ---
+            nazwa_pliku_excel = os.path.join(sciezka_zapisu, f"{nazwa_hurtowni}.xlsx")
+            # --- KONIEC MODYFIKACJI ---
+
+            app_instance.update_status(f"Zapisywanie: {os.path.basename(nazwa_pliku_excel)}...", postep)
+            if zapisz_do_excel(dane, nazwa_pliku_excel):
+                sukcesy += 1
+            else:
+                bledy_zapisu += 1
+        else:
+            bledy_parsowania += 1
+            app_instance.update_status(f"Błąd parsowania {nazwa_pliku_url}. Pomijanie.", postep)
+            time.sleep(0.5)
+
+        try:
+            os.remove(sciezka_lokalna_xml)
+        except Exception as e:
+            print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {sciezka_lokalna_xml}: {e}")
 
     if sukcesy > 0:
         messagebox.showinfo("Zakończono przetwarzanie", f"Pomyślnie przetworzono i zapisano {sukcesy} z {liczba_url} plików w:\n{os.path.abspath(sciezka_zapisu)}\n\n"
@@ -0,0 +1,47 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Równoległe wczytywanie wielu plików Excel do DataFrame (dziel_lacz - składanie niestandardowe,
+# laczenie_dowolne). Odczyt xlsx to głównie rozpakowywanie i parsowanie XML, więc każdy plik
+# jest czytany w osobnym procesie; wyniki wracają w kolejności podanych ścieżek.
+
+
+def _wczytaj_excel(sciezka_pliku, opcje):
+    """Wczytuje jeden plik w procesie roboczym."""
+    import pandas as pd
+    return pd.read_excel(sciezka_pliku, **opcje)
+
+
+def wczytaj_excele(sciezki_plikow, postep=None, maks_procesow=None, **opcje):
+    """
+    Wczytuje pliki (pd.read_excel z podanymi opcjami) w puli procesów.
+    Zwraca listę par (DataFrame albo None, wyjątek albo None) w kolejności sciezki_plikow,
+    więc błąd jednego pliku nie przerywa pozostałych - decyzję podejmuje wywołujący.
+    postep(gotowe, wszystkie, sciezka) jest wywoływany w bieżącym wątku po każdym pliku.
+    """
+    sciezki_plikow = list(sciezki_plikow)
+    wyniki = [None] * len(sciezki_plikow)
+    procesy = min(len(sciezki_plikow), maks_procesow or os.cpu_count() or 1)
+
+    if procesy <= 1:
+        # Jeden plik lub jeden rdzeń - bez narzutu uruchamiania procesów
+        for indeks, sciezka in enumerate(sciezki_plikow):
+            try:
+                wyniki[indeks] = (_wczytaj_excel(sciezka, opcje), None)
+            except Exception as e:
+                wyniki[indeks] = (None, e)
+            if postep:
+                postep(indeks + 1, len(sciezki_plikow), sciezka)
+        return wyniki
+
+    with ProcessPoolExecutor(max_workers=procesy) as executor:
+        zadania = {executor.submit(_wczytaj_excel, sciezka, opcje): indeks for indeks, sciezka in enumerate(sciezki_plikow)}
+        for gotowe, zadanie in enumerate(as_completed(zadania), 1):
+            indeks = zadania[zadanie]
+            try:
+                wyniki[indeks] = (zadanie.result(), None)
+            except Exception as e:
+                wyniki[indeks] = (None, e)
+            if postep:
+                postep(gotowe, len(sciezki_plikow), sciezki_plikow[indeks])
+    return wyniki
@@ -1,148 +1,104 @@
 import xml.etree.ElementTree as ET
-import csv
 import os
-import urllib.request
-import customtkinter as ctk
-from tkinter import filedialog, messagebox
+import sys
 from datetime import datetime
-from urllib.parse import urlparse
 import tempfile
 import time
-
-# Ustawienia CustomTkinter
-ctk.set_appearance_mode("System")
-ctk.set_default_color_theme("blue")
+from pobieranie_feedow import pobierz_wiele, nazwa_pliku_z_url, opis_postepu
+from zapis_tabel import ROZSZERZENIE_CSV, ROZSZERZENIE_PARQUET, otworz_zapis_tabeli
+from delta_ofert import KOLUMNA_ZMIANY, MagazynOdciskow, tylko_zmiany
+from parser_ofert import POLA_PODSTAWOWE, iteruj_oferty, zbuduj_projekcje
+from pomiary import Pomiary, policz, sciezka_obok
+# Komunikaty jak tkinter.messagebox; okno (customtkinter) jest w xmlcsv2_okno i ładuje się tylko dla GUI
+from konsola import StatusKonsoli, messagebox, utworz_parser, uruchom
 
 # --- Standardowa ścieżka zapisu (można zmienić) ---
 DOMYSLNA_SCIEZKA_ZAPISU = os.path.join(os.path.expanduser("~"), "Downloads")
 # ----------------------------------------------------
 
-def clean_text(text):
-    """Zastępuje znaki nowej linii i inne białe znaki pojedynczą spacją."""
-    if not text:
-        return ""
-    # Rozdziela tekst po białych znakach (spacje, tabulatory, entery),
-    # łączy je z powrotem pojedynczą spacją i usuwa wiodące/końcowe białe znaki.
-    return " ".join(text.split())
-
-def pobierz_xml(url, sciezka_docelowa):
-    """Pobiera plik XML z podanego URL."""
+def skanuj_naglowek_xml(sciezka_pliku):
+    """
+    Pierwszy przebieg trybu strumieniowego: zbiera nazwy atrybutów i maksymalną liczbę
+    obrazów bez przechowywania wierszy. Zwraca (atrybuty, maks_liczba_obrazow, liczba_ofert).
+    """
     try:
-        # Użycie nagłówka User-Agent, aby uniknąć blokowania przez niektóre serwery
-        opener = urllib.request.build_opener()
-        opener.addheaders = [('User-agent', 'Mozilla/5.0')]
-        urllib.request.install_opener(opener)
-        urllib.request.urlretrieve(url, sciezka_docelowa)
-        return True
-    except Exception as e:
-        messagebox.showerror(f"Błąd pobierania ({url})", f"Wystąpił błąd: {e}")
-        return False
-
-def parsuj_xml(sciezka_pliku):
-    """Parsuje plik XML i ekstrahuje dane, usuwając znaki nowej linii z pól tekstowych."""
-    try:
-        drzewo = ET.parse(sciezka_pliku)
-        root = drzewo.getroot()
         atrybuty = set()
         maks_liczba_obrazow = 0
-        dane = []
-
-        for element in root.findall("o"):
-            # Pobranie elementów, aby uniknąć wielokrotnego wyszukiwania
-            cat_elem = element.find("cat")
-            name_elem = element.find("name")
-            desc_elem = element.find("desc")
-
-            # Utworzenie wiersza danych z zastosowaniem funkcji clean_text do pól tekstowych
-            wiersz = {
-                "id": element.get("id"),
-                "url": element.get("url"),
-                "price": element.get("price"),
-                "avail": element.get("avail"),
-                "weight": element.get("weight"),
-                "stock": element.get("stock"),
-                "cat": clean_text(cat_elem.text) if cat_elem is not None else "",
-                "name": clean_text(name_elem.text) if name_elem is not None else "",
-                "desc": clean_text(desc_elem.text) if desc_elem is not None else ""
-            }
-            
-            # Przetwarzanie atrybutów z czyszczeniem ich wartości
-            atrybuty_elem = element.find("attrs")
-            if atrybuty_elem is not None:
-                for atrybut in atrybuty_elem.findall("a"):
-                    nazwa_atrybutu = atrybut.get("name")
-                    if nazwa_atrybutu:
-                        atrybuty.add(nazwa_atrybutu)
-                        wiersz[nazwa_atrybutu] = clean_text(atrybut.text)
-
-            # --- POPRAWIONA SEKCJA PRZETWARZANIA OBRAZÓW ---
-            liczba_obrazow_w_wierszu = 0
-            obrazy_elem = element.find("imgs")
-            if obrazy_elem is not None:
-                # 1. Przetwarzanie obrazu głównego (<main>)
-                main_image = obrazy_elem.find("main")
-                if main_image is not None and main_image.get("url"):
-                    wiersz["image0"] = main_image.get("url")
-                    liczba_obrazow_w_wierszu = 1
-                
-                # 2. Ustalenie indeksu startowego dla dodatkowych obrazów (<i>)
-                # Jeśli obraz główny istnieje, zaczynamy od image1, w przeciwnym razie od image0
-                start_index = 1 if "image0" in wiersz else 0
-
-                # 3. Przetwarzanie dodatkowych obrazów (<i>)
-                for i, img in enumerate(obrazy_elem.findall("i"), start=start_index):
-                    if img.get("url"):
-                        wiersz[f"image{i}"] = img.get("url")
-                        # Aktualizujemy liczbę obrazów na podstawie najwyższego indeksu
-                        liczba_obrazow_w_wierszu = max(liczba_obrazow_w_wierszu, i + 1)
-            
-            maks_liczba_obrazow = max(maks_liczba_obrazow, liczba_obrazow_w_wierszu)
-            dane.append(wiersz)
-            
-        return sorted(list(atrybuty)), maks_liczba_obrazow, dane
-        
+        liczba_ofert = 0
+
+        for oferta in iteruj_oferty(sciezka_pliku):
+            atrybuty.update(oferta.atrybuty)
+            maks_liczba_obrazow = max(maks_liczba_obrazow, oferta.liczba_obrazow())
+            liczba_ofert += 1
+
+        return atrybuty, maks_liczba_obrazow, liczba_ofert
+
     except FileNotFoundError:
         messagebox.showerror("Błąd pliku", f"Nie znaleziono pliku: {sciezka_pliku}")
-        return [], 0, []
+        return set(), 0, 0
     except ET.ParseError as e:
         messagebox.showerror("Błąd parsowania XML", f"Błąd w pliku {os.path.basename(sciezka_pliku)}: {e}")
-        return [], 0, []
+        return set(), 0, 0
     except Exception as e:
         messagebox.showerror("Nieoczekiwany błąd parsowania", f"Wystąpił błąd: {e}")
-        return [], 0, []
-
-def zapisz_do_csv(dane, atrybuty_lista, maks_liczba_obrazow, sciezka_pliku):
-    """Zapisuje połączone dane do jednego pliku CSV."""
-    pola_podstawowe = ['id', 'url', 'price', 'avail', 'weight', 'stock', 'cat', 'name', 'desc']
-    pola_atrybutow = atrybuty_lista 
-    pola_obrazow = [f"image{i}" for i in range(maks_liczba_obrazow)]
-    pola = pola_podstawowe + pola_atrybutow + pola_obrazow
+        return set(), 0, 0
+
+def zapisz_do_csv_strumieniowo(sciezki_xml, atrybuty_lista, maks_liczba_obrazow, sciezka_pliku, magazyny=None,
+                               pomiary=None, urls=None):
+    """
+    Drugi przebieg trybu strumieniowego: czyta oferty z plików XML jedna po drugiej
+    i od razu zapisuje je do CSV, więc zużycie pamięci nie zależy od wielkości feedów.
+    W trybie delta (magazyny - lista równoległa do sciezki_xml) zapisuje tylko zmienione oferty.
+    Z pomiarami każdy feed (urls - lista równoległa do sciezki_xml) dostaje wpis 'zapis'
+    (odczyt ofert i zapis wierszy), a cały plik, łącznie z zamknięciem, wpis 'zapis_pliku'.
+    """
+    pola = POLA_PODSTAWOWE + atrybuty_lista + [f"image{i}" for i in range(maks_liczba_obrazow)]
+    projekcja = zbuduj_projekcje(pola)
+    pola_zapisu = pola + [KOLUMNA_ZMIANY] if magazyny else pola
+    pomiary = pomiary or Pomiary('xmlcsv2', wlaczone=False)
 
     try:
-        with open(sciezka_pliku, 'w', encoding='utf-8-sig', newline='') as plik_csv:
-            writer = csv.DictWriter(plik_csv, fieldnames=pola, delimiter='|', extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(dane)
+        with pomiary.etap('zapis_pliku', plik=sciezka_pliku), \
+                otworz_zapis_tabeli(sciezka_pliku, pola_zapisu, '|', ['cat'] + atrybuty_lista) as writer:
+            for indeks, sciezka_xml in enumerate(sciezki_xml):
+                with pomiary.etap('zapis', urls[indeks] if urls else sciezka_xml) as wpis:
+                    wiersze = map(projekcja, iteruj_oferty(sciezka_xml))
+                    if magazyny:
+                        wiersze = tylko_zmiany(wiersze, pola, magazyny[indeks])
+                    if pomiary.wlaczone:
+                        wiersze = policz(wiersze, wpis, 'wiersze')
+                    writer.writerows(wiersze)
+        # Nowy stan zapisujemy dopiero po udanym zapisie pliku
+        for magazyn in magazyny or []:
+            magazyn.zatwierdz()
         messagebox.showinfo("Sukces", f"Wszystkie dane zostały pomyślnie zapisane do:\n{os.path.abspath(sciezka_pliku)}")
         return True
     except Exception as e:
         messagebox.showerror(f"Błąd zapisu CSV ({os.path.basename(sciezka_pliku)})", f"Wystąpił błąd: {e}")
         return False
 
-def przetworz_wiele_url_jeden_plik(urls, sciezka_zapisu_csv, app_instance):
-    """Przetwarza wiele URL-i i zapisuje do jednego pliku CSV."""
-    all_dane = []
+def przetworz_wiele_url_jeden_plik(urls, sciezka_zapisu_csv, app_instance, rozszerzenie=ROZSZERZENIE_CSV, tryb_delta=False,
+                                   pomiary=None):
+    """
+    Przetwarza wiele URL-i i zapisuje do jednego pliku CSV w trybie strumieniowym.
+    Pierwszy przebieg (skanowanie nagłówka) ustala kolumny atrybutów i obrazów,
+    drugi przebieg przepisuje oferty wprost do CSV bez gromadzenia ich w pamięci.
+    Z włączonymi pomiarami (domyślnie według FEEDY_POMIARY) obok wyniku powstaje
+    dziennik <wynik>.pomiary.jsonl. Zwraca ścieżkę zapisanego pliku albo None, gdy nic nie zapisano.
+    """
+    pomiary = pomiary or Pomiary('xmlcsv2')
     all_atrybuty = set()
     global_maks_liczba_obrazow = 0
-    all_nazwy_bazowe = []
+    pobrane_feedy = []
     katalog_tymczasowy = tempfile.gettempdir()
+    urls = [url.strip() for url in urls if url.strip()]
     liczba_url = len(urls)
     sukcesy_przetwarzania = 0
     bledy = 0
 
     if liczba_url == 0:
         app_instance.update_status("Nie podano żadnych URL-i.", 0)
-        return
+        return None
 
     if not os.path.exists(sciezka_zapisu_csv):
         try:
@@ -150,165 +106,137 @@ def przetworz_wiele_url_jeden_plik(urls, sciezka_zapisu_csv, app_instance):
         except Exception as e:
             messagebox.showerror("Błąd ścieżki zapisu", f"Nie można utworzyć katalogu: {sciezka_zapisu_csv}\nBłąd: {e}\nPliki będą zapisywane w katalogu roboczym.")
             sciezka_zapisu_csv = os.getcwd()
-            app_instance.pole_sciezki_zapisu.delete(0, ctk.END)
-            app_instance.pole_sciezki_zapisu.insert(0, sciezka_zapisu_csv)
+            app_instance.ustaw_katalog_zapisu(sciezka_zapisu_csv)
 
-    for i, url in enumerate(urls):
-        url = url.strip()
-        if not url: continue
+    zapisany_plik = None
+    nazwa_pliku_csv = None
 
-        postep = (i + 1) / liczba_url
-        nazwa_pliku_url = os.path.basename(urlparse(url).path) or f"feed_{i+1}.xml"
-        app_instance.update_status(f"Przetwarzanie {i+1}/{liczba_url}: {nazwa_pliku_url}...", postep)
+    def pokaz_postep_pobierania(pobrane_bajty, ukonczone, wszystkie):
+        app_instance.update_status(opis_postepu(pobrane_bajty, ukonczone, wszystkie), ukonczone / wszystkie * 0.9)
 
-        nazwa_bazowa_xml = os.path.splitext(nazwa_pliku_url)[0]
-        teraz_timestamp_temp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        sciezka_lokalna_xml = os.path.join(katalog_tymczasowy, f"temp_{nazwa_bazowa_xml}_{teraz_timestamp_temp}.xml")
-
-        if pobierz_xml(url, sciezka_lokalna_xml):
-            atrybuty, maks_obr, dane = parsuj_xml(sciezka_lokalna_xml)
-            if dane:
-                all_dane.extend(dane)
+    try:
+        # Pobieranie odbywa się równolegle; każdy feed jest skanowany zaraz po pobraniu
+        for ukonczone, (i, url, sciezka_lokalna_xml, blad) in enumerate(
+                pobierz_wiele(urls, katalog_tymczasowy, pokaz_postep_pobierania, pomiary=pomiary), start=1):
+            postep = ukonczone / liczba_url * 0.9
+            nazwa_pliku_url = nazwa_pliku_z_url(url, i + 1)
+            nazwa_bazowa_xml = os.path.splitext(nazwa_pliku_url)[0]
+
+            if blad is not None:
+                messagebox.showerror(f"Błąd pobierania ({url})", f"Wystąpił błąd: {blad}")
+                bledy += 1
+                app_instance.update_status(f"Błąd pobierania {nazwa_pliku_url}. Pomijanie.", postep)
+                time.sleep(0.5)
+                continue
+
+            app_instance.update_status(f"Przetwarzanie {ukonczone}/{liczba_url}: {nazwa_pliku_url}...", postep)
+            with pomiary.etap('parsowanie', url) as wpis:
+                atrybuty, maks_obr, liczba_ofert = skanuj_naglowek_xml(sciezka_lokalna_xml)
+                wpis['oferty'] = liczba_ofert
+            if liczba_ofert:
+                # Plik zostaje na dysku do drugiego przebiegu
+                pobrane_feedy.append((i, sciezka_lokalna_xml, nazwa_bazowa_xml))
                 all_atrybuty.update(atrybuty)
                 global_maks_liczba_obrazow = max(global_maks_liczba_obrazow, maks_obr)
-                all_nazwy_bazowe.append(nazwa_bazowa_xml)
                 sukcesy_przetwarzania += 1
-            else:
-                bledy += 1
-                app_instance.update_status(f"Błąd parsowania {nazwa_pliku_url}. Pomijanie.", postep)
-                time.sleep(0.5)
-            
-            try:
-                os.remove(sciezka_lokalna_xml)
-            except Exception as e:
-                print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {sciezka_lokalna_xml}: {e}")
-        else:
+                continue
+
             bledy += 1
-            app_instance.update_status(f"Błąd pobierania {nazwa_pliku_url}. Pomijanie.", postep)
+            app_instance.update_status(f"Błąd parsowania {nazwa_pliku_url}. Pomijanie.", postep)
             time.sleep(0.5)
-
-    if not all_dane:
-        app_instance.update_status("Nie udało się przetworzyć żadnych danych.", 0)
-        messagebox.showwarning("Brak danych", f"Nie udało się pobrać ani sparsować danych z żadnego podanego URL. Błędy: {bledy}")
-        app_instance.reset_gui_after_delay()
-        return
-
-    # Tworzenie nazwy pliku
-    nazwa_laczona = "_".join(all_nazwy_bazowe)
-    if len(nazwa_laczona) > 100:
-        nazwa_laczona = f"{all_nazwy_bazowe[0]}_and_{len(all_nazwy_bazowe)-1}_more"
-        
-    teraz_format_czasu_csv = datetime.now().strftime("%d%m%y-%H%M%S")
-    nazwa_pliku_csv = os.path.join(sciezka_zapisu_csv, f"{nazwa_laczona}_{teraz_format_czasu_csv}.csv")
-
-    app_instance.update_status("Zapisywanie połączonych danych...", 0.95)
-    
-    if zapisz_do_csv(all_dane, sorted(list(all_atrybuty)), global_maks_liczba_obrazow, nazwa_pliku_csv):
-        app_instance.update_status(f"Zakończono. Przetworzono: {sukcesy_przetwarzania}, Błędy: {bledy}", 1)
-    else:
-        app_instance.update_status(f"Błąd zapisu pliku! Przetworzono: {sukcesy_przetwarzania}, Błędy: {bledy}", 1)
+            usun_plik_tymczasowy(sciezka_lokalna_xml)
+
+        # Zapis w kolejności podanych URL-i, niezależnie od kolejności ukończenia pobrań
+        pobrane_feedy.sort()
+        sciezki_do_zapisu = [sciezka for _, sciezka, _ in pobrane_feedy]
+        all_nazwy_bazowe = [nazwa for _, _, nazwa in pobrane_feedy]
+
+        if not sciezki_do_zapisu:
+            app_instance.update_status("Nie udało się przetworzyć żadnych danych.", 0)
+            messagebox.showwarning("Brak danych", f"Nie udało się pobrać ani sparsować danych z żadnego podanego URL. Błędy: {bledy}")
+            app_instance.reset_gui_after_delay()
+            return None
+
+        # Tworzenie nazwy pliku
+        nazwa_laczona = "_".join(all_nazwy_bazowe)
+        if len(nazwa_laczona) > 100:
+            nazwa_laczona = f"{all_nazwy_bazowe[0]}_and_{len(all_nazwy_bazowe)-1}_more"
+
+        teraz_format_czasu_csv = datetime.now().strftime("%d%m%y-%H%M%S")
+        nazwa_pliku_csv = os.path.join(sciezka_zapisu_csv, f"{nazwa_laczona}_{teraz_format_czasu_csv}{rozszerzenie}")
+
+        app_instance.update_status("Zapisywanie połączonych danych...", 0.95)
+
+        # Osobny magazyn odcisków dla każdego feeda (tryb delta)
+        magazyny = [MagazynOdciskow('xmlcsv2', urls[i]) for i, _, _ in pobrane_feedy] if tryb_delta else None
+        if zapisz_do_csv_strumieniowo(sciezki_do_zapisu, sorted(list(all_atrybuty)), global_maks_liczba_obrazow, nazwa_pliku_csv, magazyny,
+                                      pomiary, [urls[i] for i, _, _ in pobrane_feedy]):
+            zapisany_plik = nazwa_pliku_csv
+            app_instance.update_status(f"Zakończono. Przetworzono: {sukcesy_przetwarzania}, Błędy: {bledy}", 1)
+        else:
+            app_instance.update_status(f"Błąd zapisu pliku! Przetworzono: {sukcesy_przetwarzania}, Błędy: {bledy}", 1)
+    finally:
+        for _, sciezka_lokalna_xml, _ in pobrane_feedy:
+            usun_plik_tymczasowy(sciezka_lokalna_xml)
+        # Bez pliku wynikowego dziennik i tak powstaje w katalogu zapisu - widać w nim, który feed zawiódł
+        sciezka_dziennika = sciezka_obok(nazwa_pliku_csv or os.path.join(
+            sciezka_zapisu_csv, f"xmlcsv2_{datetime.now().strftime('%d%m%y-%H%M%S')}"))
+        sciezka_dziennika = pomiary.zapisz(sciezka_dziennika, urls=liczba_url, przetworzone=sukcesy_przetwarzania,
+                                           bledy=bledy, plik=zapisany_plik)
+        if sciezka_dziennika:
+            print(f"Dziennik pomiarów: {sciezka_dziennika}")
 
     app_instance.reset_gui_after_delay()
+    return zapisany_plik
 
+def usun_plik_tymczasowy(sciezka):
+    """Usuwa pobrany plik tymczasowy, zgłaszając ewentualny problem na konsoli."""
+    try:
+        os.remove(sciezka)
+    except Exception as e:
+        print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {sciezka}: {e}")
 
-class App(ctk.CTk):
-    def __init__(self):
-        super().__init__()
-
-        self.title("Konwerter XML do CSV")
-        
-        # --- Zmniejszenie rozmiaru okna ---
-        window_width = 600
-        window_height = 550
-        self.minsize(500, 450)
-
-        # --- Centrowanie okna ---
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        center_x = int(screen_width/2 - window_width / 2)
-        center_y = int(screen_height/2 - window_height / 2)
-        self.geometry(f"{window_width}x{window_height}+{center_x}+{center_y}")
-        # ------------------------
-
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(0, weight=1)  
-        self.grid_rowconfigure(1, weight=0)  
-        self.grid_rowconfigure(2, weight=0)  
-        self.grid_rowconfigure(3, weight=0)  
-        self.grid_rowconfigure(4, weight=0)  
-
-        input_frame_urls = ctk.CTkFrame(self)
-        input_frame_urls.grid(row=0, column=0, padx=20, pady=(20,10), sticky="nsew")
-        input_frame_urls.grid_columnconfigure(0, weight=1)
-        input_frame_urls.grid_rowconfigure(1, weight=1) 
-
-        etykieta_url = ctk.CTkLabel(input_frame_urls, text="Wklej URL-e plików XML (każdy w nowej linii):")
-        etykieta_url.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
-        self.pole_url = ctk.CTkTextbox(input_frame_urls, height=150) 
-        self.pole_url.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
-
-        input_frame_path = ctk.CTkFrame(self)
-        input_frame_path.grid(row=1, column=0, padx=20, pady=(5,10), sticky="ew")
-        input_frame_path.grid_columnconfigure(1, weight=1)
-
-        etykieta_sciezki = ctk.CTkLabel(input_frame_path, text="Katalog zapisu pliku CSV:")
-        etykieta_sciezki.grid(row=0, column=0, padx=(10,5), pady=5, sticky="w")
-        
-        self.pole_sciezki_zapisu = ctk.CTkEntry(input_frame_path)
-        self.pole_sciezki_zapisu.grid(row=0, column=1, padx=(0,5), pady=5, sticky="ew")
-        self.pole_sciezki_zapisu.insert(0, DOMYSLNA_SCIEZKA_ZAPISU)
-
-        przycisk_wybierz_sciezke = ctk.CTkButton(input_frame_path, text="Wybierz folder", width=120, command=self.wybierz_katalog_zapisu)
-        przycisk_wybierz_sciezke.grid(row=0, column=2, padx=(0,10), pady=5, sticky="e")
-
-        self.przycisk_przetworz = ctk.CTkButton(self, text="Przetwórz na JEDEN plik CSV", command=self.rozpocznij_przetwarzanie_action, height=40)
-        self.przycisk_przetworz.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
-
-        self.progress_bar = ctk.CTkProgressBar(self, height=10)
-        self.progress_bar.grid(row=3, column=0, padx=20, pady=(0, 5), sticky="ew")
-        self.progress_bar.set(0)
-
-        self.status_label = ctk.CTkLabel(self, text="Gotowy.", text_color="gray")
-        self.status_label.grid(row=4, column=0, padx=20, pady=(0,10), sticky="ew")
-
-    def wybierz_katalog_zapisu(self):
-        """Otwiera okno dialogowe do wyboru katalogu zapisu."""
-        sciezka_katalogu = filedialog.askdirectory(initialdir=self.pole_sciezki_zapisu.get() or DOMYSLNA_SCIEZKA_ZAPISU)
-        if sciezka_katalogu:
-            self.pole_sciezki_zapisu.delete(0, ctk.END)
-            self.pole_sciezki_zapisu.insert(0, sciezka_katalogu)
-
-    def update_status(self, message, progress_value=None):
-        """Aktualizuje etykietę statusu i pasek postępu."""
-        self.status_label.configure(text=message)
-        if progress_value is not None:
-            self.progress_bar.set(progress_value)
-        self.update_idletasks() 
-
-    def reset_gui_after_delay(self, delay_ms=4000):
-        """Resetuje pasek postępu i status po opóźnieniu."""
-        self.after(delay_ms, lambda: self.update_status("Gotowy.", 0))
-        self.przycisk_przetworz.configure(state="normal", text="Przetwórz na JEDEN plik CSV")
-
-    def rozpocznij_przetwarzanie_action(self):
-        """Rozpoczyna proces przetwarzania wielu URL-i na jeden plik."""
-        urls_text = self.pole_url.get("1.0", ctk.END) 
-        urls = [url.strip() for url in urls_text.splitlines() if url.strip()] 
 
-        sciezka_zapisu_csv_gui = self.pole_sciezki_zapisu.get().strip()
-        if not sciezka_zapisu_csv_gui:
-            sciezka_zapisu_csv_gui = DOMYSLNA_SCIEZKA_ZAPISU
-            self.pole_sciezki_zapisu.insert(0, sciezka_zapisu_csv_gui)
+# --- Uruchamianie z wiersza poleceń (cron) ---
 
-        if not urls:
-            messagebox.showerror("Błąd", "Musisz podać co najmniej jeden URL pliku XML.")
-            return
+class StatusWsadowy(StatusKonsoli):
+    """Zastępuje okno (app_instance) w przetworz_wiele_url_jeden_plik przy pracy bez GUI."""
 
-        self.przycisk_przetworz.configure(state="disabled", text="Przetwarzanie...")
-        self.update_idletasks()
-        
-        przetworz_wiele_url_jeden_plik(urls, sciezka_zapisu_csv_gui, self)
+    def update_status(self, message, progress_value=None):
+        self(message)
 
-if __name__ == "__main__":
+    def reset_gui_after_delay(self, delay_ms=4000):
+        pass
+
+    def ustaw_katalog_zapisu(self, sciezka_katalogu):
+        self(f"Zapis do katalogu: {sciezka_katalogu}")
+
+def polecenie_przetworz(args):
+    urls = list(args.url)
+    if args.plik_url:
+        with open(args.plik_url, encoding='utf-8') as plik:
+            urls.extend(plik.read().splitlines())
+    return przetworz_wiele_url_jeden_plik(urls, args.katalog, StatusWsadowy(),
+                                          ROZSZERZENIE_PARQUET if args.parquet else ROZSZERZENIE_CSV,
+                                          args.delta, Pomiary('xmlcsv2', wlaczone=args.pomiary or None))
+
+def zbuduj_parser():
+    parser, polecenia = utworz_parser("Konwerter feedów XML do jednego pliku CSV.")
+    przetworz = polecenia.add_parser('przetworz', help="pobiera feedy i zapisuje je do jednego pliku")
+    przetworz.add_argument('url', nargs='*', help="adresy plików XML")
+    przetworz.add_argument('--plik-url', help="plik tekstowy z adresami (jeden w wierszu)")
+    przetworz.add_argument('--katalog', default=DOMYSLNA_SCIEZKA_ZAPISU, help="katalog zapisu wyniku")
+    przetworz.add_argument('--parquet', action='store_true', help="zapis do Parquet zamiast CSV")
+    przetworz.add_argument('--delta', action='store_true', help="tylko oferty zmienione od poprzedniego uruchomienia")
+    przetworz.add_argument('--pomiary', action='store_true',
+                           help="zapisuje czasy etapów i zużycie pamięci do <wynik>.pomiary.jsonl (jak FEEDY_POMIARY=1)")
+    przetworz.set_defaults(polecenie=polecenie_przetworz)
+    return parser
+
+def uruchom_okno():
+    from xmlcsv2_okno import App
     app = App()
     app.mainloop()
+
+if __name__ == "__main__":
+    sys.exit(uruchom(zbuduj_parser(), uruchom_okno))
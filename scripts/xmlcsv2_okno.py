@@ -0,0 +1,129 @@
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from zapis_tabel import ROZSZERZENIE_CSV, ROZSZERZENIE_PARQUET
+from xmlcsv2 import DOMYSLNA_SCIEZKA_ZAPISU, przetworz_wiele_url_jeden_plik
+
+# Okno konwertera xmlcsv2 - importowane tylko przy uruchomieniu GUI (python xmlcsv2.py bez argumentów)
+
+# Ustawienia CustomTkinter
+ctk.set_appearance_mode("System")
+ctk.set_default_color_theme("blue")
+
+
+class App(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+
+        self.title("Konwerter XML do CSV")
+        
+        # --- Zmniejszenie rozmiaru okna ---
+        window_width = 600
+        window_height = 550
+        self.minsize(500, 450)
+
+        # --- Centrowanie okna ---
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        center_x = int(screen_width/2 - window_width / 2)
+        center_y = int(screen_height/2 - window_height / 2)
+        self.geometry(f"{window_width}x{window_height}+{center_x}+{center_y}")
+        # ------------------------
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)  
+        self.grid_rowconfigure(1, weight=0)  
+        self.grid_rowconfigure(2, weight=0)  
+        self.grid_rowconfigure(3, weight=0)  
+        self.grid_rowconfigure(4, weight=0)  
+
+        input_frame_urls = ctk.CTkFrame(self)
+        input_frame_urls.grid(row=0, column=0, padx=20, pady=(20,10), sticky="nsew")
+        input_frame_urls.grid_columnconfigure(0, weight=1)
+        input_frame_urls.grid_rowconfigure(1, weight=1) 
+
+        etykieta_url = ctk.CTkLabel(input_frame_urls, text="Wklej URL-e plików XML (każdy w nowej linii):")
+        etykieta_url.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
+        self.pole_url = ctk.CTkTextbox(input_frame_urls, height=150) 
+        self.pole_url.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
+
+        input_frame_path = ctk.CTkFrame(self)
+        input_frame_path.grid(row=1, column=0, padx=20, pady=(5,10), sticky="ew")
+        input_frame_path.grid_columnconfigure(1, weight=1)
+
+        etykieta_sciezki = ctk.CTkLabel(input_frame_path, text="Katalog zapisu pliku CSV:")
+        etykieta_sciezki.grid(row=0, column=0, padx=(10,5), pady=5, sticky="w")
+        
+        self.pole_sciezki_zapisu = ctk.CTkEntry(input_frame_path)
+        self.pole_sciezki_zapisu.grid(row=0, column=1, padx=(0,5), pady=5, sticky="ew")
+        self.pole_sciezki_zapisu.insert(0, DOMYSLNA_SCIEZKA_ZAPISU)
+
+        przycisk_wybierz_sciezke = ctk.CTkButton(input_frame_path, text="Wybierz folder", width=120, command=self.wybierz_katalog_zapisu)
+        przycisk_wybierz_sciezke.grid(row=0, column=2, padx=(0,10), pady=5, sticky="e")
+
+        # Parquet: mniejszy plik i szybszy odczyt w csvtoexcel / mapowanie / csv_to_excel_sheets
+        self.zapis_parquet = ctk.BooleanVar(value=False)
+        pole_parquet = ctk.CTkCheckBox(input_frame_path, text="Zapisz jako Parquet zamiast CSV", variable=self.zapis_parquet)
+        pole_parquet.grid(row=1, column=0, columnspan=3, padx=10, pady=(0,5), sticky="w")
+
+        # Delta: tylko oferty dodane/zmienione/usunięte od poprzedniego uruchomienia
+        self.tryb_delta = ctk.BooleanVar(value=False)
+        pole_delta = ctk.CTkCheckBox(input_frame_path, text="Tryb delta (tylko zmienione oferty)", variable=self.tryb_delta)
+        pole_delta.grid(row=2, column=0, columnspan=3, padx=10, pady=(0,5), sticky="w")
+
+        self.przycisk_przetworz = ctk.CTkButton(self, text="Przetwórz na JEDEN plik CSV", command=self.rozpocznij_przetwarzanie_action, height=40)
+        self.przycisk_przetworz.grid(row=2, column=0, padx=20, pady=10, sticky="ew")
+
+        self.progress_bar = ctk.CTkProgressBar(self, height=10)
+        self.progress_bar.grid(row=3, column=0, padx=20, pady=(0, 5), sticky="ew")
+        self.progress_bar.set(0)
+
+        self.status_label = ctk.CTkLabel(self, text="Gotowy.", text_color="gray")
+        self.status_label.grid(row=4, column=0, padx=20, pady=(0,10), sticky="ew")
+
+    def wybierz_katalog_zapisu(self):
+        """Otwiera okno dialogowe do wyboru katalogu zapisu."""
+        sciezka_katalogu = filedialog.askdirectory(initialdir=self.pole_sciezki_zapisu.get() or DOMYSLNA_SCIEZKA_ZAPISU)
+        if sciezka_katalogu:
+            self.ustaw_katalog_zapisu(sciezka_katalogu)
+
+    def ustaw_katalog_zapisu(self, sciezka_katalogu):
+        """Wpisuje katalog zapisu do pola (także gdy przetwarzanie musi zmienić katalog)."""
+        self.pole_sciezki_zapisu.delete(0, ctk.END)
+        self.pole_sciezki_zapisu.insert(0, sciezka_katalogu)
+
+    def update_status(self, message, progress_value=None):
+        """Aktualizuje etykietę statusu i pasek postępu."""
+        self.status_label.configure(text=message)
+        if progress_value is not None:
+            self.progress_bar.set(progress_value)
+        self.update_idletasks() 
+
+    def reset_gui_after_delay(self, delay_ms=4000):
+        """Resetuje pasek postępu i status po opóźnieniu."""
+        self.after(delay_ms, lambda: self.update_status("Gotowy.", 0))
+        self.przycisk_przetworz.configure(state="normal", text="Przetwórz na JEDEN plik CSV")
+
+    def rozpocznij_przetwarzanie_action(self):
+        """Rozpoczyna proces przetwarzania wielu URL-i na jeden plik."""
+        urls_text = self.pole_url.get("1.0", ctk.END) 
+        urls = [url.strip() for url in urls_text.splitlines() if url.strip()] 
+
+        sciezka_zapisu_csv_gui = self.pole_sciezki_zapisu.get().strip()
+        if not sciezka_zapisu_csv_gui:
+            sciezka_zapisu_csv_gui = DOMYSLNA_SCIEZKA_ZAPISU
+            self.pole_sciezki_zapisu.insert(0, sciezka_zapisu_csv_gui)
+
+        if not urls:
+            messagebox.showerror("Błąd", "Musisz podać co najmniej jeden URL pliku XML.")
+            return
+
+        self.przycisk_przetworz.configure(state="disabled", text="Przetwarzanie...")
+        self.update_idletasks()
+        
+        przetworz_wiele_url_jeden_plik(urls, sciezka_zapisu_csv_gui, self,
+                                       ROZSZERZENIE_PARQUET if self.zapis_parquet.get() else ROZSZERZENIE_CSV,
+                                       self.tryb_delta.get())
+
+if __name__ == "__main__":
+    app = App()
+    app.mainloop()
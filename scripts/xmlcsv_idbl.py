@@ -1,13 +1,13 @@
 import xml.etree.ElementTree as ET
 import csv
 import os
-import urllib.request
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from datetime import datetime
-from urllib.parse import urlparse
 import tempfile
 import time
+from pobieranie_feedow import pobierz_wiele, nazwa_pliku_z_url, opis_postepu
+from parser_ofert import iteruj_oferty, zbuduj_projekcje
 
 # Ustawienia CustomTkinter
 ctk.set_appearance_mode("System")
@@ -17,51 +17,15 @@ ctk.set_default_color_theme("blue")
 DOMYSLNA_SCIEZKA_ZAPISU = "C:/Users/Dell/Downloads"
 # ----------------------------------------------------
 
-def clean_text(text):
-    """Zastępuje znaki nowej linii i inne białe znaki pojedynczą spacją."""
-    if not text:
-        return ""
-    return " ".join(text.split())
-
-def pobierz_xml(url, sciezka_docelowa):
-    """Pobiera plik XML z podanego URL."""
-    try:
-        opener = urllib.request.build_opener()
-        opener.addheaders = [('User-agent', 'Mozilla/5.0')]
-        urllib.request.install_opener(opener)
-        urllib.request.urlretrieve(url, sciezka_docelowa)
-        return True
-    except Exception as e:
-        messagebox.showerror(f"Błąd pobierania ({url})", f"Wystąpił błąd: {e}")
-        return False
+POLA_CSV = ['id', 'id_bl', 'war']
+# 'war' pozostaje pustą kolumną do uzupełnienia
+PROJEKCJA_CSV = zbuduj_projekcje(POLA_CSV, {'war': lambda oferta: ""})
 
 def parsuj_xml(sciezka_pliku):
     """Parsuje plik XML i ekstrahuje 'id', 'id_bl' oraz dodaje pustą kolumnę 'war'."""
     try:
-        drzewo = ET.parse(sciezka_pliku)
-        root = drzewo.getroot()
-        dane = []
-
-        for element in root.findall("o"):
-            id_val = element.get("id")
-            id_bl_val = ""  # Domyślnie puste
-
-            # Szukanie atrybutu o nazwie 'id_bl' w tagu <attrs>
-            atrybuty_elem = element.find("attrs")
-            if atrybuty_elem is not None:
-                for atrybut in atrybuty_elem.findall("a"):
-                    if atrybut.get("name") == "id_bl":
-                        id_bl_val = clean_text(atrybut.text) if atrybut.text else ""
-                        break
-
-            wiersz = {
-                "id": id_val,
-                "id_bl": id_bl_val,
-                "war": ""
-            }
-            dane.append(wiersz)
-            
-        return dane
+        # Z <attrs> potrzebny jest tylko 'id_bl' (przy powtórzeniach pierwszy); obrazy są pomijane
+        return [PROJEKCJA_CSV(oferta) for oferta in iteruj_oferty(sciezka_pliku, {'id_bl'}, obrazy=False, pierwszy_atrybut=True)]
     except FileNotFoundError:
         messagebox.showerror("Błąd pliku", f"Nie znaleziono pliku: {sciezka_pliku}")
         return []
@@ -74,12 +38,10 @@ def parsuj_xml(sciezka_pliku):
 
 def zapisz_do_csv(dane, sciezka_pliku):
     """Zapisuje dane do pliku CSV z określonymi kolumnami: id, id_bl, war."""
-    pola = ['id', 'id_bl', 'war']
-
     try:
         with open(sciezka_pliku, 'w', encoding='utf-8-sig', newline='') as plik_csv:
-            writer = csv.DictWriter(plik_csv, fieldnames=pola, delimiter=';', extrasaction='ignore')
-            writer.writeheader()
+            writer = csv.writer(plik_csv, delimiter=';')
+            writer.writerow(POLA_CSV)
             writer.writerows(dane)
         messagebox.showinfo("Sukces", f"Wszystkie dane zostały pomyślnie zapisane do:\n{os.path.abspath(sciezka_pliku)}")
         return True
@@ -89,9 +51,9 @@ def zapisz_do_csv(dane, sciezka_pliku):
 
 def przetworz_wiele_url_jeden_plik(urls, sciezka_zapisu_csv, app_instance):
     """Przetwarza wiele URL-i i zapisuje do jednego pliku CSV."""
-    all_dane = []
-    all_nazwy_bazowe = []
+    dane_wg_url = {}
     katalog_tymczasowy = tempfile.gettempdir()
+    urls = [url.strip() for url in urls if url.strip()]
     liczba_url = len(urls)
     sukcesy_przetwarzania = 0
     bledy = 0
@@ -108,35 +70,43 @@ def przetworz_wiele_url_jeden_plik(urls, sciezka_zapisu_csv, app_instance):
             app_instance.pole_sciezki_zapisu.delete(0, ctk.END)
             app_instance.pole_sciezki_zapisu.insert(0, sciezka_zapisu_csv)
 
-    for i, url in enumerate(urls):
-        url = url.strip()
-        if not url: continue
-
-        postep = (i + 1) / liczba_url
-        nazwa_pliku_url = os.path.basename(urlparse(url).path) or f"feed_{i+1}.xml"
-        app_instance.update_status(f"Przetwarzanie {i+1}/{liczba_url}: {nazwa_pliku_url}...", postep)
+    def pokaz_postep_pobierania(pobrane_bajty, ukonczone, wszystkie):
+        app_instance.update_status(opis_postepu(pobrane_bajty, ukonczone, wszystkie), ukonczone / wszystkie)
 
+    # Pobieranie odbywa się równolegle; każdy feed jest parsowany zaraz po pobraniu
+    for ukonczone, (i, url, sciezka_lokalna_xml, blad) in enumerate(
+            pobierz_wiele(urls, katalog_tymczasowy, pokaz_postep_pobierania), start=1):
+        postep = ukonczone / liczba_url
+        nazwa_pliku_url = nazwa_pliku_z_url(url, i + 1)
         nazwa_bazowa_xml = os.path.splitext(nazwa_pliku_url)[0]
-        teraz_timestamp_temp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        sciezka_lokalna_xml = os.path.join(katalog_tymczasowy, f"temp_{nazwa_bazowa_xml}_{teraz_timestamp_temp}.xml")
-
-        if pobierz_xml(url, sciezka_lokalna_xml):
-            dane = parsuj_xml(sciezka_lokalna_xml)
-            if dane:
-                all_dane.extend(dane)
-                all_nazwy_bazowe.append(nazwa_bazowa_xml)
-                sukcesy_przetwarzania += 1
-            else:
-                bledy += 1
-                app_instance.update_status(f"Błąd parsowania lub brak danych w {nazwa_pliku_url}. Pomijanie.", postep)
-                time.sleep(0.5)
-            
-            try: os.remove(sciezka_lokalna_xml)
-            except Exception as e: print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {sciezka_lokalna_xml}: {e}")
-        else:
+
+        if blad is not None:
+            messagebox.showerror(f"Błąd pobierania ({url})", f"Wystąpił błąd: {blad}")
             bledy += 1
             app_instance.update_status(f"Błąd pobierania {nazwa_pliku_url}. Pomijanie.", postep)
             time.sleep(0.5)
+            continue
+
+        app_instance.update_status(f"Przetwarzanie {ukonczone}/{liczba_url}: {nazwa_pliku_url}...", postep)
+        dane = parsuj_xml(sciezka_lokalna_xml)
+        if dane:
+            dane_wg_url[i] = (nazwa_bazowa_xml, dane)
+            sukcesy_przetwarzania += 1
+        else:
+            bledy += 1
+            app_instance.update_status(f"Błąd parsowania lub brak danych w {nazwa_pliku_url}. Pomijanie.", postep)
+            time.sleep(0.5)
+
+        try: os.remove(sciezka_lokalna_xml)
+        except Exception as e: print(f"Ostrzeżenie: Nie udało się usunąć pliku tymczasowego {sciezka_lokalna_xml}: {e}")
+
+    # Łączenie w kolejności podanych nazw, niezależnie od kolejności ukończenia pobrań
+    all_dane = []
+    all_nazwy_bazowe = []
+    for i in sorted(dane_wg_url):
+        nazwa_bazowa_xml, dane = dane_wg_url[i]
+        all_dane.extend(dane)
+        all_nazwy_bazowe.append(nazwa_bazowa_xml)
 
     if not all_dane:
         app_instance.update_status("Nie udało się przetworzyć żadnych danych.", 0)
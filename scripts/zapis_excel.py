@@ -0,0 +1,89 @@
+import openpyxl
+
+try:
+    import xlsxwriter
+except ImportError:
+    # xlsxwriter jest opcjonalny, potrzebny tylko w trybie stałej pamięci (stala_pamiec=True)
+    xlsxwriter = None
+
+# Wspólny zapis wyników do Excela (cdon_for_dawid, tłumaczenia v2, poprawa_znak): wiersze są
+# dopisywane jeden po drugim do skoroszytu openpyxl w trybie write-only, który od razu zrzuca
+# je do pliku tymczasowego zamiast trzymać obiekty komórek w pamięci do chwili zapisu.
+# Opcjonalnie (stala_pamiec=True i zainstalowany xlsxwriter) zapis idzie przez xlsxwriter
+# w trybie constant_memory - szybszy przy bardzo dużych eksportach.
+
+
+class ZapisExcel:
+    """
+    Zapis wierszy (krotek/list) do pliku xlsx; interfejs jak ZapisCsv z zapis_tabel.
+    Arkusz tytul_arkusza (z nagłówkiem pola, jeśli podano) jest tworzony od razu, kolejne
+    można dodać metodą nowy_arkusz. Plik powstaje dopiero w close() - przy wyjątku
+    w bloku with wynik nie jest zapisywany.
+    """
+
+    def __init__(self, sciezka_pliku, pola=None, tytul_arkusza=None, stala_pamiec=False):
+        self.sciezka_pliku = sciezka_pliku
+        self._xlsxwriter = stala_pamiec and xlsxwriter is not None
+        self._arkusz = None
+        if self._xlsxwriter:
+            # Linki i daty zapisujemy tak jak openpyxl: tekst bez hiperłącza, data ze sformatowaniem
+            self._skoroszyt = xlsxwriter.Workbook(sciezka_pliku, {
+                'constant_memory': True,
+                'strings_to_urls': False,
+                'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            })
+        else:
+            self._skoroszyt = openpyxl.Workbook(write_only=True)
+        if tytul_arkusza is not None or pola is not None:
+            self.nowy_arkusz(tytul_arkusza, pola)
+
+    def nowy_arkusz(self, tytul=None, pola=None):
+        """Zaczyna kolejny arkusz; dalsze wiersze trafiają do niego."""
+        if self._xlsxwriter:
+            self._arkusz = self._skoroszyt.add_worksheet(tytul)
+            self._wiersz_arkusza = 0
+        else:
+            self._arkusz = self._skoroszyt.create_sheet(title=tytul)
+        if pola is not None:
+            self.writerow(pola)
+
+    def writerow(self, wiersz):
+        if self._arkusz is None:
+            self.nowy_arkusz()
+        if self._xlsxwriter:
+            self._arkusz.write_row(self._wiersz_arkusza, 0, wiersz)
+            self._wiersz_arkusza += 1
+        else:
+            self._arkusz.append(wiersz)
+
+    def writerows(self, wiersze):
+        for wiersz in wiersze:
+            self.writerow(wiersz)
+
+    def close(self):
+        """Zapisuje plik na dysk."""
+        if self._arkusz is None:
+            # Skoroszyt musi mieć co najmniej jeden arkusz
+            self.nowy_arkusz()
+        if self._xlsxwriter:
+            self._skoroszyt.close()
+        else:
+            self._skoroszyt.save(self.sciezka_pliku)
+            self._skoroszyt.close()
+
+    def porzuc(self):
+        """Kończy zapis bez tworzenia pliku (np. po błędzie w trakcie eksportu)."""
+        if not self._xlsxwriter:
+            # Domyka strumienie arkuszy; ich pliki tymczasowe openpyxl usuwa przy wyjściu z programu
+            for arkusz in self._skoroszyt.worksheets:
+                if not arkusz.closed:
+                    arkusz.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, typ_wyjatku, *exc):
+        if typ_wyjatku is None:
+            self.close()
+        else:
+            self.porzuc()
@@ -0,0 +1,147 @@
+import csv
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow jest opcjonalny, potrzebny tylko do zapisu/odczytu Parquet
+    pa = None
+    pq = None
+
+# Wspólny zapis tabel dla konwerterów feedów (xmlcsv2, xmlcsv3, aps) i odczyt dla konwerterów
+# do Excela (csvtoexcel, csv_to_excel_sheets, mapowanie). Format wynika z rozszerzenia pliku:
+# .csv - tekst z separatorem, .parquet - kolumnowy Parquet z kompresją zstd.
+
+ROZSZERZENIE_CSV = '.csv'
+ROZSZERZENIE_PARQUET = '.parquet'
+ROZSZERZENIA_KOLUMNOWE = ('.parquet', '.feather', '.arrow')
+ROZMIAR_PARTII = 50000  # liczba wierszy w jednej grupie wierszy Parquet
+
+
+def czy_plik_kolumnowy(sciezka_pliku):
+    """Czy plik ma rozszerzenie formatu kolumnowego (Parquet/Arrow)."""
+    return os.path.splitext(sciezka_pliku)[1].lower() in ROZSZERZENIA_KOLUMNOWE
+
+
+def _unikalne_nazwy(pola):
+    """Nadaje powtórzonym kolumnom przyrostki .1, .2 - tak jak pandas przy odczycie CSV."""
+    wynik = []
+    uzyte = set()
+    for pole in pola:
+        nazwa = pole
+        numer = 1
+        while nazwa in uzyte:
+            nazwa = f"{pole}.{numer}"
+            numer += 1
+        uzyte.add(nazwa)
+        wynik.append(nazwa)
+    return wynik
+
+
+class ZapisCsv:
+    """Zapis wierszy (krotek) do CSV z nagłówkiem; interfejs jak csv.writer."""
+
+    def __init__(self, sciezka_pliku, pola, separator):
+        self._plik = open(sciezka_pliku, 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.writer(self._plik, delimiter=separator)
+        self._writer.writerow(pola)
+
+    def writerow(self, wiersz):
+        self._writer.writerow(wiersz)
+
+    def writerows(self, wiersze):
+        self._writer.writerows(wiersze)
+
+    def close(self):
+        self._plik.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ZapisParquet:
+    """
+    Zapis wierszy (krotek) do pliku Parquet partiami, więc nadaje się też do zapisu strumieniowego.
+    Kolumny z kolumny_slownikowe są kodowane słownikowo (powtarzalne wartości, np. kategorie i atrybuty).
+    """
+
+    def __init__(self, sciezka_pliku, pola, kolumny_slownikowe=()):
+        if pq is None:
+            raise ImportError("Zapis Parquet wymaga pakietu pyarrow (pip install pyarrow).")
+        self._nazwy = _unikalne_nazwy(pola)
+        slownikowe = set(kolumny_slownikowe)
+        self._schemat = pa.schema([(nazwa, pa.string()) for nazwa in self._nazwy])
+        self._pisarz = pq.ParquetWriter(
+            sciezka_pliku, self._schemat, compression='zstd',
+            use_dictionary=[nazwa for nazwa, pole in zip(self._nazwy, pola) if pole in slownikowe])
+        self._bufor = []
+
+    def writerow(self, wiersz):
+        self._bufor.append(wiersz)
+        if len(self._bufor) >= ROZMIAR_PARTII:
+            self._zrzuc()
+
+    def writerows(self, wiersze):
+        for wiersz in wiersze:
+            self.writerow(wiersz)
+
+    def _zrzuc(self):
+        if not self._bufor:
+            return
+        # Puste teksty zapisujemy jako brak wartości - tak samo pandas czyta puste pola CSV
+        kolumny = [[wartosc if wartosc != "" else None for wartosc in kolumna] for kolumna in zip(*self._bufor)]
+        tabela = pa.Table.from_arrays([pa.array(kolumna, type=pa.string()) for kolumna in kolumny], schema=self._schemat)
+        self._pisarz.write_table(tabela)
+        self._bufor = []
+
+    def close(self):
+        self._zrzuc()
+        self._pisarz.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def otworz_zapis_tabeli(sciezka_pliku, pola, separator='|', kolumny_slownikowe=()):
+    """Zwraca obiekt zapisu (writerow/writerows, menedżer kontekstu) zależnie od rozszerzenia pliku."""
+    if os.path.splitext(sciezka_pliku)[1].lower() == ROZSZERZENIE_PARQUET:
+        return ZapisParquet(sciezka_pliku, pola, kolumny_slownikowe)
+    return ZapisCsv(sciezka_pliku, pola, separator)
+
+
+def wczytaj_tabele(sciezka_pliku, separator, ma_naglowki=True, kolumny=None):
+    """
+    Wczytuje tabelę do DataFrame. Pliki Parquet/Arrow są czytane bez parsowania tekstu
+    (opcjonalnie tylko wybrane kolumny); pozostałe pliki są czytane jako CSV.
+    """
+    import pandas as pd
+
+    if not czy_plik_kolumnowy(sciezka_pliku):
+        return pd.read_csv(sciezka_pliku, sep=separator, header=0 if ma_naglowki else None, encoding='utf-8',
+                           on_bad_lines='skip', usecols=None if kolumny is None else lambda k: k in kolumny)
+
+    if sciezka_pliku.lower().endswith(ROZSZERZENIE_PARQUET):
+        if kolumny is not None and pq is not None:
+            # Czytamy tylko kolumny, które istnieją w pliku (brakującą obsługuje wywołujący)
+            dostepne = set(pq.read_schema(sciezka_pliku).names)
+            kolumny = [k for k in kolumny if k in dostepne]
+        df = pd.read_parquet(sciezka_pliku, columns=kolumny)
+    else:
+        df = pd.read_feather(sciezka_pliku, columns=kolumny)
+
+    # Kolumny liczbowe są zapisane jako tekst (tak jak w feedzie); zamieniamy je na liczby
+    # tam, gdzie pandas zrobiłby to przy odczycie CSV, aby wynik w Excelu był taki sam
+    for kolumna in df.columns:
+        if pd.api.types.is_string_dtype(df[kolumna]):
+            try:
+                df[kolumna] = pd.to_numeric(df[kolumna])
+            except (ValueError, TypeError):
+                pass
+    return df